@@ -19,8 +19,11 @@ from dwave_networkx.algorithms.cover import *
 from dwave_networkx.algorithms.matching import *
 from dwave_networkx.algorithms.social import *
 from dwave_networkx.algorithms.elimination_ordering import *
+from dwave_networkx.algorithms.tree_decomposition import *
+from dwave_networkx.algorithms.variable_elimination import *
 from dwave_networkx.algorithms.coloring import *
 from dwave_networkx.algorithms.max_cut import *
 from dwave_networkx.algorithms.markov import *
 from dwave_networkx.algorithms.tsp import *
 from dwave_networkx.algorithms.partition import *
+from dwave_networkx.algorithms.distance import *
@@ -13,9 +13,12 @@
 #    limitations under the License.
 
 import math
-import itertools
+import operator
+from collections.abc import Sequence
 
+import dimod
 import networkx as nx
+import numpy as np
 
 from dwave_networkx.utils import binary_quadratic_model_sampler
 
@@ -23,8 +26,10 @@ __all__ = ["is_vertex_coloring",
            "is_cycle",
            "min_vertex_color",
            "min_vertex_coloring",  # alias for min_vertex_color
+           "min_vertex_color_bqm",
            "min_vertex_color_qubo",
            "vertex_color",
+           "vertex_color_bqm",
            "vertex_color_qubo",
            ]
 
@@ -62,24 +67,117 @@ def vertex_color_qubo(G, colors):
     """
     _, colors = colors
 
-    Q = {}
+    bqm, labels = vertex_color_bqm(G, colors)
+    Q, __ = bqm.relabel_variables(dict(enumerate(labels)), inplace=False).to_qubo()
+    return Q
 
-    # enforce that each variable in G has at most one color
-    for v in G.nodes:
-        # 1 in k constraint
-        for c in colors:
-            Q[(v, c), (v, c)] = -1
 
-        for c0, c1 in itertools.combinations(colors, 2):
-            Q[(v, c0), (v, c1)] = 2
+@nx.utils.decorators.nodes_or_number(1)
+def vertex_color_bqm(G, colors):
+    """Return a binary quadratic model with ground states corresponding to a
+    vertex coloring.
 
-    # enforce that adjacent nodes do not have the same color
-    for u, v in G.edges:
-        # NAND constraint
-        for c in colors:
-            Q[(u, c), (v, c)] = 1
+    The BQM has the same energies as the QUBO of :func:`.vertex_color_qubo`,
+    but is built from arrays of the biases of all of the nodes and edges at
+    once, which is much faster for large graphs. Its variables are integer
+    indices, the label `(v, c)` of each of them being computed on access.
 
-    return Q
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph on which to find a minimum vertex coloring.
+
+    colors : int/sequence
+        The colors. If an int, the colors are labelled `[0, n)`. The number of
+        colors must be greater or equal to the chromatic number of the graph.
+
+    Returns
+    -------
+    bqm : :class:`dimod.BinaryQuadraticModel`
+        The BQM with ground states corresponding to valid colorings of the
+        graph. The variables are labelled `0` to `|V|*|C| - 1`.
+
+    labels : sequence
+        The label `(v, c)` of each variable of `bqm`, where `v` is a node in
+        `G` and `c` is a color. In the ground state of the BQM, variable `i`
+        has value 1 if `labels[i][0]` should be colored `labels[i][1]`.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> bqm, labels = dnx.vertex_color_bqm(G, 3)
+    >>> len(bqm), len(bqm.quadratic)
+    (12, 24)
+    >>> labels[5]
+    (1, 2)
+
+    """
+    _, colors = colors
+
+    nodes = list(G)
+    linear, quadratic = _vertex_color_vectors(G, nodes, len(colors))
+    bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(linear, quadratic, 0.0, dimod.BINARY)
+    return bqm, _VertexColorLabels(nodes, colors)
+
+
+class _VertexColorLabels(Sequence):
+    # The labels (v, c) of the variables of the vertex coloring BQMs, variable
+    # i being node nodes[i // k] colored colors[i % k], computed on access
+    # rather than stored.
+    def __init__(self, nodes, colors):
+        self._nodes = nodes
+        self._colors = list(colors)
+
+    def __len__(self):
+        return len(self._nodes)*len(self._colors)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = operator.index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("index out of range")
+        v, c = divmod(i, len(self._colors))
+        return self._nodes[v], self._colors[c]
+
+    def __repr__(self):
+        return "<{} of {} nodes and {} colors>".format(
+            type(self).__name__, len(self._nodes), len(self._colors))
+
+
+def _vertex_color_vectors(G, nodes, k):
+    # the linear biases and (irow, icol, qdata) quadratic biases of the
+    # vertex coloring QUBO with k colors, where each pair of variables
+    # appears once
+    index = {v: i for i, v in enumerate(nodes)}
+
+    # node v colored c is the index index[v]*k + c of the arrays
+    blocks = np.arange(len(nodes))[:, None]*k
+
+    # enforce that each variable in G has at most one color: 1 in k constraint
+    linear = np.full(len(nodes)*k, -1.0)
+    first, second = np.triu_indices(k, 1)
+    one_i = (blocks + first).ravel()
+    one_j = (blocks + second).ravel()
+
+    # enforce that adjacent nodes do not have the same color: NAND constraint
+    edges = np.array([(index[u], index[v]) for u, v in G.edges],
+                     dtype=np.intp).reshape(-1, 2)
+    loops = edges[:, 0] == edges[:, 1]
+    # a self-loop sets the linear bias of its node, and repeated edges set
+    # the same bias, as they would in the QUBO
+    linear.reshape(len(nodes), k)[edges[loops, 0]] = 1
+    u, v = np.unique(edges[~loops], axis=0).T
+    nand_i = (u[:, None]*k + np.arange(k)).ravel()
+    nand_j = (v[:, None]*k + np.arange(k)).ravel()
+
+    irow = np.concatenate((one_i, nand_i))
+    icol = np.concatenate((one_j, nand_j))
+    qdata = np.concatenate((np.full(len(one_i), 2.0), np.ones(len(nand_i))))
+
+    return linear, (irow, icol, qdata)
 
 
 @binary_quadratic_model_sampler(2)
@@ -128,12 +226,12 @@ def vertex_color(G, colors, sampler=None, **sampler_args):
     sample.
 
     """
-    Q = vertex_color_qubo(G, colors)
+    bqm, labels = vertex_color_bqm(G, colors)
 
     # get the lowest energy sample
-    sample = sampler.sample_qubo(Q, **sampler_args).first.sample
+    sample = sampler.sample(bqm, **sampler_args).first.sample
 
-    return {v: c for (v, c), val in sample.items() if val}
+    return dict(labels[i] for i, val in sample.items() if val)
 
 
 def _chromatic_number_upper_bound(G):
@@ -224,6 +322,52 @@ def min_vertex_color_qubo(G, chromatic_lb=None, chromatic_ub=None):
 
     """
 
+    bqm, labels = min_vertex_color_bqm(G, chromatic_lb=chromatic_lb, chromatic_ub=chromatic_ub)
+    Q, __ = bqm.relabel_variables(dict(enumerate(labels)), inplace=False).to_qubo()
+    return Q
+
+
+def min_vertex_color_bqm(G, chromatic_lb=None, chromatic_ub=None):
+    """Return a binary quadratic model with ground states corresponding to a
+    minimum vertex coloring.
+
+    The BQM has the same energies as the QUBO of
+    :func:`.min_vertex_color_qubo`, but is built from arrays of the biases
+    of all of the nodes and edges at once, which is much faster for large
+    graphs. Its variables are integer indices, the label `(v, c)` of each of
+    them being computed on access.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph on which to find a minimum vertex coloring.
+
+    chromatic_lb : int, optional
+         A lower bound on the chromatic number. If one is not provided, a
+         bound is calulcated.
+
+    chromatic_ub : int, optional
+        An upper bound on the chromatic number. If one is not provided, a bound
+        is calculated.
+
+    Returns
+    -------
+    bqm : :class:`dimod.BinaryQuadraticModel`
+        The BQM with ground states corresponding to minimum colorings of the
+        graph. The variables are labelled `0` to `|V|*|C| - 1`.
+
+    labels : sequence
+        The label `(v, c)` of each variable of `bqm`, where `v` is a node in
+        `G` and `c` is a color, see :func:`.vertex_color_bqm`.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(5)
+    >>> bqm, labels = dnx.min_vertex_color_bqm(G)
+    >>> len(bqm), labels[-1]
+    (15, (4, 2))
+
+    """
     chi_ub = _chromatic_number_upper_bound(G)
     chromatic_ub = chi_ub if chromatic_ub is None else min(chi_ub, chromatic_ub)
 
@@ -236,7 +380,9 @@ def min_vertex_color_qubo(G, chromatic_lb=None, chromatic_ub=None):
 
     # our base QUBO is one with as many colors as we might need, so we use the
     # upper bound
-    Q = vertex_color_qubo(G, int(chromatic_ub))
+    chromatic_ub = int(chromatic_ub)
+    nodes = list(G)
+    linear, quadratic = _vertex_color_vectors(G, nodes, chromatic_ub)
 
     if chromatic_lb != chromatic_ub:
         # we want to penalize the colors that we aren't sure that we need
@@ -246,13 +392,12 @@ def min_vertex_color_qubo(G, chromatic_lb=None, chromatic_ub=None):
         num_penalized = chromatic_ub - chromatic_lb
 
         # we want evenly spaced penalties in (0, 1) without the endpoints
-        weights = [p / (num_penalized + 1) for p in range(1, num_penalized + 1)]
+        weights = np.arange(1, num_penalized + 1) / (num_penalized + 1)
 
-        for p, c in zip(weights, range(chromatic_lb, chromatic_ub)):
-            for v in G:
-                Q[(v, c), (v, c)] += p
+        linear.reshape(len(nodes), chromatic_ub)[:, chromatic_lb:] += weights
 
-    return Q
+    bqm = dimod.BinaryQuadraticModel.from_numpy_vectors(linear, quadratic, 0.0, dimod.BINARY)
+    return bqm, _VertexColorLabels(nodes, range(chromatic_ub))
 
 
 @binary_quadratic_model_sampler(1)
@@ -308,13 +453,13 @@ def min_vertex_color(G, sampler=None, chromatic_lb=None, chromatic_ub=None,
 
     """
 
-    Q = min_vertex_color_qubo(G, chromatic_lb=chromatic_lb,
-                              chromatic_ub=chromatic_ub)
+    bqm, labels = min_vertex_color_bqm(G, chromatic_lb=chromatic_lb,
+                                       chromatic_ub=chromatic_ub)
 
     # get the lowest energy sample
-    sample = sampler.sample_qubo(Q, **sampler_args).first.sample
+    sample = sampler.sample(bqm, **sampler_args).first.sample
 
-    return {v: c for (v, c), val in sample.items() if val}
+    return dict(labels[i] for i, val in sample.items() if val)
 
 
 # legacy name, alias
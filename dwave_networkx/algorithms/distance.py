@@ -0,0 +1,233 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import numpy as np
+
+__all__ = ['distance_matrix']
+
+
+def distance_matrix(G, sources=None, nodelist=None, batch_size=1024):
+    """Computes hop distances from a set of source nodes to every node of G.
+
+    For graphs constructed by :func:`.chimera_graph` with full yield, the
+    distances are computed in closed form from the Chimera coordinates of
+    the nodes.  Otherwise, a breadth-first search is run simultaneously from
+    a batch of sources over a compressed sparse row (CSR) representation of
+    the adjacency of G.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph on which to compute distances.  The paths of a directed
+        graph follow the direction of its edges.
+    sources : iterable (optional, default None)
+        The source nodes.  If None, all nodes of G (in the order of
+        ``nodelist``) are used, which computes all-pairs distances.
+    nodelist : list (optional, default None)
+        The order of the columns of the returned array.  If None, the order
+        is given by ``G.nodes()``.
+    batch_size : int (optional, default 1024)
+        The number of sources searched simultaneously, rounded to a multiple
+        of 64.  Memory use grows linearly in ``batch_size``.
+
+    Returns
+    -------
+    distances : numpy.ndarray
+        An array of shape ``(len(sources), len(nodelist))`` where entry
+        ``[i, j]`` is the number of edges in a shortest path from
+        ``sources[i]`` to ``nodelist[j]``, or -1 if no such path exists.
+
+    Examples
+    --------
+    >>> G = dnx.chimera_graph(2, 2, 4)
+    >>> D = dnx.distance_matrix(G, sources=[0])
+    >>> int(D[0, 31])
+    4
+
+    """
+    if nodelist is None:
+        nodelist = list(G)
+    else:
+        nodelist = list(nodelist)
+    if sources is None:
+        sources = nodelist
+    else:
+        sources = list(sources)
+
+    if _is_perfect_chimera(G):
+        return _chimera_distance_matrix(G, sources, nodelist)
+
+    index = {v: i for i, v in enumerate(nodelist)}
+    if len(index) != len(G) or any(v not in G for v in index):
+        raise ValueError("nodelist must contain each node of G exactly once")
+    try:
+        source_index = np.fromiter((index[v] for v in sources), dtype=np.int64, count=len(sources))
+    except KeyError as err:
+        raise ValueError("source {!r} is not in G".format(err.args[0])) from None
+
+    indptr, indices = _csr_adjacency(G, nodelist, index)
+    return _bfs_distances(indptr, indices, source_index, batch_size)
+
+
+def _csr_adjacency(G, nodelist, index):
+    """Returns the adjacency of G as CSR arrays ``indptr, indices`` where
+    the neighbors of ``nodelist[i]`` are ``indices[indptr[i]:indptr[i+1]]``.
+    A node is reached from its neighbors, so for directed graphs these are
+    its predecessors.  Self-loops are dropped.
+    """
+    adj = G.pred if G.is_directed() else G.adj
+    degree = np.fromiter((len(adj[v]) - (v in adj[v]) for v in nodelist),
+                         dtype=np.int64, count=len(nodelist))
+    indptr = np.zeros(len(nodelist) + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+    indices = np.fromiter((index[u] for v in nodelist for u in adj[v] if u != v),
+                          dtype=np.int64, count=indptr[-1])
+    return indptr, indices
+
+
+def _bfs_distances(indptr, indices, sources, batch_size):
+    """Multi-source breadth-first search over a CSR adjacency.
+
+    The sources of a batch are assigned one bit each, so that the frontiers
+    of the whole batch are held in an array of shape (num_nodes, words) of
+    64-bit integers.  Each level of the search is a single gather over
+    ``indices`` followed by a segmented bitwise-or over ``indptr``.  The
+    distances are accumulated in a bit-sliced counter, which is incremented
+    for the unvisited (node, source) pairs at every level, and are only
+    unpacked once the batch is exhausted.
+    """
+    num_nodes = len(indptr) - 1
+    distances = np.full((len(sources), num_nodes), -1, dtype=np.int32)
+
+    # reduceat requires strictly increasing offsets, so isolated nodes
+    # (which are never reached anyway) are skipped in the reduction
+    nonempty = indptr[:-1] < indptr[1:]
+    starts = indptr[:-1][nonempty]
+
+    batch_size = max(64, 64*(batch_size // 64))
+    for b0 in range(0, len(sources), batch_size):
+        batch = sources[b0:b0 + batch_size]
+        lanes = np.arange(len(batch))
+
+        frontier = np.zeros((num_nodes, -(-len(batch) // 64)), dtype=np.uint64)
+        np.bitwise_or.at(frontier, (batch, lanes // 64),
+                         np.left_shift(np.uint64(1), (lanes % 64).astype(np.uint64)))
+        visited = frontier.copy()
+
+        planes = []  # planes[p] holds bit p of the distance counters
+        while len(starts) and frontier.any():
+            carry = ~visited
+            for p, plane in enumerate(planes):
+                planes[p] = plane ^ carry
+                carry &= plane
+            if carry.any():
+                planes.append(carry)
+
+            reached = np.zeros_like(frontier)
+            reached[nonempty] = np.bitwise_or.reduceat(frontier[indices], starts, axis=0)
+            reached &= ~visited
+            visited |= reached
+            frontier = reached
+
+        dist = np.zeros((num_nodes, 64*frontier.shape[1]), dtype=np.int32)
+        for p, plane in enumerate(planes):
+            dist += _unpack_lanes(plane).astype(np.int32) << p
+        dist[~_unpack_lanes(visited)] = -1
+        distances[b0:b0 + len(batch)] = dist[:, :len(batch)].T
+
+    return distances
+
+
+def _unpack_lanes(words):
+    """Unpacks an array of shape (N, W) of 64-bit words into a boolean array
+    of shape (N, 64*W), where lane ``b`` is bit ``b % 64`` of word ``b // 64``.
+    """
+    return np.unpackbits(words.astype('<u8').view(np.uint8), axis=1,
+                         bitorder='little').astype(bool)
+
+
+def _is_perfect_chimera(G):
+    """Determines whether G is a full-yield graph built by chimera_graph."""
+    if G.graph.get('family') != 'chimera' or G.graph.get('boundary_condition') is not None:
+        return False
+    if G.graph.get('labels') not in ('int', 'coordinate'):
+        return False
+    if G.is_multigraph() or G.is_directed():
+        return False
+    m, n, t = G.graph['rows'], G.graph['columns'], G.graph['tile']
+    num_edges = t*t*m*n + t*m*(n - 1) + t*(m - 1)*n
+    if len(G) != 2*m*n*t or G.number_of_edges() != num_edges:
+        return False
+    if not num_edges:
+        return True
+
+    # the counts match, so G is full-yield exactly when each of its (distinct)
+    # edges is a coupler of the Chimera graph
+    tails, heads = zip(*G.edges)
+    try:
+        i0, j0, u0, k0 = _chimera_coordinate_arrays(G, tails)
+        i1, j1, u1, k1 = _chimera_coordinate_arrays(G, heads)
+    except (ValueError, TypeError):
+        return False
+    for x, size in ((i0, m), (j0, n), (u0, 2), (k0, t), (i1, m), (j1, n), (u1, 2), (k1, t)):
+        if ((x < 0) | (x >= size)).any():
+            return False
+
+    internal = (i0 == i1) & (j0 == j1) & (u0 != u1)
+    external = ((u0 == u1) & (k0 == k1) &
+                np.where(u0 == 0,
+                         (j0 == j1) & (np.abs(i0 - i1) == 1),
+                         (i0 == i1) & (np.abs(j0 - j1) == 1)))
+    return bool((internal | external).all())
+
+
+def _chimera_coordinate_arrays(G, nodes):
+    m, n, t = G.graph['rows'], G.graph['columns'], G.graph['tile']
+    if G.graph['labels'] == 'int':
+        r = np.asarray(nodes, dtype=np.int64).reshape(-1)
+        if ((r < 0) | (r >= 2*m*n*t)).any():
+            raise ValueError("nodes must be nodes of G")
+        r, k = np.divmod(r, t)
+        r, u = np.divmod(r, 2)
+        i, j = np.divmod(r, n)
+    else:
+        if any(q not in G for q in nodes):
+            raise ValueError("nodes must be nodes of G")
+        i, j, u, k = np.asarray(nodes, dtype=np.int64).reshape(-1, 4).T
+    return i, j, u, k
+
+
+def _chimera_distance_matrix(G, sources, nodelist):
+    """Closed-form distances in a full-yield Chimera graph.
+
+    A path between two nodes must change row and column one step at a time,
+    and a qubit can only travel in the direction of its orientation.  Thus,
+    the distance is the Manhattan distance between the tiles of the two
+    nodes, plus one if the nodes have different orientations, plus two if
+    they have the same orientation and do not lie on the same line.
+    """
+    if len(set(nodelist)) != len(G):
+        raise ValueError("nodelist must contain each node of G exactly once")
+
+    i0, j0, u0, k0 = (x[:, None] for x in _chimera_coordinate_arrays(G, sources))
+    i1, j1, u1, k1 = _chimera_coordinate_arrays(G, nodelist)
+
+    di = np.abs(i0 - i1)
+    dj = np.abs(j0 - j1)
+    same_u = u0 == u1
+    same_line = same_u & (k0 == k1) & np.where(u0, di == 0, dj == 0)
+
+    distances = di + dj + np.where(same_u, 2, 1)
+    distances[same_line] -= 2
+    return distances.astype(np.int32)
@@ -12,25 +12,39 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
+import heapq
 import itertools
+import multiprocessing
+import time
 
 from random import random, sample
 
 import networkx as nx
+import numpy as np
+from networkx.utils import py_random_state
 
 from dwave_networkx.generators.pegasus import pegasus_coordinates
 from dwave_networkx.generators.zephyr import zephyr_coordinates
 from dwave_networkx.generators.chimera import chimera_coordinates
+from dwave_networkx.generators.common import _label_conversions
 
-__all__ = ['is_almost_simplicial',
+__all__ = ['EliminationOrderEvaluator',
+           'best_elimination_order',
+           'is_almost_simplicial',
            'is_simplicial',
            'chimera_elimination_order',
+           'chimera_torus_elimination_order',
            'pegasus_elimination_order',
+           'pegasus_torus_elimination_order',
            'zephyr_elimination_order',
+           'zephyr_torus_elimination_order',
            'max_cardinality_heuristic',
            'min_fill_heuristic',
            'min_width_heuristic',
            'treewidth_branch_and_bound',
+           'treewidth_reduction',
+           'working_graph_elimination_order',
            'minor_min_width',
            'elimination_order_width',
            ]
@@ -102,14 +116,26 @@ def is_almost_simplicial(G, n):
     return False
 
 
-def minor_min_width(G):
+def minor_min_width(G, contraction='least-c'):
     """Computes a lower bound for the treewidth of graph G.
 
+    The bound is the largest minimum degree of the minors of G found by
+    repeatedly contracting a vertex of minimum degree into one of its
+    neighbors (MMD+ in [BK]_).
+
     Parameters
     ----------
     G : NetworkX graph
         The graph on which to compute a lower bound on the treewidth.
 
+    contraction : str or None (optional, Default 'least-c')
+        The neighbor that a vertex of minimum degree is contracted into:
+
+        * ``'least-c'``: the neighbor with the fewest common neighbors.
+        * ``'min-d'``: the neighbor of smallest degree.
+        * None: the vertex is deleted instead, which gives the degeneracy of
+          G (MMD in [BK]_), a weaker bound that is faster to compute.
+
     Returns
     -------
     lb : int
@@ -126,50 +152,98 @@ def minor_min_width(G):
 
     References
     ----------
-    Based on the algorithm presented in [GD]_
+    Based on the algorithms presented in [GD]_ and [BK]_
 
     """
-    # we need only deal with the adjacency structure of G. We will also
-    # be manipulating it directly so let's go ahead and make a new one
-    adj = {v: set(u for u in G[v] if u != v) for v in G}
+    if contraction not in _CONTRACTIONS:
+        raise ValueError("contraction must be one of {}".format(_CONTRACTIONS))
 
-    lb = 0  # lower bound on treewidth
-    while len(adj) > 1:
+    # we need only deal with the adjacency structure of G, as bitsets
+    index = {v: i for i, v in enumerate(G)}
+    adj = [sum(1 << index[u] for u in G[v] if u != v) for v in G]
 
-        # get the node with the smallest degree
-        v = min(adj, key=lambda v: len(adj[v]))
+    return _minor_min_width_bits(adj, (1 << len(adj)) - 1, contraction)
 
-        # find the vertex u such that the degree of u is minimal in the neighborhood of v
-        neighbors = adj[v]
 
-        if not neighbors:
-            # if v is a singleton, then we can just delete it
-            del adj[v]
-            continue
+# the contraction strategies of minor_min_width
+_CONTRACTIONS = ('least-c', 'min-d', None)
 
-        def neighborhood_degree(u):
-            Gu = adj[u]
-            return sum(w in Gu for w in neighbors)
 
-        u = min(neighbors, key=neighborhood_degree)
+def treewidth_reduction(G, lower_bound=0):
+    """Eliminates the vertices of graph G that some optimal elimination
+    order can eliminate first.
 
-        # update the lower bound
-        new_lb = len(adj[v])
-        if new_lb > lb:
-            lb = new_lb
-
-        # contract the edge between u, v
-        adj[v] = adj[v].union(n for n in adj[u] if n != v)
-        for n in adj[v]:
-            adj[n].add(v)
-        for n in adj[u]:
-            adj[n].discard(u)
-        del adj[u]
+    The safe reduction rules of [BKE]_ are applied until none applies, given
+    a lower bound `low` on the treewidth:
 
-    return lb
+    * simplicial: a vertex whose neighbors form a clique is eliminated, and
+      `low` is raised to its degree.
+    * almost simplicial: a vertex of degree at most `low` whose neighbors,
+      but one, form a clique is eliminated.
+    * buddy: if `low` is at least 3, two vertices with the same three
+      neighbors are eliminated.
+    * cube: if `low` is at least 3, a vertex of degree 3 is eliminated
+      along with its neighbors when they form the corner of a cube: the
+      neighbors are pairwise non-adjacent, have degree 3, and their other
+      neighbors are three vertices, each adjacent to two of them.
+
+    The rules are applied from a worklist, so that only the vertices whose
+    neighborhood changed are checked again after each elimination.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph to reduce.
+
+    lower_bound : int (optional, Default 0)
+        A lower bound on the treewidth of G, such as :func:`.minor_min_width`.
+        A larger bound allows more reductions.
+
+    Returns
+    -------
+    H : NetworkX graph
+        The graph that remains after eliminating the vertices of order from G.
+
+    order : list
+        The vertices eliminated, in order.
+
+    low : int
+        A lower bound on the treewidth of G, at least `lower_bound`. The
+        treewidth of G is the largest of `low` and the treewidth of H, and
+        order followed by any elimination order of H of width w is an
+        elimination order of G of width at most the largest of `low` and w.
+
+    Examples
+    --------
+    Graphs of treewidth at most 2 are reduced to nothing, given a lower
+    bound of 2.
+
+    >>> G = nx.cycle_graph(10)
+    >>> H, order, low = dnx.treewidth_reduction(G, dnx.minor_min_width(G))
+    >>> len(H), low
+    (0, 2)
+
+    References
+    ----------
+    Based on the algorithm presented in [BKE]_
+
+    """
+    # we need only deal with the adjacency structure of G, as bitsets
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = [sum(1 << index[u] for u in G[v] if u != v) for v in nodes]
+    alive = (1 << len(nodes)) - 1
+
+    alive, order, low = _reduce_bits(adj, alive, lower_bound)
+
+    H = nx.Graph()
+    H.add_nodes_from(nodes[v] for v in _bits(alive))
+    H.add_edges_from((nodes[v], nodes[u]) for v in _bits(alive) for u in _bits(adj[v] >> v + 1 << v + 1))
+    return H, [nodes[v] for v in order], low
 
 
-def min_fill_heuristic(G):
+@py_random_state('seed')
+def min_fill_heuristic(G, seed=None):
     """Computes an upper bound on the treewidth of graph G based on
     the min-fill heuristic for the elimination ordering.
 
@@ -178,6 +252,11 @@ def min_fill_heuristic(G):
     G : NetworkX graph
         The graph on which to compute an upper bound for the treewidth.
 
+    seed : int, random.Random or None (optional, default None)
+        Seed for the random tie-breaking between nodes with the same fill.
+        If None, the global random number generator of the :mod:`random`
+        module is used.
+
     Returns
     -------
     treewidth_upper_bound : int
@@ -209,37 +288,69 @@ def min_fill_heuristic(G):
     order = [0] * num_nodes
     upper_bound = 0
 
+    # The fill of each node (the number of edges needed to make it simplicial)
+    # is kept in a heap. Ties are broken by a random value in [0., 1.) drawn
+    # each time a fill changes, so that among the nodes with minimum fill, the
+    # one chosen is uniformly random. Entries of the heap made stale by an
+    # update are skipped when popped.
+    nodes = list(adj)
+    label = {v: i for i, v in enumerate(nodes)}  # nodes may not be comparable
+    fill = {v: _fill(adj, v) for v in nodes}
+    heap = [(fill[v], seed.random(), label[v]) for v in nodes]
+    heapq.heapify(heap)
+
     for i in range(num_nodes):
         # get the node that adds the fewest number of edges when eliminated from the graph
-        v = min(adj, key=lambda x: _min_fill_needed_edges(adj, x))
+        while True:
+            e, _, j = heapq.heappop(heap)
+            v = nodes[j]
+            if v in adj and fill[v] == e:
+                break
 
         # if the number of neighbours of v is higher than upper_bound, update
-        dv = len(adj[v])
+        neighbors = adj.pop(v)
+        dv = len(neighbors)
         if dv > upper_bound:
             upper_bound = dv
 
         # make v simplicial by making its neighborhood a clique then remove the
-        # node
-        _elim_adj(adj, v)
+        # node, updating the fill of the nodes within distance two of v
+        changed = set(neighbors)
+        for a, b in itertools.combinations(neighbors, 2):
+            if b not in adj[a]:
+                # the pair a, b is no longer missing from the neighborhoods of
+                # their common neighbors, while b (resp. a) forms a new pair
+                # with each of the other neighbors of a (resp. b)
+                common = adj[a] & adj[b]
+                for w in common:
+                    fill[w] -= 1
+                changed.update(common)
+                fill[a] += len(adj[a]) - len(common)
+                fill[b] += len(adj[b]) - len(common)
+                adj[a].add(b)
+                adj[b].add(a)
+        for u in neighbors:
+            # v is now adjacent to all of the neighbors of u but v itself
+            fill[u] -= len(adj[u]) - dv
+            adj[u].discard(v)
+        del fill[v]
+        changed.discard(v)
         order[i] = v
 
+        for w in changed:
+            heapq.heappush(heap, (fill[w], seed.random(), label[w]))
+
     return upper_bound, order
 
 
-def _min_fill_needed_edges(adj, n):
-    # determines how many edges would needed to be added to G in order
-    # to make node n simplicial.
-    e = 0  # number of edges needed
-    for u, v in itertools.combinations(adj[n], 2):
-        if u not in adj[v]:
-            e += 1
-    # We add random() which picks a value in the range [0., 1.). This is ok because the
-    # e are all integers. By adding a small random value, we randomize which node is
-    # chosen without affecting correctness.
-    return e + random()
+def _fill(adj, n):
+    # the number of edges needed to be added to make node n simplicial
+    neighbors = adj[n]
+    return (len(neighbors) * (len(neighbors) - 1) - sum(len(adj[u] & neighbors) for u in neighbors)) // 2
 
 
-def min_width_heuristic(G):
+@py_random_state('seed')
+def min_width_heuristic(G, seed=None):
     """Computes an upper bound on the treewidth of graph G based on
     the min-width heuristic for the elimination ordering.
 
@@ -248,6 +359,11 @@ def min_width_heuristic(G):
     G : NetworkX graph
         The graph on which to compute an upper bound for the treewidth.
 
+    seed : int, random.Random or None (optional, default None)
+        Seed for the random tie-breaking between nodes with the same degree.
+        If None, the global random number generator of the :mod:`random`
+        module is used.
+
     Returns
     -------
     treewidth_upper_bound : int
@@ -279,12 +395,18 @@ def min_width_heuristic(G):
     order = [0] * num_nodes
     upper_bound = 0
 
+    # the nodes are kept in buckets by degree. Eliminating a node lowers the
+    # degree of its neighbors by at most one, so the minimum degree decreases
+    # by at most one per elimination
+    buckets = _BucketQueue((v, len(adj[v])) for v in adj)
+    min_degree = 0
+
     for i in range(num_nodes):
-        # get the node with the smallest degree. We add random() which picks a value
-        # in the range [0., 1.). This is ok because the lens are all integers. By
-        # adding a small random value, we randomize which node is chosen without affecting
-        # correctness.
-        v = min(adj, key=lambda u: len(adj[u]) + random())
+        # get a node with the smallest degree, chosen uniformly at random
+        min_degree = max(min_degree - 1, 0)
+        while not buckets.has(min_degree):
+            min_degree += 1
+        v = buckets.pop(min_degree, seed)
 
         # if the number of neighbours of v is higher than upper_bound, update
         dv = len(adj[v])
@@ -293,13 +415,17 @@ def min_width_heuristic(G):
 
         # make v simplicial by making its neighborhood a clique then remove the
         # node
+        neighbors = adj[v]
         _elim_adj(adj, v)
         order[i] = v
+        for u in neighbors:
+            buckets.update(u, len(adj[u]))
 
     return upper_bound, order
 
 
-def max_cardinality_heuristic(G):
+@py_random_state('seed')
+def max_cardinality_heuristic(G, seed=None):
     """Computes an upper bound on the treewidth of graph G based on
     the max-cardinality heuristic for the elimination ordering.
 
@@ -308,6 +434,11 @@ def max_cardinality_heuristic(G):
     G : NetworkX graph
         The graph on which to compute an upper bound for the treewidth.
 
+    seed : int, random.Random or None (optional, default None)
+        Seed for the random tie-breaking between nodes with the same number
+        of labelled neighbors. If None, the global random number generator
+        of the :mod:`random` module is used.
+
     Returns
     -------
     treewidth_upper_bound : int
@@ -340,19 +471,24 @@ def max_cardinality_heuristic(G):
     upper_bound = 0
 
     # we will need to track the nodes and how many labelled neighbors
-    # each node has
-    labelled_neighbors = {v: 0 for v in adj}
+    # each node has, in buckets by number of labelled neighbors. Labelling a
+    # node increments its neighbors, so the maximum increases by at most one
+    # per step
+    labelled_neighbors = _BucketQueue((v, 0) for v in adj)
+    max_labelled = 0
 
     # working backwards
     for i in range(num_nodes):
-        # pick the node with the most labelled neighbors
-        v = max(labelled_neighbors, key=lambda u: labelled_neighbors[u] + random())
-        del labelled_neighbors[v]
+        # pick a node with the most labelled neighbors, chosen uniformly at random
+        max_labelled += 1
+        while not labelled_neighbors.has(max_labelled):
+            max_labelled -= 1
+        v = labelled_neighbors.pop(max_labelled, seed)
 
         # increment all of its neighbors
         for u in adj[v]:
             if u in labelled_neighbors:
-                labelled_neighbors[u] += 1
+                labelled_neighbors.update(u, labelled_neighbors[u] + 1)
 
         order[-(i + 1)] = v
 
@@ -369,6 +505,64 @@ def max_cardinality_heuristic(G):
     return upper_bound, order
 
 
+class _BucketQueue(object):
+    """Nodes bucketed by an integer key, supporting constant-time updates
+    of the keys and removal of a node chosen uniformly at random among the
+    nodes with a given key.
+
+    Parameters
+    ----------
+    items: iterable
+        Pairs (v, key).
+
+    """
+    def __init__(self, items):
+        self._key = {}
+        self._buckets = {}
+        self._position = {}
+        for v, key in items:
+            self._insert(v, key)
+
+    def _insert(self, v, key):
+        bucket = self._buckets.setdefault(key, [])
+        self._key[v] = key
+        self._position[v] = len(bucket)
+        bucket.append(v)
+
+    def _remove(self, v):
+        # swap v with the last node of its bucket, then truncate
+        bucket = self._buckets[self._key.pop(v)]
+        i = self._position.pop(v)
+        last = bucket.pop()
+        if i < len(bucket):
+            bucket[i] = last
+            self._position[last] = i
+
+    def __contains__(self, v):
+        return v in self._key
+
+    def __getitem__(self, v):
+        return self._key[v]
+
+    def has(self, key):
+        """True if some node has the given key."""
+        return bool(self._buckets.get(key))
+
+    def update(self, v, key):
+        """Sets the key of node v."""
+        if self._key[v] != key:
+            self._remove(v)
+            self._insert(v, key)
+
+    def pop(self, key, rng):
+        """Removes and returns a node with the given key, chosen uniformly at
+        random using the random.Random instance rng."""
+        bucket = self._buckets[key]
+        v = bucket[int(rng.random() * len(bucket))]
+        self._remove(v)
+        return v
+
+
 def _elim_adj(adj, n):
     """eliminates a variable, acting on the adj matrix of G,
     returning set of edges that were added.
@@ -459,7 +653,251 @@ def elimination_order_width(G, order):
     return treewidth
 
 
-def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=None):
+class EliminationOrderEvaluator(object):
+    """Computes the widths of many elimination orders of a graph.
+
+    The adjacency of the graph is built once, as integer bitsets, so that
+    eliminating a node updates each of its neighbors with a single bitwise
+    operation, and the widths of orders can be computed without going back
+    to the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph whose elimination orders are evaluated.
+
+    Examples
+    --------
+    >>> G = nx.star_graph(3)  # node 0 is the center
+    >>> evaluator = dnx.EliminationOrderEvaluator(G)
+    >>> evaluator.widths([[1, 2, 3, 0], [0, 1, 2, 3]])
+    [1, 3]
+    >>> evaluator.width([0, 1, 2, 3], bound=1) > 1
+    True
+
+    """
+    def __init__(self, G):
+        self.nodes = nodes = list(G)
+        self._index = index = {v: i for i, v in enumerate(nodes)}
+        self._adj = [sum(1 << index[u] for u in G[v] if u != v) for v in nodes]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _positions(self, order):
+        index = self._index
+        try:
+            positions = [index[v] for v in order]
+        except KeyError as err:
+            raise ValueError('{} is in order but not in G'.format(err.args[0])) from None
+        if len(set(positions)) != len(positions):
+            raise ValueError('order contains duplicates')
+        if len(positions) < len(index):
+            raise ValueError('not all nodes in G were in order')
+        return positions
+
+    def width(self, order, bound=None):
+        """Computes the width of an elimination order.
+
+        Parameters
+        ----------
+        order : list
+            The elimination order. Must be a list of all of the nodes of
+            the graph.
+
+        bound : int (optional, Default None)
+            If given, the elimination stops as soon as the width is found
+            to be larger than bound.
+
+        Returns
+        -------
+        width : int
+            The width of order, see :func:`.elimination_order_width`, or,
+            if it is larger than bound, a width larger than bound.
+
+        """
+        return _order_width(self._adj, self._positions(order), bound)
+
+    def widths(self, orders, bound=None, workers=None):
+        """Computes the widths of several elimination orders.
+
+        Parameters
+        ----------
+        orders : iterable
+            The elimination orders, see :meth:`.width`.
+
+        bound : int (optional, Default None)
+            See :meth:`.width`.
+
+        workers : int (optional, Default None)
+            The number of worker processes. If greater than 1, the orders
+            are evaluated by a pool of processes, to which the adjacency of
+            the graph is sent once.
+
+        Returns
+        -------
+        widths : list
+            The widths of the orders, in order.
+
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be a positive integer")
+
+        positions = [self._positions(order) for order in orders]
+        if workers is None or workers == 1 or len(positions) < 2:
+            adj = self._adj
+            return [_order_width(adj, order, bound) for order in positions]
+
+        with multiprocessing.Pool(workers, initializer=_init_evaluator_worker,
+                                  initargs=(self._adj, bound)) as pool:
+            return pool.map(_evaluate_order, positions,
+                            chunksize=max(1, len(positions) // (4 * workers)))
+
+
+def _order_width(adj, order, bound):
+    # the width of order, a list of the positions of the nodes, eliminated
+    # from a copy of the bitset adjacency adj, stopping once it exceeds bound
+    adj = list(adj)
+    width = 0
+    remaining = len(order)
+    for n in order:
+        remaining -= 1
+        if width >= remaining:
+            # no node has more neighbors than there are remaining nodes
+            break
+
+        neighbors = adj[n]
+        degree = _popcount(neighbors)
+        if degree > width:
+            width = degree
+            if bound is not None and width > bound:
+                break
+
+        bit = 1 << n
+        for u in _bits(neighbors):
+            adj[u] = (adj[u] | neighbors) & ~(bit | (1 << u))
+    return width
+
+
+def _init_evaluator_worker(adj, bound):
+    _worker_state.update(adj=adj, bound=bound)
+
+
+def _evaluate_order(order):
+    return _order_width(_worker_state['adj'], order, _worker_state['bound'])
+
+
+@py_random_state('seed')
+def best_elimination_order(G, heuristics=None, restarts=1, workers=None, seed=None):
+    """Runs elimination order heuristics repeatedly and returns the best
+    order found.
+
+    The heuristics break ties randomly, so that different runs can find
+    orders of different widths. Each heuristic is run restarts times with
+    a different seed, stopping as soon as an order is found whose width
+    equals the lower bound on the treewidth given by :func:`.minor_min_width`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph on which to find an elimination order.
+
+    heuristics : list (optional, Default None)
+        The heuristics to run, functions called as ``heuristic(G, seed=seed)``
+        which return a width and an elimination order, such as
+        :func:`.min_fill_heuristic`. If not provided, :func:`.min_fill_heuristic`,
+        :func:`.min_width_heuristic` and :func:`.max_cardinality_heuristic`.
+
+    restarts : int (optional, Default 1)
+        The number of times each heuristic is run.
+
+    workers : int (optional, Default None)
+        The number of worker processes. If greater than 1, the runs are
+        distributed over a pool of processes, to which the graph is sent
+        once, as an array of edges. The heuristics must then be picklable.
+
+    seed : int, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    treewidth_upper_bound : int
+        The smallest width of the orders found.
+
+    order : list
+        An elimination order of that width. For a given seed, it does not
+        depend on the number of workers.
+
+    Examples
+    --------
+    >>> G = dnx.chimera_graph(2, 2, 4)
+    >>> tw, order = dnx.best_elimination_order(G, restarts=5, seed=1)
+    >>> tw == dnx.elimination_order_width(G, order)
+    True
+
+    """
+    if heuristics is None:
+        heuristics = [min_fill_heuristic, min_width_heuristic, max_cardinality_heuristic]
+    if restarts < 1:
+        raise ValueError("restarts must be a positive integer")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    # the heuristics are run on a copy of G labelled by the positions of its
+    # nodes, which is the graph sent to the workers
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges if u != v], dtype=np.int64).reshape(-1, 2)
+
+    tasks = [(heuristic, seed.randrange(2**32)) for __ in range(restarts) for heuristic in heuristics]
+
+    lb = minor_min_width(G)
+
+    if workers is None or workers == 1:
+        H = _graph_from_edges(len(nodes), edges)
+        results = (heuristic(H, seed=task_seed) for heuristic, task_seed in tasks)
+        tw, order = _best_elimination_order(results, lb)
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_heuristic_worker,
+                                  initargs=(len(nodes), edges)) as pool:
+            # the results are consumed in order, so that the result does not
+            # depend on the scheduling of the tasks
+            tw, order = _best_elimination_order(pool.imap(_run_heuristic, tasks), lb)
+
+    return tw, [nodes[i] for i in order]
+
+
+def _graph_from_edges(num_nodes, edges):
+    G = nx.Graph()
+    G.add_nodes_from(range(num_nodes))
+    G.add_edges_from(edges.tolist())
+    return G
+
+
+def _best_elimination_order(results, lb):
+    best = None
+    for tw, order in results:
+        if best is None or tw < best[0]:
+            best = tw, order
+            if tw <= lb:
+                # no order has a smaller width
+                break
+    return best
+
+
+def _init_heuristic_worker(num_nodes, edges):
+    _worker_state.update(graph=_graph_from_edges(num_nodes, edges))
+
+
+def _run_heuristic(task):
+    heuristic, seed = task
+    return heuristic(_worker_state['graph'], seed=seed)
+
+
+def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=None, workers=None,
+                               time_limit=None, node_limit=None, callback=None, info=None,
+                               table_size=2**16, contraction='least-c'):
     """Computes the treewidth of graph G and a corresponding perfect elimination ordering.
 
     Algorithm based on [GD]_.
@@ -478,6 +916,57 @@ def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=N
         An upper bound on the treewidth. Note that using
         this parameter can result in no returned order.
 
+    workers : int (optional, Default None)
+        The number of worker processes. If greater than 1, the subtrees of
+        the search rooted at each choice of the first vertex to eliminate
+        are explored by a pool of processes, which share the best upper
+        bound found so far so that every process prunes against it. The
+        returned order does not then depend on the scheduling of the
+        processes: it is the first order of minimum width found by a
+        deterministic search of the subtrees, in order, or the initial
+        min-fill order, found with a fixed seed.
+
+    time_limit : float (optional, Default None)
+        If given, the search stops after this many seconds and the best
+        order found so far is returned. Its width is then an upper bound on
+        the treewidth, see `info` for a lower bound.
+
+    node_limit : int (optional, Default None)
+        If given, the search stops after expanding this many nodes of the
+        search tree, as for `time_limit`.
+
+    callback : function (optional, Default None)
+        If given, called as ``callback(width, order)`` whenever the search
+        finds an order of smaller width than the best order found so far.
+
+    info : dict (optional, Default None)
+        If given, updated with statistics of the search:
+
+        * ``'lower_bound'``: a lower bound on the treewidth, equal to the
+          returned width if the search was not stopped early.
+        * ``'optimal'``: whether the returned width is the treewidth.
+        * ``'nodes_expanded'``: the number of nodes of the search tree visited.
+        * ``'pruned_lower_bound'``: the number of subtrees pruned because of
+          their lower bound.
+        * ``'pruned_theorem6p1'``, ``'pruned_theorem6p2'`` and
+          ``'pruned_theorem6p4'``: the number of subtrees pruned by Theorems
+          6.1, 6.2 and 6.4 of [GD]_.
+        * ``'edges_theorem5p4'``: the number of edges added by Theorem 5.4 of [GD]_.
+        * ``'reductions'``: the number of (almost) simplicial vertices eliminated.
+
+    table_size : int (optional, Default 65536)
+        The maximum number of subgraphs remembered by the search. The
+        subgraph reached by a partial order only depends on the set of
+        vertices eliminated, so a branch that reaches a remembered subgraph
+        with no smaller width is pruned (this generalizes Theorem 6.1 of
+        [GD]_). The least recently seen subgraphs are forgotten first, so
+        memory use is bounded. Use 0 to disable.
+
+    contraction : str or None (optional, Default 'least-c')
+        The contraction strategy of the lower bound computed at each node
+        of the search, see :func:`.minor_min_width`. The lower bound of the
+        whole graph is the best of the strategies.
+
     Returns
     -------
     treewidth : int
@@ -499,9 +988,21 @@ def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=N
     ----------
     Based on the algorithm presented in [GD]_
     """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if contraction not in _CONTRACTIONS:
+        raise ValueError("contraction must be one of {}".format(_CONTRACTIONS))
+    parallel = workers is not None and workers > 1
+    if parallel and (time_limit is not None or node_limit is not None or callback is not None):
+        raise ValueError("time_limit, node_limit and callback cannot be used with several workers")
+
+    stats = dict.fromkeys(_SEARCH_COUNTERS, 0)
+
     # empty graphs have treewidth 0 and the nodes can be eliminated in
     # any order
     if not any(G[v] for v in G):
+        if info is not None:
+            info.update(stats, lower_bound=0, optimal=True)
         return 0, list(G)
 
     # variable names are chosen to match the paper
@@ -510,11 +1011,14 @@ def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=N
     # the paper
     x = []  # the partial order
 
-    f = minor_min_width(G)  # our current lower bound guess, f(s) in the paper
+    # our current lower bound guess, f(s) in the paper. It is only computed
+    # once for the whole graph, so we can afford every strategy
+    f = max(minor_min_width(G, strategy) for strategy in _CONTRACTIONS if strategy is not None)
     g = 0  # g(s) in the paper
 
-    # we need the best current update we can find.
-    ub, order = min_fill_heuristic(G)
+    # we need the best current update we can find. With several workers the
+    # result is deterministic, which includes the initial order
+    ub, order = min_fill_heuristic(G, seed=0 if parallel else None)
 
     # if the user has provided an upperbound or an elimination order, check those against
     # our current best guess
@@ -533,151 +1037,520 @@ def treewidth_branch_and_bound(G, elimination_order=None, treewidth_upperbound=N
     # if our upper bound is the same as f, then we are done! Otherwise begin the
     # algorithm.
     if f < ub:
-        # we need only deal with the adjacency structure of G. We will also
-        # be manipulating it directly so let's go ahead and make a new one
-        adj = {v: set(u for u in G[v] if u != v) for v in G}
+        # we need only deal with the adjacency structure of G. The search runs
+        # on integer bitsets, where node i of nodes is bit i, and labels are
+        # only restored at the end
+        nodes = list(G)
+        index = {v: i for i, v in enumerate(nodes)}
+        adj = [sum(1 << index[u] for u in G[v] if u != v) for v in nodes]
+        alive = (1 << len(nodes)) - 1
+
+        best_found = ub, [index[v] for v in order]
+        if parallel:
+            ub, order = _parallel_branch_and_bound(adj, alive, f, best_found, workers, stats, table_size,
+                                                   contraction)
+        else:
+            abort = improved = None
+
+            if time_limit is not None or node_limit is not None:
+                deadline = None if time_limit is None else time.monotonic() + time_limit
+
+                def abort(best_found, nodes_expanded):
+                    if node_limit is not None and nodes_expanded >= node_limit:
+                        return True
+                    return deadline is not None and time.monotonic() >= deadline
+
+            if callback is not None:
+                def improved(best_found):
+                    width, order = best_found
+                    callback(width, [nodes[i] for i in order])
 
-        best_found = _branch_and_bound(adj, x, g, f, best_found)
+            ub, order = _branch_and_bound(adj, alive, x, g, f, best_found,
+                                          abort=abort, improved=improved, stats=stats,
+                                          table_size=table_size, contraction=contraction)
+        best_found = ub, [nodes[i] for i in order]
     elif f > ub and treewidth_upperbound is None:
         raise RuntimeError("logic error")
+    else:
+        stats['lower_bound'] = f
+
+    if info is not None:
+        ub, order = best_found
+        info.update(stats, optimal=bool(order) and stats['lower_bound'] >= ub)
 
     return best_found
 
 
-def _branch_and_bound(adj, x, g, f, best_found, skipable=set(), theorem6p2=None):
-    """ Recursive branch and bound for computing treewidth of a subgraph.
-    adj: adjacency list
+def _branch_and_bound(adj, alive, x, g, f, best_found,
+                      branches=None, incumbent=None, abort=None, shuffle=True,
+                      improved=None, stats=None, table_size=0, contraction='least-c'):
+    """ Branch and bound for computing treewidth of a subgraph.
+    adj: adjacency bitsets, adj[v] has bit u set if u is a neighbor of v
+    alive: bitset of the vertices of the subgraph
     x: partial elimination order
     g: width of x so far
     f: lower bound on width of any elimination order starting with x
     best_found = ub,order: best upper bound on the treewidth found so far, and its elimination order
-    skipable: vertices that can be skipped according to Lemma 5.3
-    theorem6p2: terms that have been explored/can be pruned according to Theorem 6.2
+    branches: if given, the vertices to branch on first, instead of all the vertices of the subgraph
+    incumbent: a shared multiprocessing.Value holding an upper bound found by other processes
+    abort: if given, called with best_found and the number of nodes expanded before each step,
+        the search stops if it returns True
+    shuffle: if False, ties between vertices of equal fill are broken by position rather than randomly
+    improved: if given, called with best_found whenever the search improves it
+    stats: if given, a dict in which the counters of the search are accumulated,
+        see treewidth_branch_and_bound, and the lower bound on the treewidth is set
+    table_size: the number of states remembered by the transposition table, see _theorem6p1
+    contraction: the contraction strategy of the lower bound, see minor_min_width
+
+    The search tree is traversed depth-first with an explicit stack of
+    _SearchNode, so deep searches are not limited by the recursion limit.
+    A single adjacency adj and partial order x are modified in place: every
+    change to a row of adj is recorded on an undo log, and rolled back when
+    the search returns to a node, so that no state is copied per branch.
     """
 
-    # theorem6p2 checks for branches that can be pruned using Theorem 6.2
-    if theorem6p2 is None:
-        theorem6p2 = _theorem6p2()
-    prune6p2, explored6p2, finished6p2 = theorem6p2
-    # current6p2 is the list of prunable terms created during this instantiation of _branch_and_bound.
-    # These terms will only be use during this call and its successors,
-    # so they are removed before the function terminates.
-    current6p2 = list()
-
-    # theorem6p4 checks for branches that can be pruned using Theorem 6.4.
-    # These terms do not need to be passed to successive calls to _branch_and_bound,
-    # so they are simply created and deleted during this call.
-    prune6p4, explored6p4 = _theorem6p4()
-
-    # Note: theorem6p1 and theorem6p3 are a pruning strategies that are currently disabled
-    # # as they does not appear to be invoked regularly,
-    # and invoking it can require large memory allocations.
-    # This can be fixed in the future if there is evidence that it's useful.
-    # To add them in, define _branch_and_bound as follows:
-    # def _branch_and_bound(adj, x, g, f, best_found, skipable=set(), theorem6p1=None,
-    #                       theorem6p2=None, theorem6p3=None):
-
-    # if theorem6p1 is None:
-    #     theorem6p1 = _theorem6p1()
-    # prune6p1, explored6p1 = theorem6p1
-
-    # if theorem6p3 is None:
-    #     theorem6p3 = _theorem6p3()
-    # prune6p3, explored6p3 = theorem6p3
-
-    # we'll need to know our current upper bound in several places
-    ub, order = best_found
+    # theorem6p1 checks for branches that reach the same subgraph as an
+    # explored one, using a transposition table of bounded size
+    prune6p1 = _theorem6p1(table_size)
 
-    # ok, take care of the base case first
-    if len(adj) < 2:
-        # check if our current branch is better than the best we've already
-        # found and if so update our best solution accordingly.
-        if f < ub:
-            return (f, x + list(adj))
-        elif f == ub and not order:
-            return (f, x + list(adj))
+    # theorem6p2 checks for branches that can be pruned using Theorem 6.2
+    prune6p2, explored6p2, finished6p2 = _theorem6p2()
+
+    # Note: theorem6p3 is disabled. The (almost) simplicial vertices it relies
+    # on are found after the edges of Theorem 5.4 and the reductions, which
+    # both depend on the bounds, so the branch it prunes may be the only one
+    # leading to an optimal order.
+
+    # (v, adj[v]) for each row of adj overwritten since the search started
+    undo = []
+
+    counts = dict.fromkeys(_SEARCH_COUNTERS, 0)
+
+    def visit(alive, g, f, skipable):
+        # enter the subgraph induced by alive, returning its search node, or
+        # None if it is a leaf of the search tree
+        nonlocal best_found
+
+        counts['nodes_expanded'] += 1
+
+        # ok, take care of the base case first
+        if not alive & (alive - 1):
+            # check if our current branch is better than the best we've already
+            # found and if so update our best solution accordingly.
+            ub, order = best_found
+            if incumbent is not None:
+                ub = min(ub, incumbent.value)
+            if f < ub or (f == ub and not order):
+                best_found = (f, x + list(_bits(alive)))
+                if incumbent is not None:
+                    with incumbent.get_lock():
+                        if f < incumbent.value:
+                            incumbent.value = f
+                if improved is not None:
+                    improved(best_found)
+            return None
+
+        # so we have not yet reached the base case
+        # Note: theorem 6.4 gives a heuristic for choosing order of n in adj.
+        # Quick_bb suggests using a min-fill or random order.
+        # We don't need to consider the neighbors of the last vertex eliminated
+        if shuffle:
+            children = sorted(_bits(alive & ~skipable), key=lambda v: _fill_bits(adj, v) + random())
         else:
-            return best_found
+            children = sorted(_bits(alive & ~skipable), key=lambda v: _fill_bits(adj, v))
+        return _SearchNode(alive, g, f, children, len(undo), len(x))
 
-    # so we have not yet reached the base case
-    # Note: theorem 6.4 gives a heuristic for choosing order of n in adj.
-    # Quick_bb suggests using a min-fill or random order.
-    # We don't need to consider the neighbors of the last vertex eliminated
-    sorted_adj = sorted((n for n in adj if n not in skipable), key=lambda x: _min_fill_needed_edges(adj, x))
-    for n in sorted_adj:
+    root = visit(alive, g, f, 0)
+    if root is not None and branches is not None:
+        root.children = iter(branches)
+    stack = [root] if root is not None else []
+    while stack:
+        if abort is not None and abort(best_found, counts['nodes_expanded']):
+            break
 
-        g_s = max(g, len(adj[n]))
+        node = stack[-1]
 
-        # according to Lemma 5.3, we can skip all of the neighbors of the last
-        # variable eliniated when choosing the next variable
-        # this does not get altered so we don't need a copy
-        next_skipable = adj[n]
+        # return to the state of node, and store some information about the
+        # child that was just explored for pruning
+        _rollback(adj, undo, node.mark)
+        del x[node.depth:]
+        if node.last is not None:
+            n, next_skipable, edges_n = node.last
+            node.last = None
 
-        if prune6p2(x, n, next_skipable):
-            continue
+            prunable = explored6p2(x, n, next_skipable)
+            node.current6p2.append(prunable)
 
-        # update the state by eliminating n and adding it to the partial ordering
-        adj_s = {v: adj[v].copy() for v in adj}  # create a new object
-        edges_n = _elim_adj(adj_s, n)
-        x_s = x + [n]  # new partial ordering
+            node.explored6p4(edges_n)
 
-        # pruning (disabled):
-        # if prune6p1(x_s):
-        #     continue
+        ub, __ = best_found
+        if incumbent is not None:
+            ub = min(ub, incumbent.value)
 
-        if prune6p4(edges_n):
-            continue
+        for n in node.children:
+
+            g_s = max(node.g, _popcount(adj[n]))
+
+            # according to Lemma 5.3, we can skip all of the neighbors of the last
+            # variable eliniated when choosing the next variable
+            next_skipable = adj[n]
 
-        # By Theorem 5.4, if any two vertices have ub + 1 common neighbors then
-        # we can add an edge between them
-        _theorem5p4(adj_s, ub)
+            if prune6p2(x, n, next_skipable):
+                counts['pruned_theorem6p2'] += 1
+                continue
 
-        # ok, let's update our values
-        f_s = max(g_s, minor_min_width(adj_s))
+            # update the state by eliminating n and adding it to the partial ordering
+            edges_n = _elim_bits(adj, n, undo)
+            x.append(n)
+            alive_s = node.alive & ~(1 << n)
 
-        g_s, f_s, as_list = _graph_reduction(adj_s, x_s, g_s, f_s)
+            if node.prune6p4(edges_n):
+                counts['pruned_theorem6p4'] += 1
+                _rollback(adj, undo, node.mark)
+                x.pop()
+                continue
 
-        # pruning (disabled):
-        # if prune6p3(x, as_list, n):
-        #     continue
+            # By Theorem 5.4, if any two vertices have ub + 1 common neighbors then
+            # we can add an edge between them
+            counts['edges_theorem5p4'] += _theorem5p4(adj, alive_s, ub, undo)
 
-        if f_s < ub:
-            best_found = _branch_and_bound(adj_s, x_s, g_s, f_s, best_found,
-                                           next_skipable, theorem6p2=theorem6p2)
-            # if theorem6p1, theorem6p3 are enabled, this should be called as:
-            # best_found = _branch_and_bound(adj_s, x_s, g_s, f_s, best_found,
-            #                                next_skipable, theorem6p1=theorem6p1,
-            #                                theorem6p2=theorem6p2,theorem6p3=theorem6p3)
-            ub, __ = best_found
+            # ok, let's update our values
+            # the lower bound is only needed up to ub, above which the branch is pruned
+            f_s = max(g_s, _minor_min_width_bits(adj, alive_s, contraction, ub))
 
-        # store some information for pruning (disabled):
-        # explored6p3(x, n, as_list)
+            g_s, f_s, alive_s, as_list = _graph_reduction(adj, alive_s, x, g_s, f_s, undo)
+            counts['reductions'] += len(as_list)
 
-        prunable = explored6p2(x, n, next_skipable)
-        current6p2.append(prunable)
+            node.last = (n, next_skipable, edges_n)
+            if prune6p1(alive_s, g_s):
+                counts['pruned_theorem6p1'] += 1
+            elif f_s < ub:
+                child = visit(alive_s, g_s, f_s, next_skipable)
+                if child is not None:
+                    stack.append(child)
+            else:
+                counts['pruned_lower_bound'] += 1
+            break
+
+        else:
+            # every child of node has been explored
+            for prunable in node.current6p2:
+                finished6p2(prunable)
 
-        explored6p4(edges_n)
+            stack.pop()
 
-    # store some information for pruning (disabled):
-    # explored6p1(x)
+    _rollback(adj, undo, 0)
 
-    for prunable in current6p2:
-        finished6p2(prunable)
+    if stats is not None:
+        for key, count in counts.items():
+            stats[key] = stats.get(key, 0) + count
+        # the subtrees left on the stack were not explored, but none of them
+        # can do better than the lower bound of its root
+        stats['lower_bound'] = min([best_found[0]] + [node.f for node in stack])
 
     return best_found
 
 
-def _graph_reduction(adj, x, g, f):
+# the counters of _branch_and_bound
+_SEARCH_COUNTERS = ('nodes_expanded',
+                    'pruned_lower_bound',
+                    'pruned_theorem6p1',
+                    'pruned_theorem6p2',
+                    'pruned_theorem6p4',
+                    'edges_theorem5p4',
+                    'reductions',
+                    )
+
+
+def _parallel_branch_and_bound(adj, alive, f, best_found, workers, stats, table_size, contraction):
+    """Branch and bound over a pool of processes, each task being the subtree
+    of the search where one vertex is eliminated first.
+
+    The search runs in two phases. In the first, the tasks share their best
+    upper bound through shared memory, which gives the treewidth (or
+    confirms the upper bound in best_found). The order that is found first
+    depends on the scheduling of the tasks, so in the second phase each task
+    searches its subtree with a fixed bound and tie-breaking for the first
+    order of that width, and the order of the first task that succeeds is
+    returned. The counters of all of the tasks are accumulated in stats.
+    """
+    ub, order = best_found
+
+    # the tasks, in the order in which the sequential search explores them
+    branches = sorted(_bits(alive), key=lambda v: _fill_bits(adj, v))
+
+    incumbent = multiprocessing.Value('i', ub)  # best upper bound of any task
+    winner = multiprocessing.Value('i', len(branches))  # first task to succeed in the second phase
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(adj, alive, f, incumbent, winner, table_size, contraction)) as pool:
+        results = pool.map(_search_branch, [(ub, n) for n in branches], chunksize=1)
+
+        tw = min([ub] + [width for (width, order_s), __ in results if order_s])
+
+        found = pool.map(_find_branch, [(k, tw, n) for k, n in enumerate(branches)], chunksize=1)
+
+    for __, task_stats in results + found:
+        for key in _SEARCH_COUNTERS:
+            stats[key] += task_stats[key]
+    stats['lower_bound'] = tw
+
+    for (width, order_s), __ in found:
+        if width <= tw:
+            return width, order_s
+
+    # the upper bound was given without an order and could not be attained
+    return best_found
+
+
+# the state shared by the tasks of a process pool, in each worker
+_worker_state = {}
+
+
+def _init_worker(adj, alive, f, incumbent, winner, table_size, contraction):
+    _worker_state.update(adj=adj, alive=alive, f=f, incumbent=incumbent, winner=winner,
+                         table_size=table_size, contraction=contraction)
+
+
+def _search_branch(task):
+    # find the best order in the subtree of n, pruning against the best
+    # upper bound of all of the tasks
+    ub, n = task
+    state = _worker_state
+    stats = {}
+    best_found = _branch_and_bound(list(state['adj']), state['alive'], [], 0, state['f'], (ub, []),
+                                   branches=[n], incumbent=state['incumbent'], stats=stats,
+                                   table_size=state['table_size'], contraction=state['contraction'])
+    return best_found, stats
+
+
+def _find_branch(task):
+    # find the first order of width at most tw in the subtree of n, unless a
+    # task before this one already found one
+    k, tw, n = task
+    state = _worker_state
+    winner = state['winner']
+
+    def abort(best_found, nodes_expanded):
+        return best_found[0] <= tw or winner.value < k
+
+    stats = {}
+    best_found = _branch_and_bound(list(state['adj']), state['alive'], [], 0, state['f'], (tw + 1, []),
+                                   branches=[n], abort=abort, shuffle=False, stats=stats,
+                                   table_size=state['table_size'], contraction=state['contraction'])
+    if best_found[0] <= tw:
+        with winner.get_lock():
+            if k < winner.value:
+                winner.value = k
+    return best_found, stats
+
+
+class _SearchNode(object):
+    # A node of the branch and bound search tree, for the subgraph induced by
+    # the bitset alive after eliminating x[:depth].
+    __slots__ = ('alive', 'g', 'f', 'children', 'mark', 'depth', 'last',
+                 'current6p2', 'prune6p4', 'explored6p4')
+
+    def __init__(self, alive, g, f, children, mark, depth):
+        self.alive = alive
+        self.g = g
+        self.f = f
+        self.children = iter(children)  # the vertices left to branch on
+        self.mark = mark  # length of the undo log on entry
+        self.depth = depth  # length of the partial order on entry
+        self.last = None  # the child being explored
+
+        # current6p2 is the list of prunable terms created while exploring
+        # the children of this node.  These terms are only used by its
+        # successors, so they are removed once it is finished.
+        self.current6p2 = []
+
+        # theorem6p4 checks for branches that can be pruned using Theorem
+        # 6.4. These terms are only used by the children of this node.
+        self.prune6p4, self.explored6p4 = _theorem6p4()
+
+
+def _rollback(adj, undo, mark):
+    """Restores the rows of adj recorded on the undo log after position mark."""
+    while len(undo) > mark:
+        v, neighbors = undo.pop()
+        adj[v] = neighbors
+
+
+# The branch and bound works on the adjacency of the graph given as a list of
+# integer bitsets, where bit u of adj[v] is set if u is a neighbor of v, and
+# on the set of remaining vertices given as a single bitset. Copying the
+# adjacency, intersecting neighborhoods and testing cliques are then done a
+# whole word of vertices at a time.
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(x):
+        return bin(x).count('1')
+
+
+def _bits(x):
+    """Yields the positions of the bits set in x, in increasing order."""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+def _elim_bits(adj, n, undo):
+    """Eliminates vertex n from the bitset adjacency adj, returning the
+    edges that were added (in both orientations) as a bitset, where bit
+    u * len(adj) + v represents the edge (u, v). The rows of adj that are
+    modified are recorded on the undo log.
+    """
+    num_nodes = len(adj)
+    neighbors = adj[n]
+    bit = 1 << n
+    new_edges = 0
+    for u in _bits(neighbors):
+        adj_u = adj[u]
+        undo.append((u, adj_u))
+        new = neighbors & ~adj_u & ~(1 << u)
+        if new:
+            new_edges |= new << (u * num_nodes)
+        adj[u] = (adj_u | new) & ~bit
+    undo.append((n, neighbors))
+    adj[n] = 0
+    return new_edges
+
+
+def _fill_bits(adj, n):
+    """The number of edges needed to make vertex n simplicial."""
+    neighbors = adj[n]
+    degree = _popcount(neighbors)
+    return (degree * (degree - 1) - sum(_popcount(adj[u] & neighbors) for u in _bits(neighbors))) // 2
+
+
+def _is_clique_bits(adj, nodes):
+    return all((adj[u] | (1 << u)) & nodes == nodes for u in _bits(nodes))
+
+
+def _is_almost_simplicial_bits(adj, n):
+    """Determines whether all but one of the neighbors of vertex n induce a
+    clique, see is_almost_simplicial.
+    """
+    neighbors = adj[n]
+    if not neighbors:
+        return False
+    for u in _bits(neighbors):
+        missing = neighbors & ~adj[u] & ~(1 << u)
+        if missing:
+            # every missing edge must be incident to the excluded neighbor,
+            # so it is either u or the only neighbor missing from u
+            if not missing & (missing - 1) and _is_clique_bits(adj, neighbors & ~missing):
+                return True
+            return _is_clique_bits(adj, neighbors & ~(1 << u))
+    return True
+
+
+def _minor_min_width_bits(adj, alive, contraction='least-c', ub=None):
+    """minor_min_width for the subgraph of the bitset adjacency adj induced
+    by the vertices in alive. If ub is given, stops as soon as the lower
+    bound reaches it.
+
+    The vertices are kept in buckets by degree, each a bitset, so that a
+    vertex of minimum degree is found without scanning all of them. The
+    minimum degree decreases by at most one with each contraction, as only
+    the common neighbors of the contracted vertices lose a neighbor.
+    """
+    adj = list(adj)
+    degree = [0] * len(adj)
+    remaining = 0
+    for v in _bits(alive):
+        degree[v] = _popcount(adj[v])
+        remaining += 1
+    buckets = [0] * max(1, remaining)
+    for v in _bits(alive):
+        buckets[degree[v]] |= 1 << v
+
+    lb = 0  # lower bound on treewidth
+    d = 0  # the minimum degree
+    while remaining > 1 and lb < remaining - 1:
+        if ub is not None and lb >= ub:
+            break
+
+        # get the node with the smallest degree
+        while not buckets[d]:
+            d += 1
+        bit_v = buckets[d] & -buckets[d]
+        v = bit_v.bit_length() - 1
+        buckets[d] ^= bit_v
+
+        neighbors = adj[v]
+
+        if not neighbors:
+            # if v is a singleton, then we can just delete it
+            remaining -= 1
+            continue
+
+        # update the lower bound
+        if d > lb:
+            lb = d
+
+        if contraction is None:
+            # delete v
+            for n in _bits(neighbors):
+                adj[n] &= ~bit_v
+                buckets[degree[n]] &= ~(1 << n)
+                degree[n] -= 1
+                buckets[degree[n]] |= 1 << n
+            remaining -= 1
+            d -= 1
+            continue
+
+        # choose the neighbor u to contract v into
+        if contraction == 'least-c':
+            # the fewest common neighbors with v
+            u = min(_bits(neighbors), key=lambda u: _popcount(adj[u] & neighbors))
+        else:
+            # 'min-d', the smallest degree
+            u = min(_bits(neighbors), key=degree.__getitem__)
+
+        # contract the edge between u, v into v, so that the common neighbors
+        # lose u and the other neighbors of u become neighbors of v
+        adj_u = adj[u]
+        bit_u = 1 << u
+        buckets[degree[u]] &= ~bit_u
+        for n in _bits(adj_u):
+            if n == v:
+                continue
+            if neighbors & (1 << n):
+                adj[n] &= ~bit_u
+                buckets[degree[n]] &= ~(1 << n)
+                degree[n] -= 1
+                buckets[degree[n]] |= 1 << n
+            else:
+                adj[n] = (adj[n] & ~bit_u) | bit_v
+        neighbors = (neighbors | adj_u) & ~(bit_u | bit_v)
+        adj[v] = neighbors
+        adj[u] = 0
+        degree[v] = _popcount(neighbors)
+        buckets[degree[v]] |= bit_v
+        remaining -= 1
+        d -= 1
+
+    return lb
+
+
+def _graph_reduction(adj, alive, x, g, f, undo):
     """we can go ahead and remove any simplicial or almost-simplicial vertices from adj.
     """
-    as_list = set()
-    as_nodes = {v for v in adj if len(adj[v]) <= f and is_almost_simplicial(adj, v)}
+    as_list = []
+    as_nodes = [v for v in _bits(alive) if _popcount(adj[v]) <= f and _is_almost_simplicial_bits(adj, v)]
     while as_nodes:
-        as_list.union(as_nodes)
         for n in as_nodes:
+            # eliminating the other nodes may have changed the neighborhood of n
+            dv = _popcount(adj[n])
+            if dv > f or not _is_almost_simplicial_bits(adj, n):
+                continue
 
             # update g and f
-            dv = len(adj[n])
             if dv > g:
                 g = dv
             if g > f:
@@ -685,59 +1558,171 @@ def _graph_reduction(adj, x, g, f):
 
             # eliminate v
             x.append(n)
-            _elim_adj(adj, n)
+            as_list.append(n)
+            _elim_bits(adj, n, undo)
+            alive &= ~(1 << n)
 
         # see if we have any more simplicial nodes
-        as_nodes = {v for v in adj if len(adj[v]) <= f and is_almost_simplicial(adj, v)}
+        as_nodes = [v for v in _bits(alive) if _popcount(adj[v]) <= f and _is_almost_simplicial_bits(adj, v)]
 
-    return g, f, as_list
+    return g, f, alive, as_list
 
 
-def _theorem5p4(adj, ub):
-    """By Theorem 5.4, if any two vertices have ub + 1 common neighbors
-    then we can add an edge between them.
+def _reduce_bits(adj, alive, low):
+    """Applies the reduction rules of treewidth_reduction to the subgraph of
+    the bitset adjacency adj induced by alive, in place. Returns the
+    vertices that remain, as a bitset, the vertices eliminated, in order,
+    and the lower bound.
     """
-    new_edges = set()
-    for u, v in itertools.combinations(adj, 2):
-        if u in adj[v]:
-            # already an edge
-            continue
+    order = []
+    undo = []  # the reductions are never rolled back
 
-        if len(adj[u].intersection(adj[v])) > ub:
-            new_edges.add((u, v))
+    def eliminate(v):
+        nonlocal alive
+        neighbors = adj[v]
+        _elim_bits(adj, v, undo)
+        del undo[:]
+        alive &= ~(1 << v)
+        order.append(v)
+
+        # the vertices whose neighborhood changed are the neighbors of v and,
+        # as edges were added between them, their neighbors
+        changed = neighbors
+        for u in _bits(neighbors):
+            changed |= adj[u]
+        push(changed & alive)
+
+    queued = 0
+    worklist = collections.deque()
+
+    def push(vertices):
+        nonlocal queued
+        vertices &= ~queued
+        queued |= vertices
+        worklist.extend(_bits(vertices))
+
+    push(alive)
+    while worklist:
+        v = worklist.popleft()
+        queued &= ~(1 << v)
+        if not alive & (1 << v):
+            continue
 
+        neighbors = adj[v]
+        degree = _popcount(neighbors)
+
+        if _is_clique_bits(adj, neighbors):
+            # simplicial rule
+            eliminate(v)
+            if degree > low:
+                # the rules that depend on the lower bound may now apply
+                # to any vertex
+                low = degree
+                push(alive)
+
+        elif degree <= low and _is_almost_simplicial_bits(adj, v):
+            # almost simplicial rule
+            eliminate(v)
+
+        elif degree == 3 and low >= 3:
+            # buddy rule: another vertex with the same neighbors
+            common = alive & ~(1 << v)
+            for u in _bits(neighbors):
+                common &= adj[u]
+            for w in _bits(common):
+                if adj[w] == neighbors:
+                    eliminate(v)
+                    eliminate(w)
+                    break
+            else:
+                # cube rule: v is a corner of a cube whose opposite corner
+                # may have any degree, and the neighbors of v have degree 3
+                # and share one other neighbor in each pair
+                others = [adj[u] & ~(1 << v) for u in _bits(neighbors)]
+                if all(_popcount(other) == 2 for other in others):
+                    a, b, c = others
+                    if (a != b and b != c and a != c and not (a | b | c) & neighbors
+                            and _popcount(a | b | c) == 3):
+                        for u in _bits(neighbors):
+                            eliminate(u)
+                        eliminate(v)
+
+    return alive, order, low
+
+
+def _theorem5p4(adj, alive, ub, undo):
+    """By Theorem 5.4, if any two vertices have ub + 1 common neighbors
+    then we can add an edge between them. Returns the number of edges added.
+    """
+    # adding an edge only increases the number of common neighbors of other
+    # pairs, so the edges added do not depend on the order in which the
+    # pairs are examined. Every pair is examined once, and then only the
+    # pairs whose common neighbors are changed by a new edge.
+
+    # a vertex with ub neighbors or less cannot have ub + 1 common neighbors
+    # with another one
+    candidates = 0
+    for u in _bits(alive):
+        if _popcount(adj[u]) > ub:
+            candidates |= 1 << u
+
+    new_edges = []
+    for u in _bits(candidates):
+        adj_u = adj[u]
+        # the candidates after u that are not adjacent to it
+        for v in _bits(candidates & ~adj_u & -(2 << u)):
+            if _popcount(adj_u & adj[v]) > ub:
+                new_edges.append((u, v))
+
+    num_edges = 0
     while new_edges:
-        for u, v in new_edges:
-            adj[u].add(v)
-            adj[v].add(u)
-
-        new_edges = set()
-        for u, v in itertools.combinations(adj, 2):
-            if u in adj[v]:
-                continue
-
-            if len(adj[u].intersection(adj[v])) > ub:
-                new_edges.add((u, v))
-
-
-def _theorem6p1():
-    """See Theorem 6.1 in paper."""
+        u, v = new_edges.pop()
+        if adj[u] >> v & 1:
+            continue
 
-    pruning_set = set()
+        undo.append((u, adj[u]))
+        adj[u] |= 1 << v
+        undo.append((v, adj[v]))
+        adj[v] |= 1 << u
+        num_edges += 1
+
+        # u is now a common neighbor of v and each of its neighbors, and
+        # vice versa
+        for a, b in ((u, v), (v, u)):
+            adj_a = adj[a]
+            for c in _bits(adj[b] & ~adj_a & ~(1 << a)):
+                if _popcount(adj_a & adj[c]) > ub:
+                    new_edges.append((a, c))
+
+    return num_edges
+
+
+def _theorem6p1(size):
+    """See Theorem 6.1 in paper.
+    Prunes (s,b,a) when (s,a,b) is explored and a, b are not adjacent, as the
+    subgraph and the width are then the same. More generally, the subgraph
+    only depends on the set of vertices eliminated, so this prunes any
+    branch that reaches the same subgraph as an explored one with a width
+    that is not smaller. The subgraphs are remembered in a transposition
+    table keyed by the bitset of the remaining vertices, of which only the
+    size most recently seen are kept.
+    """
+    table = collections.OrderedDict()  # alive: smallest g
 
-    def _prune(x):
-        if len(x) <= 2:
+    def _prune(alive, g):
+        if not size:
             return False
-        # this is faster than tuple(x[-3:])
-        key = (tuple(x[:-2]), x[-2], x[-1])
-        return key in pruning_set
-
-    def _explored(x):
-        if len(x) >= 3:
-            prunable = (tuple(x[:-2]), x[-1], x[-2])
-            pruning_set.add(prunable)
+        seen = table.get(alive)
+        if seen is not None:
+            table.move_to_end(alive)
+            if seen <= g:
+                return True
+        table[alive] = g
+        if len(table) > size:
+            table.popitem(last=False)
+        return False
 
-    return _prune, _explored
+    return _prune
 
 
 def _theorem6p2():
@@ -747,15 +1732,14 @@ def _theorem6p2():
     pruning_set2 = set()
 
     def _prune2(x, a, nbrs_a):
-        frozen_nbrs_a = frozenset(nbrs_a)
         for i in range(len(x)):
-            key = (tuple(x[0:i]), a, frozen_nbrs_a)
+            key = (tuple(x[0:i]), a, nbrs_a)
             if key in pruning_set2:
                 return True
         return False
 
     def _explored2(x, a, nbrs_a):
-        prunable = (tuple(x), a, frozenset(nbrs_a))  # (s,a,N(a))
+        prunable = (tuple(x), a, nbrs_a)  # (s,a,N(a))
         pruning_set2.add(prunable)
         return prunable
 
@@ -766,22 +1750,22 @@ def _theorem6p2():
 
 
 def _theorem6p3():
-    """See Theorem 6.3 in paper.
-    Prunes (s,b) when (s,a) is explored, b (almost) simplicial in (s,a), and a (almost) simplicial in (s,b)
+    """See Theorem 6.3 in paper. Currently unused, see _branch_and_bound.
+    Prunes (s,b) when (s,a) is explored, b (almost) simplicial in (s,a), and a (almost) simplicial in (s,b).
+    As for Theorem 6.4, we only record (a,b) rather than (s,a,b)
+    because we only need to check for pruning in the same s context.
     """
     pruning_set3 = set()
 
-    def _prune3(x, as_list, b):
+    def _prune3(as_list, b):
         for a in as_list:
-            key = (tuple(x), a, b)  # (s,a,b) with (s,a) explored
-            if key in pruning_set3:
+            if (a, b) in pruning_set3:  # (s,a,b) with (s,a) explored
                 return True
         return False
 
-    def _explored3(x, a, as_list):
+    def _explored3(a, as_list):
         for b in as_list:
-            prunable = (tuple(x), a, b)  # (s,a,b) with (s,a) explored
-            pruning_set3.add(prunable)
+            pruning_set3.add((a, b))  # (s,a,b) with (s,a) explored
 
     return _prune3, _explored3
 
@@ -798,7 +1782,7 @@ def _theorem6p4():
 
     def _prune4(edges_b):
         for edges_a in pruning_set4:
-            if edges_a.issubset(edges_b):
+            if not edges_a & ~edges_b:
                 return True
         return False
 
@@ -955,3 +1939,264 @@ def zephyr_elimination_order(m, t=4, coordinates=False):
     else:
         return list(zephyr_coordinates(m).iter_zephyr_to_linear(order))
 
+
+
+def chimera_torus_elimination_order(m, n=None, t=4):
+    """Provides a variable elimination order for a Chimera torus.
+
+    The order sweeps the torus across its longer dimension, as
+    :func:`.chimera_elimination_order` does for the Chimera graph, eliminating
+    the qubits of the shorter dimension, one line of tiles at a time, and
+    then the others. The couplers across the boundary keep the first line
+    connected to the last one, so the width of the order, an upper bound on
+    the treewidth of ``chimera_torus(m, n, t)``, is at most
+    :math:`2t\\min(m, n)`, twice the treewidth of the Chimera graph.
+
+    Parameters
+    ----------
+    m : int
+        Number of rows in the Chimera torus lattice.
+    n : int (optional, default m)
+        Number of columns in the Chimera torus lattice.
+    t : int (optional, default 4)
+        Size of the shore within each Chimera tile.
+
+    Returns
+    -------
+    order : list
+        An elimination order of chimera_torus(m, n, t), in 4-term Chimera
+        coordinates.
+
+    Examples
+    --------
+    >>> G = dnx.chimera_torus(4, 6)
+    >>> order = dnx.chimera_torus_elimination_order(4, 6)
+    >>> dnx.elimination_order_width(G, order)
+    32
+
+    """
+    if n is None:
+        n = m
+
+    if m <= n:
+        # vertical qubits, column by column, then the horizontal qubits
+        return ([(i, j, 0, k) for j in range(n) for k in range(t) for i in range(m)]
+                + [(i, j, 1, k) for j in range(n) for i in range(m) for k in range(t)])
+    else:
+        # horizontal qubits, row by row, then the vertical qubits
+        return ([(i, j, 1, k) for i in range(m) for k in range(t) for j in range(n)]
+                + [(i, j, 0, k) for i in range(m) for j in range(n) for k in range(t)])
+
+
+def pegasus_torus_elimination_order(m):
+    """Provides a variable elimination order for a Pegasus torus.
+
+    The order is the order of :func:`.pegasus_elimination_order` on the
+    tiles of the torus: vertical qubits are eliminated one column at a time,
+    and horizontal qubits once their adjacent vertical qubits have been. Its
+    width, an upper bound on the treewidth of ``pegasus_torus(m)``, is at
+    most :math:`24(m - 1)`, twice the number of vertical qubits in a column.
+
+    Parameters
+    ----------
+    m : int
+        Size parameter for the Pegasus lattice.
+
+    Returns
+    -------
+    order : list
+        An elimination order of pegasus_torus(m), in 4-term Pegasus
+        coordinates.
+
+    Examples
+    --------
+    >>> G = dnx.pegasus_torus(4)
+    >>> order = dnx.pegasus_torus_elimination_order(4)
+    >>> dnx.elimination_order_width(G, order)
+    72
+
+    """
+    # the torus has m - 1 tiles in each dimension, the boundary qubits of
+    # pegasus_graph(m) being identified with the first ones
+    l = 12
+
+    # ordering for horizontal qubits in each tile, from east to west:
+    h_order = [4, 5, 6, 7, 0, 1, 2, 3, 8, 9, 10, 11]
+    order = []
+    for n_i in range(m):  # for each tile offset
+        for l_i in range(0, l, 2):
+            # eliminate vertical qubits:
+            if n_i < m - 1:
+                for l_v in range(l_i, l_i + 2):
+                    for m_i in range(m - 1):  # for each column
+                        order.append((0, n_i, l_v, m_i))
+            # eliminate horizontal qubits:
+            if n_i > 0 and not(l_i % 4):
+                for m_i in range(m - 1):
+                    for l_h in range(h_order[l_i], h_order[l_i] + 4):
+                        order.append((1, m_i, l_h, n_i - 1))
+    return order
+
+
+def zephyr_torus_elimination_order(m, t=4):
+    """Provides a variable elimination order for a Zephyr torus.
+
+    The order is the order of :func:`.zephyr_elimination_order` on the
+    tiles of the torus: vertical qubits are eliminated one column at a time,
+    then the horizontal qubits from top to bottom. Its width, an upper bound
+    on the treewidth of ``zephyr_torus(m, t)``, is at most :math:`8tm`,
+    twice the number of vertical qubits in a column.
+
+    Parameters
+    ----------
+    m : int
+        Grid parameter for the Zephyr lattice.
+    t : int (optional, default 4)
+        Tile parameter for the Zephyr lattice.
+
+    Returns
+    -------
+    order : list
+        An elimination order of zephyr_torus(m, t), in 5-term Zephyr
+        coordinates.
+
+    Examples
+    --------
+    >>> G = dnx.zephyr_torus(3)
+    >>> order = dnx.zephyr_torus_elimination_order(3)
+    >>> dnx.elimination_order_width(G, order)
+    96
+
+    """
+    # the torus has 2m columns of qubits in each orientation, the boundary
+    # qubits of zephyr_graph(m, t) being identified with the first ones
+    return ([(0, w, k, j, z) for w in range(2*m) for k in range(t) for z in range(m) for j in range(2)]
+            + [(1, w, k, j, z) for z in range(m) for j in range(2) for w in range(2*m) for k in range(t)])
+
+
+def working_graph_elimination_order(G, window=1):
+    """Provides a variable elimination order for a Chimera, Pegasus or
+    Zephyr graph with missing nodes or edges, such as the working graph of
+    a quantum processor.
+
+    The elimination order of the perfect graph of the same family and
+    shape (see :func:`.chimera_elimination_order`,
+    :func:`.pegasus_elimination_order` and :func:`.zephyr_elimination_order`,
+    or :func:`.chimera_torus_elimination_order` and its equivalents for
+    tori) is restricted to the nodes of G. Eliminating nodes from a subgraph adds
+    no more edges than from the perfect graph, so the width of the order is
+    at most the width of the perfect order.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A graph constructed by :func:`.chimera_graph`, :func:`.pegasus_graph`
+        or :func:`.zephyr_graph`, or by the torus generators, possibly with
+        missing nodes and edges.
+
+    window : int (optional, Default 1)
+        If greater than 1, the order is also improved locally: the node
+        eliminated at each step is the node of minimum fill (see
+        :func:`.min_fill_heuristic`) among the next `window` nodes of the
+        restricted order, rather than the next node. The improved order is
+        returned unless it is wider than the restricted order.
+
+    Returns
+    -------
+    treewidth_upper_bound : int
+        The width of the order, computed as the nodes are eliminated.
+
+    order : list
+        An elimination order of the nodes of G.
+
+    Examples
+    --------
+    >>> G = dnx.chimera_graph(4)
+    >>> G.remove_nodes_from([0, 17, 42])
+    >>> tw, order = dnx.working_graph_elimination_order(G)
+    >>> tw
+    16
+
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer")
+
+    metadata = G.graph
+    family = metadata.get('family')
+    to_linear, __, __ = _label_conversions(metadata)
+
+    if metadata.get('boundary_condition') == 'torus':
+        # tori are labelled by coordinates
+        if family == 'chimera':
+            order = chimera_torus_elimination_order(metadata['rows'], metadata['columns'], metadata['tile'])
+        elif family == 'pegasus':
+            order = pegasus_torus_elimination_order(metadata['rows'])
+        else:
+            order = zephyr_torus_elimination_order(metadata['rows'], metadata['tile'])
+        perfect = map(to_linear, order)
+    elif family == 'chimera':
+        perfect = chimera_elimination_order(metadata['rows'], metadata['columns'], metadata['tile'])
+    elif family == 'pegasus':
+        order = pegasus_elimination_order(metadata['rows'], coordinates=True)
+        perfect = pegasus_coordinates(metadata['rows']).iter_pegasus_to_linear(order)
+    elif family == 'zephyr':
+        order = zephyr_elimination_order(metadata['rows'], metadata['tile'], coordinates=True)
+        perfect = zephyr_coordinates(metadata['rows'], metadata['tile']).iter_zephyr_to_linear(order)
+    else:
+        raise ValueError("G must be constructed by chimera_graph, pegasus_graph or zephyr_graph")
+
+    # the nodes of G in the perfect order, followed by any node it misses
+    if to_linear is None:
+        remaining = {v: v for v in G}
+    else:
+        remaining = {to_linear(v): v for v in G}
+    nodes = [remaining.pop(q) for q in perfect if q in remaining]
+    nodes.extend(remaining.values())
+
+    # we need only deal with the adjacency structure of G, as bitsets over
+    # the positions of the nodes in the restricted order
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = [sum(1 << index[u] for u in G[v] if u != v) for v in nodes]
+
+    width, order = _windowed_order(list(adj), 1)
+    if window > 1:
+        polished = _windowed_order(adj, window)
+        if polished[0] <= width:
+            width, order = polished
+
+    return width, [nodes[i] for i in order]
+
+
+def _windowed_order(adj, window):
+    # eliminate the vertices of the bitset adjacency adj, in place, each
+    # chosen among the next window vertices, and return the width and the
+    # order
+    width = 0
+    order = []
+    candidates = []  # the next (at most) window vertices
+    for i in range(len(adj)):
+        candidates.append(i)
+        if len(candidates) == window:
+            width = _eliminate_candidate(adj, candidates, order, width)
+    while candidates:
+        width = _eliminate_candidate(adj, candidates, order, width)
+    return width, order
+
+
+def _eliminate_candidate(adj, candidates, order, width):
+    # eliminate the candidate of minimum fill, the first one on ties, and
+    # return the width of the order so far
+    if len(candidates) > 1:
+        k = min(range(len(candidates)), key=lambda k: _fill_bits(adj, candidates[k]))
+    else:
+        k = 0
+    n = candidates.pop(k)
+
+    neighbors = adj[n]
+    bit = 1 << n
+    for u in _bits(neighbors):
+        adj[u] = (adj[u] | neighbors) & ~(bit | (1 << u))
+    adj[n] = 0
+    order.append(n)
+
+    return max(width, _popcount(neighbors))
@@ -0,0 +1,249 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import networkx as nx
+import numpy as np
+
+__all__ = ['TreeDecomposition',
+           'junction_tree',
+           'tree_decomposition',
+           ]
+
+
+class TreeDecomposition(object):
+    """A tree decomposition of a graph, stored as arrays.
+
+    The variables of the decomposition are the nodes of the graph, indexed
+    by their position in the elimination order that induced it. Bag ``i``
+    is the array of variables ``indices[indptr[i]:indptr[i + 1]]``, which
+    is split into the variables that are eliminated in bag ``i`` (the
+    variables that appear in no other bag above it), followed by its
+    separator, the variables it shares with its parent bag.
+
+    Bags are listed children first, so that a dynamic program over the
+    tree can process the bags in order, eliminating the variables of each
+    bag and passing a message over its separator to its parent.
+
+    Attributes
+    ----------
+    nodes : list
+        The nodes of the graph, in elimination order.
+    indptr : numpy.ndarray
+        The bags, in compressed sparse row format, as for
+        :class:`scipy.sparse.csr_matrix`.
+    indices : numpy.ndarray
+        The variables of the bags.
+    sepptr : numpy.ndarray
+        The separator of bag ``i`` is ``indices[sepptr[i]:indptr[i + 1]]``.
+    parent : numpy.ndarray
+        The parent of each bag, or -1 for the root of each tree.
+
+    """
+    def __init__(self, nodes, indptr, indices, sepptr, parent):
+        self.nodes = nodes
+        self.indptr = indptr
+        self.indices = indices
+        self.sepptr = sepptr
+        self.parent = parent
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self):
+        return '<{} with {} bags of width {}>'.format(type(self).__name__, len(self), self.width)
+
+    @property
+    def width(self):
+        """The width of the decomposition, the size of its largest bag
+        minus one."""
+        if not len(self):
+            return 0
+        return int(np.diff(self.indptr).max()) - 1
+
+    def _labels(self, variables):
+        nodes = self.nodes
+        return [nodes[v] for v in variables.tolist()]
+
+    def bag(self, i):
+        """The nodes in bag i."""
+        return self._labels(self.indices[self.indptr[i]:self.indptr[i + 1]])
+
+    def eliminated(self, i):
+        """The nodes of bag i which are in no bag above it."""
+        return self._labels(self.indices[self.indptr[i]:self.sepptr[i]])
+
+    def separator(self, i):
+        """The nodes bag i shares with its parent."""
+        return self._labels(self.indices[self.sepptr[i]:self.indptr[i + 1]])
+
+    def to_networkx_graph(self):
+        """Returns the decomposition as a NetworkX graph whose nodes are
+        the bags, as frozensets, as in :mod:`networkx.algorithms.approximation.treewidth`."""
+        bags = [frozenset(self.bag(i)) for i in range(len(self))]
+        T = nx.Graph()
+        T.add_nodes_from(bags)
+        T.add_edges_from((bags[i], bags[p]) for i, p in enumerate(self.parent.tolist()) if p >= 0)
+        return T
+
+
+def tree_decomposition(G, order):
+    """Computes the tree decomposition of a graph induced by an elimination
+    order.
+
+    Bag ``i`` of the decomposition contains the ``i``-th node of the order,
+    eliminated in that bag, and its neighbors when it is eliminated, which
+    form its separator. The parent of bag ``i`` is the bag of the first
+    of these neighbors to be eliminated.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph to decompose.
+
+    order : list
+        The elimination order. Must be a list of all of the variables
+        in G.
+
+    Returns
+    -------
+    decomposition : :class:`TreeDecomposition`
+        A decomposition with one bag for each node of G. Its width is the
+        width of the elimination order, see :func:`.elimination_order_width`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> td = dnx.tree_decomposition(G, [0, 1, 2, 3])
+    >>> td.bag(0), td.separator(0)
+    ([0, 1], [1])
+    >>> td.parent.tolist()
+    [1, 2, 3, -1]
+
+    """
+    nodes = list(order)
+    index = {v: i for i, v in enumerate(nodes)}
+
+    # we need only deal with the adjacency structure of G, as the positions
+    # of the nodes in order
+    adj = {}
+    for v in G:
+        try:
+            adj[index[v]] = set(index[u] for u in G[v] if u != v)
+        except KeyError:
+            raise ValueError('not all nodes in G were in order')
+    if len(adj) < len(nodes):
+        for v in nodes:
+            if v not in G:
+                raise ValueError('{} is in order but not in G'.format(v))
+        raise ValueError('order contains duplicates')
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = []
+    parent = np.full(len(nodes), -1, dtype=np.int64)
+
+    for i in range(len(nodes)):
+        neighbors = adj.pop(i)
+
+        # eliminate i by making it simplicial
+        for u in neighbors:
+            nbrs_u = adj[u]
+            nbrs_u |= neighbors
+            nbrs_u.discard(u)
+            nbrs_u.discard(i)
+
+        separator = sorted(neighbors)
+        indices.append(i)
+        indices.extend(separator)
+        indptr[i + 1] = len(indices)
+        if separator:
+            parent[i] = separator[0]
+
+    indices = np.asarray(indices, dtype=np.int64)
+    return TreeDecomposition(nodes, indptr, indices, indptr[:-1] + 1, parent)
+
+
+def junction_tree(G, order):
+    """Computes the junction tree of a graph induced by an elimination order.
+
+    The junction tree is the tree decomposition of :func:`tree_decomposition`
+    where each bag that is contained in one of its children is merged into
+    it, so that the bags are the maximal cliques of the triangulation of G
+    induced by the order.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph to decompose.
+
+    order : list
+        The elimination order. Must be a list of all of the variables
+        in G.
+
+    Returns
+    -------
+    decomposition : :class:`TreeDecomposition`
+        A decomposition whose bags are not contained in one another. The
+        variables eliminated in each bag are listed in elimination order.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(5)
+    >>> jt = dnx.junction_tree(G, range(5))
+    >>> [jt.bag(i) for i in range(len(jt))]
+    [[0, 1, 4], [1, 2, 4], [2, 3, 4]]
+    >>> jt.separator(0)
+    [1, 4]
+
+    """
+    td = tree_decomposition(G, order)
+    indptr = td.indptr
+    parent = td.parent.tolist()
+    size = np.diff(indptr).tolist()
+
+    # the bag of node p is contained in the bag of its child i exactly when
+    # it is one smaller, as the separator of i then is the bag of p. Each
+    # node is merged into the bag that contains its first merged descendant
+    root = list(range(len(parent)))  # the bag each node is merged into
+    merged = [False] * len(parent)
+    for i, p in enumerate(parent):
+        if p >= 0 and not merged[p] and size[p] == size[i] - 1:
+            merged[p] = True
+            root[p] = root[i]
+
+    # the bags are listed by the last node merged into them, which comes
+    # after all of the nodes of their children
+    tops = [i for i, p in enumerate(parent) if p < 0 or root[p] != root[i]]
+    bag_of = {}
+    for k, t in enumerate(tops):
+        bag_of[root[t]] = k
+
+    new_indptr = np.zeros(len(tops) + 1, dtype=np.int64)
+    new_sepptr = np.empty(len(tops), dtype=np.int64)
+    new_parent = np.full(len(tops), -1, dtype=np.int64)
+    indices = []
+    for k, t in enumerate(tops):
+        # the bag of the first node merged into it holds the nodes merged,
+        # which are eliminated in this bag, followed by the separator of t
+        r = root[t]
+        sep = td.indices[td.sepptr[t]:indptr[t + 1]].tolist()
+        eliminated = [v for v in td.indices[indptr[r]:indptr[r + 1]].tolist() if v not in sep]
+        indices.extend(eliminated)
+        new_sepptr[k] = len(indices)
+        indices.extend(sep)
+        new_indptr[k + 1] = len(indices)
+        if parent[t] >= 0:
+            new_parent[k] = bag_of[root[parent[t]]]
+
+    indices = np.asarray(indices, dtype=np.int64)
+    return TreeDecomposition(td.nodes, new_indptr, indices, new_sepptr, new_parent)
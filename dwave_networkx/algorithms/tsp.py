@@ -12,15 +12,17 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import itertools
-
-from collections import defaultdict
+import dimod
+import networkx as nx
+import numpy as np
 
 from dwave_networkx.utils import binary_quadratic_model_sampler
 
 __all__ = ["traveling_salesperson",
+           "traveling_salesperson_bqm",
            "traveling_salesperson_qubo",
            "traveling_salesman",
+           "traveling_salesman_bqm",
            "traveling_salesman_qubo",
            "is_hamiltonian_path",
            ]
@@ -28,7 +30,7 @@ __all__ = ["traveling_salesperson",
 
 @binary_quadratic_model_sampler(1)
 def traveling_salesperson(G, sampler=None, lagrange=None, weight='weight',
-                          start=None, **sampler_args):
+                          start=None, skip_missing_edges=False, **sampler_args):
     """Returns an approximate minimum traveling salesperson route.
 
     Defines a QUBO with ground states corresponding to the
@@ -62,7 +64,18 @@ def traveling_salesperson(G, sampler=None, lagrange=None, weight='weight',
         The name of the edge attribute containing the weight.
 
     start : node, optional
-        If provided, the route will begin at `start`.
+        If provided, the route will begin at `start`. The start is then
+        fixed at time 0 and is not a variable, so the sampler is given the
+        reduced binary quadratic model of :func:`.traveling_salesperson_bqm`
+        with :math:`(|G| - 1)^2` variables rather than :math:`|G|^2`, whose
+        offset of :math:`-2 \\lambda`, for lagrange parameter
+        :math:`\\lambda`, gives each route the same energy as in the full
+        model. The embedding and timing of the problem on the sampler change
+        accordingly.
+
+    skip_missing_edges : bool, optional (default False)
+        If True, cities that are not adjacent in `G` are not coupled, see
+        :func:`.traveling_salesperson_bqm`.
 
     sampler_args :
         Additional keyword parameters are passed to the sampler.
@@ -90,15 +103,19 @@ def traveling_salesperson(G, sampler=None, lagrange=None, weight='weight',
     sample.
 
     """
-    # Get a QUBO representation of the problem
-    Q = traveling_salesperson_qubo(G, lagrange, weight)
+    # Get a BQM representation of the problem
+    bqm = traveling_salesperson_bqm(G, lagrange, weight, start=start,
+                                    skip_missing_edges=skip_missing_edges)
 
     # use the sampler to find low energy states
-    response = sampler.sample_qubo(Q, **sampler_args)
+    response = sampler.sample(bqm, **sampler_args)
 
     sample = response.first.sample
 
     route = [None]*len(G)
+    if start is not None:
+        # the start is not a variable of the bqm
+        route[0] = start
     for (city, time), val in sample.items():
         if val:
             route[time] = city
@@ -114,42 +131,185 @@ def traveling_salesperson(G, sampler=None, lagrange=None, weight='weight',
 traveling_salesman = traveling_salesperson
 
 
-def traveling_salesperson_qubo(G, lagrange=None, weight='weight', missing_edge_weight=None):
-    """Return the QUBO with ground states corresponding to a minimum TSP route.
+def traveling_salesperson_bqm(G, lagrange=None, weight='weight', missing_edge_weight=None,
+                              start=None, skip_missing_edges=False):
+    """Return a binary quadratic model with ground states corresponding to a
+    minimum TSP route.
 
-    If :math:`|G|` is the number of nodes in the graph, the resulting qubo will have:
+    If :math:`|G|` is the number of nodes in the graph, the resulting BQM
+    will have:
 
     * :math:`|G|^2` variables/nodes
     * :math:`2 |G|^2 (|G| - 1)` interactions/edges
 
+    Fixing the `start` city leaves :math:`(|G| - 1)^2` variables, and
+    skipping the missing edges of a sparse graph drops the interactions
+    between the cities that are not adjacent. Either way, every route has
+    the same energy relative to the other routes as in the full BQM.
+
     Parameters
     ----------
-    G : NetworkX graph
-        A complete graph in which each edge has a attribute giving its weight.
+    G : NetworkX graph or array_like
+        A complete graph in which each edge has a attribute giving its weight,
+        or a square matrix whose entry ``(i, j)`` is the weight of going from
+        city ``i`` to city ``j``, the cities being labelled by their index.
 
     lagrange : number, optional (default None)
-        Lagrange parameter to weight constraints (no edges within set)
-        versus objective (largest set possible).
+        Lagrange parameter to weight constraints (visit every city once)
+        versus objective (shortest distance route).
 
     weight : optional (default 'weight')
         The name of the edge attribute containing the weight.
-    
+
     missing_edge_weight : number, optional (default None)
         For bi-directional graphs, the weight given to missing edges.
         If None is given (the default), missing edges will be set to
         the sum of all weights.
 
+    start : node, optional (default None)
+        If provided, the route begins at `start`, which is visited at time
+        0 and is not a variable of the BQM. An offset of :math:`-2 \\lambda`,
+        for lagrange parameter :math:`\\lambda`, gives each route the same
+        energy as in the full BQM.
+
+    skip_missing_edges : bool, optional (default False)
+        If True, the interactions between cities that are not adjacent in
+        `G` are omitted. Every leg of a route is charged
+        `missing_edge_weight` in the offset and refunded along the edges of
+        `G`, which keeps the energy of every route. The lagrange parameter
+        should then be larger than `missing_edge_weight`, which the default
+        is.
+
     Returns
     -------
-    QUBO : dict
-       The QUBO with ground states corresponding to a minimum travelling
-       salesperson route. The QUBO variables are labelled `(c, t)` where `c`
-       is a node in `G` and `t` is the time index. For instance, if `('a', 0)`
-       is 1 in the ground state, that means the node 'a' is visted first.
+    bqm : :class:`dimod.BinaryQuadraticModel`
+       The BQM with ground states corresponding to a minimum travelling
+       salesperson route. The variables are labelled `(c, t)` where `c`
+       is a node in `G` and `t` is the time index. Without `start` and
+       `skip_missing_edges`, it has the same energies as the QUBO of
+       :func:`.traveling_salesperson_qubo`.
+
+    Raises
+    ------
+    ValueError
+        If `G` is a matrix that is not square, if it has 1 or 2 cities, or if
+        `start` is not a city.
+
+    Examples
+    --------
+    >>> D = [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
+    >>> bqm = dnx.traveling_salesperson_bqm(D, lagrange=10)
+    >>> len(bqm), len(bqm.quadratic)
+    (9, 36)
+    >>> bqm = dnx.traveling_salesperson_bqm(D, lagrange=10, start=0)
+    >>> len(bqm), len(bqm.quadratic)
+    (4, 6)
 
     """
-    N = G.number_of_nodes()
+    labels, linear, quadratic, offset = _tsp_vectors(G, lagrange, weight, missing_edge_weight,
+                                                     start, skip_missing_edges)
+    return dimod.BinaryQuadraticModel.from_numpy_vectors(linear, quadratic, offset, dimod.BINARY,
+                                                         variable_order=labels)
+
+
+def _tsp_vectors(G, lagrange, weight, missing_edge_weight, start=None, skip_missing_edges=False):
+    # the labels, linear biases, (irow, icol, qdata) quadratic biases and
+    # offset of the TSP QUBO, where each pair of variables appears once
+    default_lagrange = lagrange is None
+    if isinstance(G, nx.Graph):
+        nodes = list(G)
+        W, adjacent, lagrange, missing_edge_weight = _weight_matrix(G, lagrange, weight, missing_edge_weight)
+    else:
+        W = np.asarray(G, dtype=float)
+        if W.ndim != 2 or W.shape[0] != W.shape[1]:
+            raise ValueError("the weights must be a square matrix")
+        nodes = list(range(W.shape[0]))
+        adjacent = ~np.eye(len(nodes), dtype=bool)
+        missing_edge_weight = 0.0  # no edge is missing
+        if lagrange is None:
+            # the 'average' tour length, as for graphs
+            lagrange = (W.sum() - W.trace()) / (len(nodes) - 1) if len(nodes) > 1 else 2
+
+    N = len(nodes)
 
+    # some input checking
+    if N in (1, 2):
+        msg = "graph must have at least 3 nodes or be empty"
+        raise ValueError(msg)
+
+    offset = 0.0
+    if skip_missing_edges:
+        # every route has N legs. Charging each one missing_edge_weight,
+        # refunded along edges, keeps the energy of every route, but only
+        # couples the cities that are adjacent
+        W = W - missing_edge_weight
+        offset += N*missing_edge_weight
+        if default_lagrange:
+            # the shifted weights reward extra visits, which the constraints
+            # must outweigh
+            lagrange += missing_edge_weight
+    else:
+        adjacent = ~np.eye(N, dtype=bool)
+
+    if start is None:
+        cities = np.arange(N)
+        first_time = 0
+    else:
+        try:
+            s = nodes.index(start)
+        except ValueError:
+            raise ValueError("start {!r} is not a city".format(start)) from None
+        # the start is not a variable, it is visited at time 0 and the other
+        # cities at times 1 to N - 1
+        cities = np.delete(np.arange(N), s)
+        first_time = 1
+        # the constraints of the start are satisfied, the constant terms of
+        # the constraints are dropped as for the other cities
+        offset -= 2.0*lagrange
+
+    # variable (cities[i], first_time + t) is the index i*K + t of the arrays
+    K = len(cities)
+    positions = np.arange(K)
+    labels = [(nodes[c], first_time + t) for c in cities.tolist() for t in range(K)]
+
+    # Constraints that each row and each col has exactly one 1
+    linear = np.full(K*K, -2.0*lagrange)
+
+    # pairs of distinct times (or cities)
+    first, second = np.triu_indices(K, 1)
+
+    # Constraint that each row has exactly one 1: each city at two times
+    row_i = (positions[:, None]*K + first).ravel()
+    row_j = (positions[:, None]*K + second).ravel()
+
+    # Constraint that each col has exactly one 1: two cities at each time
+    col_i = (first[:, None]*K + positions).ravel()
+    col_j = (second[:, None]*K + positions).ravel()
+
+    # Objective that minimizes distance: going from u at t to v at t + 1,
+    # back to time 0 unless the start is fixed
+    u, v = np.nonzero(adjacent[np.ix_(cities, cities)])
+    times = positions if start is None else positions[:-1]
+    obj_i = (u[:, None]*K + times).ravel()
+    obj_j = (v[:, None]*K + (times + 1) % K).ravel()
+    obj = np.repeat(W[cities[u], cities[v]], len(times))
+
+    if start is not None:
+        # going from the start to the first city and from the last city back
+        linear[positions*K] += np.where(adjacent[s, cities], W[s, cities], 0)
+        linear[positions*K + K - 1] += np.where(adjacent[cities, s], W[cities, s], 0)
+
+    irow = np.concatenate((row_i, col_i, obj_i))
+    icol = np.concatenate((row_j, col_j, obj_j))
+    qdata = np.concatenate((np.full(len(row_i) + len(col_i), 2.0*lagrange), obj))
+
+    return labels, linear, (irow, icol, qdata), offset
+
+
+def _weight_matrix(G, lagrange, weight, missing_edge_weight):
+    # the matrix of the weights of going from one node of G to another, in
+    # the order of G, the mask of the edges that have a weight, the lagrange
+    # parameter and the missing_edge_weight
     if lagrange is None:
         # If no lagrange parameter provided, set to 'average' tour length.
         # Usually a good estimate for a lagrange parameter is between 75-150%
@@ -165,54 +325,63 @@ def traveling_salesperson_qubo(G, lagrange=None, weight='weight', missing_edge_w
         # networkx method to calculate sum of all weights
         missing_edge_weight = G.size(weight=weight)
 
-    # some input checking
-    if N in (1, 2):
-        msg = "graph must have at least 3 nodes or be empty"
-        raise ValueError(msg)
+    index = {v: i for i, v in enumerate(G)}
+    W = np.full((len(index), len(index)), float(missing_edge_weight))
+    adjacent = np.zeros(W.shape, dtype=bool)
+    for u, v, value in G.edges(data=weight):
+        if value is None or u == v:
+            continue
+        W[index[u], index[v]] = value
+        adjacent[index[u], index[v]] = True
+        if not G.is_directed():
+            W[index[v], index[u]] = value
+            adjacent[index[v], index[u]] = True
+    return W, adjacent, lagrange, missing_edge_weight
 
-    # Creating the QUBO
-    Q = defaultdict(float)
-
-    # Constraint that each row has exactly one 1
-    for node in G:
-        for pos_1 in range(N):
-            Q[((node, pos_1), (node, pos_1))] -= lagrange
-            for pos_2 in range(pos_1+1, N):
-                Q[((node, pos_1), (node, pos_2))] += 2.0*lagrange
-
-    # Constraint that each col has exactly one 1
-    for pos in range(N):
-        for node_1 in G:
-            Q[((node_1, pos), (node_1, pos))] -= lagrange
-            for node_2 in set(G)-{node_1}:
-                # QUBO coefficient is 2*lagrange, but we are placing this value 
-                # above *and* below the diagonal, so we put half in each position.
-                Q[((node_1, pos), (node_2, pos))] += lagrange
-
-    # Objective that minimizes distance
-    for u, v in itertools.combinations(G.nodes, 2):
-        for pos in range(N):
-            nextpos = (pos + 1) % N
-
-            # going from u -> v
-            try:
-                value = G[u][v][weight]
-            except KeyError:
-                value = missing_edge_weight
-
-            Q[((u, pos), (v, nextpos))] += value
-
-            # going from v -> u
-            try:
-                value = G[v][u][weight]
-            except KeyError:
-                value = missing_edge_weight
-
-            Q[((v, pos), (u, nextpos))] += value
 
+def traveling_salesperson_qubo(G, lagrange=None, weight='weight', missing_edge_weight=None):
+    """Return the QUBO with ground states corresponding to a minimum TSP route.
+
+    If :math:`|G|` is the number of nodes in the graph, the resulting qubo will have:
+
+    * :math:`|G|^2` variables/nodes
+    * :math:`2 |G|^2 (|G| - 1)` interactions/edges
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A complete graph in which each edge has a attribute giving its weight.
+
+    lagrange : number, optional (default None)
+        Lagrange parameter to weight constraints (no edges within set)
+        versus objective (largest set possible).
+
+    weight : optional (default 'weight')
+        The name of the edge attribute containing the weight.
+    
+    missing_edge_weight : number, optional (default None)
+        For bi-directional graphs, the weight given to missing edges.
+        If None is given (the default), missing edges will be set to
+        the sum of all weights.
+
+    Returns
+    -------
+    QUBO : dict
+       The QUBO with ground states corresponding to a minimum travelling
+       salesperson route. The QUBO variables are labelled `(c, t)` where `c`
+       is a node in `G` and `t` is the time index. For instance, if `('a', 0)`
+       is 1 in the ground state, that means the node 'a' is visted first.
+
+    """
+    labels, linear, (irow, icol, qdata), __ = _tsp_vectors(G, lagrange, weight, missing_edge_weight)
+
+    Q = dict(zip(zip(labels, labels), linear.tolist()))
+    Q.update(zip(zip([labels[i] for i in irow.tolist()], [labels[j] for j in icol.tolist()]),
+                 qdata.tolist()))
     return Q
 
 
+traveling_salesman_bqm = traveling_salesperson_bqm
 traveling_salesman_qubo = traveling_salesperson_qubo
 
 
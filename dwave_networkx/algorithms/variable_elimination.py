@@ -0,0 +1,206 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import dimod
+import networkx as nx
+import numpy as np
+
+from dwave_networkx.algorithms.elimination_ordering import min_fill_heuristic
+
+__all__ = ['VariableEliminationSampler']
+
+
+class VariableEliminationSampler(dimod.Sampler):
+    """Exact solver for binary quadratic models of low treewidth.
+
+    The variables of the binary quadratic model are eliminated one at a time
+    along an elimination order of its interaction graph, by dynamic
+    programming over tables of energies (bucket elimination). The time and
+    memory required are exponential in the width of the order, see
+    :func:`.elimination_order_width`, rather than in the number of
+    variables.
+
+    The sampler can be passed as the ``sampler`` argument of any of the
+    algorithms of dwave-networkx, to solve them exactly.
+
+    Examples
+    --------
+    This example finds a maximum independent set of a Chimera graph, whose
+    treewidth is much smaller than its number of nodes.
+
+    >>> G = dnx.chimera_graph(2, 8, 4)
+    >>> sampler = dnx.VariableEliminationSampler()
+    >>> len(dnx.maximum_independent_set(G, sampler))
+    64
+
+    """
+    parameters = None
+    """dict: The keyword arguments accepted by :meth:`.sample`."""
+
+    properties = None
+    """dict: Empty."""
+
+    def __init__(self):
+        self.parameters = {'elimination_order': [], 'max_width': []}
+        self.properties = {}
+
+    def sample(self, bqm, elimination_order=None, max_width=20):
+        """Finds a ground state of a binary quadratic model.
+
+        Parameters
+        ----------
+        bqm : :class:`dimod.BinaryQuadraticModel`
+            The binary quadratic model.
+
+        elimination_order : list (optional, Default None)
+            An elimination order of the variables of bqm. If not provided,
+            it is found with :func:`.min_fill_heuristic`.
+
+        max_width : int (optional, Default 20)
+            The largest width of the order that is accepted. Eliminating a
+            variable requires a table of :math:`2^{w + 1}` energies, where
+            :math:`w` is the number of its neighbors when it is eliminated.
+
+        Returns
+        -------
+        sampleset : :class:`dimod.SampleSet`
+            A sample set with a single ground state of bqm.
+
+        Raises
+        ------
+        ValueError
+            If the width of the elimination order is larger than max_width.
+
+        """
+        order = _elimination_order(bqm, elimination_order)
+
+        __, argmins = _eliminate(bqm, order, _minimize, 1, max_width)
+
+        # assign the variables in the reverse order, each to the value that
+        # minimized the energy given the variables eliminated after it
+        choices = [0] * len(order)
+        for i in reversed(range(len(order))):
+            scope, argmin = argmins[i]
+            choices[i] = int(argmin[tuple(choices[j] for j in scope)])
+
+        values = np.array([-1, 1] if bqm.vartype is dimod.SPIN else [0, 1], dtype=np.int8)
+        samples = values[np.array(choices, dtype=np.intp)].reshape(1, len(order))
+        return dimod.SampleSet.from_samples_bqm((samples, order), bqm)
+
+    def log_partition_function(self, bqm, beta=1., elimination_order=None, max_width=20):
+        """Computes the logarithm of the partition function of a binary
+        quadratic model.
+
+        Parameters
+        ----------
+        bqm : :class:`dimod.BinaryQuadraticModel`
+            The binary quadratic model.
+
+        beta : float (optional, Default 1.)
+            The inverse temperature.
+
+        elimination_order : list (optional, Default None)
+            See :meth:`.sample`.
+
+        max_width : int (optional, Default 20)
+            See :meth:`.sample`.
+
+        Returns
+        -------
+        log_z : float
+            :math:`\\log \\sum_s e^{-\\beta E(s)}`, the sum being over all
+            of the assignments :math:`s` of the variables of bqm.
+
+        Examples
+        --------
+        >>> bqm = dimod.BinaryQuadraticModel({}, {'ab': -1}, 0, 'SPIN')
+        >>> log_z = dnx.VariableEliminationSampler().log_partition_function(bqm)
+        >>> round(float(np.exp(log_z)), 4)   # 2*e + 2/e
+        6.1723
+
+        """
+        order = _elimination_order(bqm, elimination_order)
+
+        log_z, __ = _eliminate(bqm, order, _log_sum_exp, -beta, max_width)
+        return float(log_z)
+
+
+def _elimination_order(bqm, elimination_order):
+    if elimination_order is None:
+        G = nx.Graph()
+        G.add_nodes_from(bqm.variables)
+        G.add_edges_from(bqm.quadratic)
+        __, elimination_order = min_fill_heuristic(G)
+        return elimination_order
+
+    elimination_order = list(elimination_order)
+    if len(elimination_order) != len(bqm.variables) or set(elimination_order) != set(bqm.variables):
+        raise ValueError("elimination_order must be a list of all of the variables of bqm")
+    return elimination_order
+
+
+def _minimize(table):
+    return table.min(axis=0), table.argmin(axis=0)
+
+
+def _log_sum_exp(table):
+    return np.logaddexp(table[0], table[1]), None
+
+
+def _eliminate(bqm, order, reduce, scale, max_width):
+    """Eliminates the variables of bqm in order.
+
+    Each factor is a table of scale times the energy, with one axis of size
+    2 for each variable of its scope, listed by their position in order.
+    Eliminating a variable sums the factors of its bucket and reduces the
+    result over its first axis with reduce, which returns the message sent
+    to the bucket of the next variable of its scope and, for the
+    minimization, the choice of the variable given the others.
+
+    Returns the reduction over all of the variables, and for each variable
+    the scope and choices returned by reduce.
+    """
+    index = {v: i for i, v in enumerate(order)}
+    values = np.array([-1., 1.] if bqm.vartype is dimod.SPIN else [0., 1.])
+
+    # each factor is placed in the bucket of the first of its variables
+    buckets = [[] for __ in order]
+    for v, bias in bqm.linear.items():
+        i = index[v]
+        buckets[i].append(((i,), scale * bias * values))
+    for (u, v), bias in bqm.quadratic.items():
+        i, j = sorted((index[u], index[v]))
+        buckets[i].append(((i, j), scale * bias * np.outer(values, values)))
+
+    constant = scale * bqm.offset
+    choices = []
+    for i, factors in enumerate(buckets):
+        scope = sorted(set(j for factor_scope, __ in factors for j in factor_scope) | {i})
+
+        if len(scope) - 1 > max_width:
+            raise ValueError("elimination order has width larger than max_width={}".format(max_width))
+
+        table = np.zeros((2,) * len(scope))
+        for factor_scope, factor in factors:
+            table += factor.reshape([2 if v in factor_scope else 1 for v in scope])
+        buckets[i] = None  # the factors are no longer needed
+
+        message, choice = reduce(table)
+        choices.append((scope[1:], choice))
+        if len(scope) > 1:
+            buckets[scope[1]].append((tuple(scope[1:]), message))
+        else:
+            constant = constant + message
+
+    return constant, choices
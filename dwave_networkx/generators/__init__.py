@@ -16,3 +16,5 @@ from dwave_networkx.generators.chimera import *
 from dwave_networkx.generators.markov import markov_network
 from dwave_networkx.generators.pegasus import *
 from dwave_networkx.generators.zephyr import *
+from dwave_networkx.generators.working_graph import *
+from dwave_networkx.generators.shared_graph import *
@@ -19,6 +19,7 @@ Generators for graphs derived from the D-Wave System.
 import warnings
 
 import networkx as nx
+import numpy as np
 from networkx.algorithms.bipartite import color
 from networkx import diameter
 
@@ -26,7 +27,8 @@ from dwave_networkx.exceptions import DWaveNetworkXException
 
 from itertools import product
 
-from .common import _add_compatible_nodes, _add_compatible_edges, _add_compatible_terms
+from .common import (_add_compatible_nodes, _add_compatible_edges, _add_compatible_terms,
+                     _pack_neighbor_array, _set_lazy_node_data, _TopologyGraph)
 
 __all__ = ['chimera_graph',
            'chimera_coordinates',
@@ -68,9 +70,11 @@ def chimera_graph(m, n=None, t=None, create_using=None, node_list=None, edge_lis
         are ignored unless you set :code:`check_edge_list=True`. If not 
         specified, all edges compatible with the ``node_list`` and topology 
         description are included.
-    data : bool (optional, default :code:`True`)
+    data : bool or 'lazy' (optional, default :code:`True`)
         If :code:`True`, each node has a `chimera_index attribute`. The 
-        attribute is a 4-tuple Chimera index as defined below.
+        attribute is a 4-tuple Chimera index as defined below.  If ``'lazy'``,
+        the attribute is not stored but computed from the node label each
+        time it is accessed, which is faster to construct and uses less memory.
     coordinates : bool (optional, default :code:`False`)
         If :code:`True`, node labels are 4-tuples, equivalent to the chimera_index
         attribute as below.  In this case, the ``data`` parameter controls the
@@ -93,6 +97,9 @@ def chimera_graph(m, n=None, t=None, create_using=None, node_list=None, edge_lis
     -------
     G : NetworkX Graph
         An (m, n, t) Chimera lattice. Nodes are labeled by integers.
+        Pickling or copying the graph with :mod:`copy` stores its construction
+        parameters and the nodes and edges it lacks, so the copy has the same
+        nodes, edges and attributes, listed in the order of the generator.
 
 
     A Chimera lattice is an m-by-n grid of Chimera tiles. Each Chimera
@@ -150,7 +157,7 @@ def chimera_graph(m, n=None, t=None, create_using=None, node_list=None, edge_lis
     else:
         t = int(t)
 
-    G = nx.empty_graph(0, create_using)
+    G = nx.empty_graph(0, _TopologyGraph if create_using is None else create_using)
 
     G.name = "chimera_graph(%s, %s, %s)" % (m, n, t)
 
@@ -231,7 +238,13 @@ def chimera_graph(m, n=None, t=None, create_using=None, node_list=None, edge_lis
             G.remove_nodes_from(set(G) - nodes)
             G.add_nodes_from(nodes)  # for singleton nodes
         
-    if data:
+    if data == 'lazy':
+        c2i = chimera_coordinates(m, n, t)
+        if coordinates:
+            _set_lazy_node_data(G, {'linear_index': c2i.chimera_to_linear}, (m, n, 2, t))
+        else:
+            _set_lazy_node_data(G, {'chimera_index': c2i.linear_to_chimera}, 2*m*n*t)
+    elif data:
         if coordinates:
             def checkadd(v, q):
                 if q in G:
@@ -564,6 +577,124 @@ class chimera_coordinates(object):
                 f"Node labeling {labels} not recognized.  Input must be generated by dwave_networkx.chimera_graph."
             )
 
+    def _chimera_neighbors(self, q):
+        """Yields the neighbors of the 4-term Chimera coordinate ``q`` in a
+        full-yield Chimera graph.
+        """
+        m, n, t = self.args
+        i, j, u, k = q
+        for kk in range(t):
+            yield i, j, 1 - u, kk
+        if u:
+            if j > 0:
+                yield i, j - 1, u, k
+            if j < n - 1:
+                yield i, j + 1, u, k
+        else:
+            if i > 0:
+                yield i - 1, j, u, k
+            if i < m - 1:
+                yield i + 1, j, u, k
+
+    def neighbors(self, q, labels='int'):
+        """Returns the neighbors of a node in the full-yield Chimera graph.
+
+        The neighbors are computed arithmetically, so no graph is constructed.
+
+        Parameters
+        ----------
+        q : int or 4-tuple
+            A node label.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``q`` and of the returned
+            neighbors; either ``'int'`` (linear indices) or ``'coordinate'``
+            (4-term Chimera coordinates).
+
+        Returns
+        -------
+        neighbors : list
+            The neighbors of ``q`` in ``chimera_graph(m, n, t)``.
+
+        Examples
+        --------
+        >>> dnx.chimera_coordinates(2, 2, 4).neighbors(0)
+        [4, 5, 6, 7, 16]
+
+        """
+        if labels == 'int':
+            return list(self.iter_chimera_to_linear(
+                self._chimera_neighbors(self.linear_to_chimera(q))))
+        elif labels == 'coordinate':
+            return list(self._chimera_neighbors(q))
+        raise ValueError(f"Node labeling {labels} not recognized")
+
+    def neighbor_array(self, nodes, labels='int'):
+        """Computes the neighbors of many nodes in the full-yield Chimera graph.
+
+        Parameters
+        ----------
+        nodes : array_like
+            Node labels; a sequence of linear indices if ``labels='int'``, or
+            an array of shape (N, 4) of Chimera coordinates if
+            ``labels='coordinate'``.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``nodes`` and of the returned
+            neighbors; either ``'int'`` or ``'coordinate'``.
+
+        Returns
+        -------
+        neighbors : numpy.ndarray
+            An array of shape (N, t + 2) (or (N, t + 2, 4) for coordinate
+            labels) where row ``i`` lists the neighbors of ``nodes[i]``,
+            padded with -1.
+        degree : numpy.ndarray
+            An array of shape (N,) containing the degree of each node.
+
+        Examples
+        --------
+        >>> nbrs, degree = dnx.chimera_coordinates(2, 2, 4).neighbor_array([0, 31])
+        >>> degree
+        array([5, 5])
+
+        """
+        m, n, t = self.args
+        if labels == 'int':
+            r = np.asarray(nodes, dtype=np.int64).reshape(-1)
+            r, k = np.divmod(r, t)
+            r, u = np.divmod(r, 2)
+            i, j = np.divmod(r, n)
+        elif labels == 'coordinate':
+            i, j, u, k = np.asarray(nodes, dtype=np.int64).reshape(-1, 4).T
+        else:
+            raise ValueError(f"Node labeling {labels} not recognized")
+
+        # slots 0, ..., t-1 are internal couplers, t and t+1 are external
+        num = len(i)
+        ext = np.array([-1, 1])
+        ii = np.empty((num, t + 2), dtype=np.int64)
+        jj = np.empty((num, t + 2), dtype=np.int64)
+        uu = np.empty((num, t + 2), dtype=np.int64)
+        kk = np.empty((num, t + 2), dtype=np.int64)
+        ii[:, :t] = i[:, None]
+        jj[:, :t] = j[:, None]
+        uu[:, :t] = 1 - u[:, None]
+        kk[:, :t] = np.arange(t)
+        ii[:, t:] = i[:, None] + ext * (1 - u[:, None])
+        jj[:, t:] = j[:, None] + ext * u[:, None]
+        uu[:, t:] = u[:, None]
+        kk[:, t:] = k[:, None]
+
+        mask = (ii >= 0) & (ii < m) & (jj >= 0) & (jj < n)
+        (ii, jj, uu, kk), degree = _pack_neighbor_array((ii, jj, uu, kk), mask)
+
+        if labels == 'int':
+            nbrs = ((n*ii + jj)*2 + uu)*t + kk
+            nbrs[ii < 0] = -1
+        else:
+            nbrs = np.stack((ii, jj, uu, kk), axis=-1)
+        return nbrs, degree
+
+
 class __chimera_coordinates_cache_dict(dict):
     """An internal-use cached factory for `chimera_coordinates` objects"""
 
@@ -1,3 +1,9 @@
+import itertools
+from collections.abc import MutableMapping
+
+import networkx as nx
+import numpy as np
+
 
 def _add_compatible_edges(G, edge_list):
     # Check edge_list defines a subgraph of G and create subgraph.
@@ -27,3 +33,275 @@ def _add_compatible_terms(G, node_list, edge_list):
     #Check node deletion hasn't caused edge deletion:
     if edge_list is not None and len(edge_list) != G.number_of_edges():
         raise ValueError('The edge_list contains nodes absent from the node_list')
+
+def _pack_neighbor_array(columns, mask):
+    # Shared by the coordinate classes' ``neighbor_array`` methods.  Each of
+    # ``columns`` is an (N, S) array holding one coordinate term of the S
+    # candidate neighbors of N nodes, and ``mask`` flags the candidates that
+    # are actually present.  Valid candidates are shifted to the left (in
+    # their original order) and the remainder is padded with -1.
+    degree = mask.sum(axis=1)
+    order = np.argsort(~mask, axis=1, kind='stable')
+    valid = np.take_along_axis(mask, order, axis=1)
+    packed = []
+    for col in columns:
+        col = np.take_along_axis(col, order, axis=1)
+        col[~valid] = -1
+        packed.append(col)
+    return packed, degree
+
+
+class _LazyNodeData(MutableMapping):
+    # Node attribute mapping for graphs constructed with ``data='lazy'``.
+    # Rather than storing its coordinate attributes, the mapping computes
+    # them from the node label on access, via the ``attributes`` mapping
+    # (shared by all nodes of the graph) from attribute names to conversion
+    # functions.  The attributes are only materialized into a dict once the
+    # mapping is modified.
+    __slots__ = ('_node', '_attributes', '_data')
+
+    def __init__(self, node, attributes):
+        self._node = node
+        self._attributes = attributes
+        self._data = None
+
+    def _materialize(self):
+        if self._data is None:
+            self._data = {key: f(self._node) for key, f in self._attributes.items()}
+        return self._data
+
+    def __getitem__(self, key):
+        if self._data is not None:
+            return self._data[key]
+        return self._attributes[key](self._node)
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._attributes if self._data is None else self._data)
+
+    def __len__(self):
+        return len(self._attributes if self._data is None else self._data)
+
+    def __contains__(self, key):
+        return key in (self._attributes if self._data is None else self._data)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        # networkx copies node attributes with ``d.copy()``
+        return dict(self)
+
+
+def _set_lazy_node_data(G, attributes, shape):
+    # Replaces the (empty) attribute dicts of the nodes of G by
+    # _LazyNodeData mappings with the given attributes.  Only the nodes of
+    # the lattice get attributes, as with ``data=True``: if shape is an int,
+    # the linear indices in range(shape), otherwise the tuples whose entries
+    # are in range of the corresponding entries of shape.
+    if isinstance(shape, int):
+        def in_lattice(v):
+            return v in range(shape)
+    else:
+        def in_lattice(v):
+            return (type(v) is tuple and len(v) == len(shape)
+                    and all(x in range(b) for x, b in zip(v, shape)))
+
+    nodes = G._node
+    for v in nodes:
+        if in_lattice(v):
+            nodes[v] = _LazyNodeData(v, attributes)
+
+
+def _label_conversions(metadata):
+    # Returns the functions (to_linear, from_linear, node_attributes) for the
+    # labels of a graph with the given graph attributes.  to_linear and
+    # from_linear are None for linear (int) labels.  node_attributes maps
+    # attribute names to functions of the node label, as used for graphs
+    # constructed with ``data='lazy'``.
+    from .chimera import chimera_coordinates
+    from .pegasus import pegasus_coordinates
+    from .zephyr import zephyr_coordinates
+
+    family = metadata.get('family')
+    labels = metadata.get('labels')
+    if family == 'chimera':
+        c = chimera_coordinates(metadata['rows'], metadata['columns'], metadata['tile'])
+        conversions = {'int': (None, None, {'chimera_index': c.linear_to_chimera}),
+                       'coordinate': (c.chimera_to_linear, c.linear_to_chimera,
+                                      {'linear_index': c.chimera_to_linear})}
+    elif family == 'pegasus':
+        c = pegasus_coordinates(metadata['rows'])
+        conversions = {'int': (None, None, {'pegasus_index': c.linear_to_pegasus}),
+                       'coordinate': (c.pegasus_to_linear, c.linear_to_pegasus,
+                                      {'linear_index': c.pegasus_to_linear}),
+                       'nice': (c.nice_to_linear, c.linear_to_nice,
+                                {'linear_index': c.nice_to_linear,
+                                 'pegasus_index': pegasus_coordinates.nice_to_pegasus})}
+    elif family == 'zephyr':
+        c = zephyr_coordinates(metadata['rows'], metadata['tile'])
+        conversions = {'int': (None, None, {'zephyr_index': c.linear_to_zephyr}),
+                       'coordinate': (c.zephyr_to_linear, c.linear_to_zephyr,
+                                      {'linear_index': c.zephyr_to_linear})}
+    else:
+        raise ValueError("G must be constructed by chimera_graph, pegasus_graph or zephyr_graph")
+    try:
+        return conversions[labels]
+    except KeyError:
+        raise ValueError(f"labels {labels!r} not recognized for family {family!r}") from None
+
+
+class _TopologyGraph(nx.Graph):
+    # The class of the graphs returned by the topology generators (unless
+    # another class is given by ``create_using``).  When a graph can be
+    # regenerated from its construction parameters, its pickle only holds
+    # those parameters and the nodes and edges missing from the full-yield
+    # graph, rather than every node and edge.  The unpickled graph lists its
+    # nodes and neighbors in the order of the generator, whatever their order
+    # in the pickled graph.
+    def __reduce_ex__(self, protocol):
+        state = _compact_state(self)
+        if state is None:
+            return super().__reduce_ex__(protocol)
+        return _regenerate_topology_graph, state
+
+
+def _compact_state(G):
+    # Returns the arguments of _regenerate_topology_graph reconstructing G,
+    # or None if G is not a subgraph of a (non-torus) full-yield topology
+    # graph with the attributes set by its generator.
+    graph = G.graph
+    if graph.get('boundary_condition') is not None:
+        return None
+    nodes = list(G)
+    try:
+        to_linear, from_linear, attributes = _label_conversions(graph)
+        if from_linear is None:
+            if not all(type(v) is int for v in nodes):
+                return None
+            linear = np.fromiter(nodes, dtype=np.int64, count=len(nodes))
+        else:
+            linear = np.fromiter(map(to_linear, nodes), dtype=np.int64, count=len(nodes))
+        perfect_nodes, nbr_coords, fabric_only = _full_yield(graph, linear)
+    except (KeyError, TypeError, ValueError, NotImplementedError):
+        return None
+    if not np.isin(linear, perfect_nodes).all():
+        return None
+    if from_linear is not None and any(from_linear(r) != v for r, v in zip(linear.tolist(), nodes)):
+        return None
+
+    # node attributes must be those set by the generator, and edges must not
+    # have any attributes
+    if not graph.get('data'):
+        if any(G._node.values()):
+            return None
+    else:
+        for v, d in G._node.items():
+            if type(d) is _LazyNodeData and d._data is None and d._attributes.keys() == attributes.keys():
+                continue
+            if d.keys() != attributes.keys() or any(d[k] != f(v) for k, f in attributes.items()):
+                return None
+    if any(map(any, map(dict.values, G._adj.values()))):
+        return None
+
+    # the edges of the full-yield graph between the nodes of G, encoded as
+    # ``min(p, q) * N + max(p, q)`` for linear indices p, q
+    num_nodes = int(perfect_nodes[-1]) + 1 if len(perfect_nodes) else 0
+    nbrs, _ = nbr_coords.neighbor_array(linear)
+    p = np.broadcast_to(linear[:, None], nbrs.shape)
+    mask = (nbrs > p) & np.isin(nbrs, linear)
+    perfect_edges = p[mask]*num_nodes + nbrs[mask]
+
+    adj = [G._adj[v] for v in nodes]
+    degree = np.fromiter(map(len, adj), dtype=np.int64, count=len(nodes))
+    heads = itertools.chain.from_iterable(adj)
+    if from_linear is not None:
+        heads = map(dict(zip(nodes, linear.tolist())).__getitem__, heads)
+    q = np.fromiter(heads, dtype=np.int64, count=int(degree.sum()))
+    p = np.repeat(linear, degree)
+    edges = p[p < q]*num_nodes + q[p < q]
+    if not np.isin(edges, perfect_edges).all() or (p == q).any():
+        return None
+
+    missing_nodes = np.setdiff1d(perfect_nodes, linear).astype(np.int32)
+    missing_edges = np.setdiff1d(perfect_edges, edges)
+    missing_edges = np.stack(np.divmod(missing_edges, num_nodes), axis=1).astype(np.int32)
+    return dict(graph), fabric_only, missing_nodes, missing_edges, nx.is_frozen(G)
+
+
+def _full_yield(graph, linear):
+    # Returns the sorted linear indices of the nodes of the full-yield graph
+    # containing the nodes ``linear``, a coordinate object whose
+    # ``neighbor_array`` gives the edges of that graph, and, for Pegasus,
+    # whether that graph is restricted to the fabric.
+    from .chimera import chimera_coordinates
+    from .pegasus import pegasus_coordinates, _pegasus_offset_lists
+    from .zephyr import zephyr_coordinates
+
+    family = graph['family']
+    if family == 'chimera':
+        m, n, t = graph['rows'], graph['columns'], graph['tile']
+        return np.arange(2*m*n*t), chimera_coordinates(m, n, t), None
+    if family == 'zephyr':
+        m, t = graph['rows'], graph['tile']
+        return np.arange(4*t*m*(2*m + 1)), zephyr_coordinates(m, t), None
+
+    m = graph['rows']
+    offset_lists = (tuple(graph['vertical_offsets']), tuple(graph['horizontal_offsets']))
+    coords = pegasus_coordinates(m, offset_lists, fabric_only=False)
+    if graph['labels'] == 'nice':
+        if offset_lists != tuple(map(tuple, _pegasus_offset_lists[0])):
+            raise NotImplementedError("nice coordinate system is only implemented for offsets_index 0")
+        nice_nodes = ((t, y, x, u, k) for t in range(3) for y in range(m - 1)
+                      for x in range(m - 1) for u in range(2) for k in range(4))
+        perfect_nodes = np.fromiter(map(coords.nice_to_linear, nice_nodes), dtype=np.int64)
+        return np.sort(perfect_nodes), coords, None
+
+    # the graph is restricted to the fabric, unless it has nodes outside of it
+    all_nodes = np.arange(24*m*(m - 1))
+    _, degree = pegasus_coordinates(m, offset_lists).neighbor_array(all_nodes)
+    fabric_nodes = all_nodes[degree > 0]
+    if np.isin(linear, fabric_nodes).all():
+        return fabric_nodes, coords, True
+    _, degree = coords.neighbor_array(all_nodes)
+    return all_nodes[degree > 0], coords, False
+
+
+def _regenerate_topology_graph(graph, fabric_only, missing_nodes, missing_edges, frozen):
+    # Inverse of _compact_state.
+    from .chimera import chimera_graph
+    from .pegasus import pegasus_graph
+    from .zephyr import zephyr_graph
+
+    family, labels, data = graph['family'], graph['labels'], graph['data']
+    if family == 'chimera':
+        G = chimera_graph(graph['rows'], graph['columns'], graph['tile'],
+                          data=data, coordinates=labels == 'coordinate')
+    elif family == 'zephyr':
+        G = zephyr_graph(graph['rows'], graph['tile'], data=data,
+                         coordinates=labels == 'coordinate')
+    elif labels == 'nice':
+        G = pegasus_graph(graph['rows'], data=data, nice_coordinates=True)
+    else:
+        G = pegasus_graph(graph['rows'], data=data, fabric_only=fabric_only,
+                          offset_lists=(graph['vertical_offsets'], graph['horizontal_offsets']),
+                          coordinates=labels == 'coordinate')
+
+    from_linear = _label_conversions(graph)[1]
+    if from_linear is None:
+        G.remove_edges_from(missing_edges.tolist())
+        G.remove_nodes_from(missing_nodes.tolist())
+    else:
+        G.remove_edges_from((from_linear(p), from_linear(q)) for p, q in missing_edges.tolist())
+        G.remove_nodes_from(map(from_linear, missing_nodes.tolist()))
+
+    G.graph.clear()
+    G.graph.update(graph)
+    if frozen:
+        nx.freeze(G)
+    return G
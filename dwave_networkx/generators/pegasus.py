@@ -18,13 +18,15 @@ Generators for some graphs derived from the D-Wave System.
 import re
 
 import networkx as nx
+import numpy as np
 
 from dwave_networkx.exceptions import DWaveNetworkXException
 import warnings
 
 from itertools import product
 from .chimera import _chimera_coordinates_cache
-from .common import _add_compatible_edges, _add_compatible_nodes, _add_compatible_terms
+from .common import (_add_compatible_edges, _add_compatible_nodes, _add_compatible_terms,
+                     _pack_neighbor_array, _set_lazy_node_data, _TopologyGraph)
 
 __all__ = ['pegasus_graph',
            'pegasus_coordinates',
@@ -33,6 +35,19 @@ __all__ = ['pegasus_graph',
            'pegasus_four_color',
            ]
 
+# the preconfigured offsets selected by the ``offsets_index`` parameter of
+# pegasus_graph and pegasus_coordinates
+_pegasus_offset_lists = [
+    [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (6, 6, 6, 6, 2, 2, 2, 2, 10, 10, 10, 10,)],
+    [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,)],
+    [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,)],
+    [(10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,), (10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,)],
+    [(10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,), (2, 2, 2, 2, 6, 6, 6, 6, 10, 10, 10, 10,)],
+    [(6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,), (6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,)],
+    [(6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,), (6, 6, 10, 10, 10, 10, 2, 2, 2, 2, 6, 6,)],
+    [(6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,), (6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,)],
+]
+
 def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=True,
                   offset_lists=None, offsets_index=None, coordinates=False, fabric_only=True,
                   nice_coordinates=False, check_node_list=False, check_edge_list=False):
@@ -61,10 +76,12 @@ def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=Tru
         are ignored unless you set :code:`check_edge_list=True`. If not 
         specified, all edges compatible with the ``node_list`` and topology 
         description are included.
-    data : bool, optional (default :code:`True`)
+    data : bool or 'lazy', optional (default :code:`True`)
         If :code:`True`, each node has a pegasus_index attribute. The attribute
         is a 4-tuple Pegasus index as defined below. If the `coordinates` 
         parameter is :code:`True`, a linear_index, which is an integer, is used.
+        If ``'lazy'``, the attributes are not stored but computed from the node
+        label each time they are accessed.
     coordinates : bool, optional (default :code:`False`)
         If :code:`True`, node labels are 4-tuple Pegasus indices. Ignored if the
         `nice_coordinates` parameter is :code:`True`.
@@ -110,6 +127,9 @@ def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=Tru
     -------
     G : NetworkX Graph
         A Pegasus lattice for size parameter ``m``.
+        Pickling or copying the graph with :mod:`copy` stores its construction
+        parameters and the nodes and edges it lacks, so the copy has the same
+        nodes, edges and attributes, listed in the order of the generator.
 
 
     The maximum degree of this graph is 15. The number of nodes depends on multiple
@@ -190,16 +210,7 @@ def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=Tru
     """
     if offset_lists is None:
         offsets_descriptor = offsets_index = offsets_index or 0
-        offset_lists = [
-            [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (6, 6, 6, 6, 2, 2, 2, 2, 10, 10, 10, 10,)],
-            [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,)],
-            [(2, 2, 2, 2, 10, 10, 10, 10, 6, 6, 6, 6,), (10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,)],
-            [(10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,), (10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,)],
-            [(10, 10, 10, 10, 6, 6, 6, 6, 2, 2, 2, 2,), (2, 2, 2, 2, 6, 6, 6, 6, 10, 10, 10, 10,)],
-            [(6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,), (6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,)],
-            [(6, 6, 2, 2, 2, 2, 10, 10, 10, 10, 6, 6,), (6, 6, 10, 10, 10, 10, 2, 2, 2, 2, 6, 6,)],
-            [(6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,), (6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,)],
-        ][offsets_index]
+        offset_lists = _pegasus_offset_lists[offsets_index]
     elif offsets_index is not None:
         raise DWaveNetworkXException("provide at most one of offsets_index and offset_lists")
     else:
@@ -209,7 +220,7 @@ def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=Tru
                     warnings.warn("The offets list you've provided is possibly non-physical.  Odd-coupled qubits should have the same value.")
         offsets_descriptor = offset_lists
 
-    G = nx.empty_graph(0, create_using)
+    G = nx.empty_graph(0, _TopologyGraph if create_using is None else create_using)
 
     G.name = "pegasus_graph(%s, %s)" % (m, offsets_descriptor)
 
@@ -297,7 +308,17 @@ def pegasus_graph(m, create_using=None, node_list=None, edge_list=None, data=Tru
             G.remove_nodes_from(set(G) - nodes)
             G.add_nodes_from(nodes)  # for singleton nodes
 
-    if data:
+    if data == 'lazy':
+        coords = pegasus_coordinates(m)
+        if nice_coordinates:
+            _set_lazy_node_data(G, {'linear_index': coords.nice_to_linear,
+                                    'pegasus_index': pegasus_coordinates.nice_to_pegasus},
+                                (3, m1, m1, 2, 4))
+        elif coordinates:
+            _set_lazy_node_data(G, {'linear_index': coords.pegasus_to_linear}, (2, m, 12, m1))
+        else:
+            _set_lazy_node_data(G, {'pegasus_index': coords.linear_to_pegasus}, 24*m*m1)
+    elif data:
         v = 0
         if nice_coordinates:
             def fill_data():
@@ -550,16 +571,36 @@ class pegasus_coordinates(object):
     ----------
     m : int
         Size parameter for the Pegasus lattice.
+    offset_lists : pair of lists, optional (default None)
+        Offsets of the Pegasus lattice, as in :func:`.pegasus_graph`. Only
+        used by the :meth:`neighbors` and :meth:`neighbor_array` methods.
+    offsets_index : int, optional (default None)
+        Preconfigured offsets of the Pegasus lattice, as in
+        :func:`.pegasus_graph`. Only used by the :meth:`neighbors` and
+        :meth:`neighbor_array` methods.
+    fabric_only : bool, optional (default :code:`True`)
+        Whether the Pegasus lattice is restricted to its largest connected
+        component, as in :func:`.pegasus_graph`. Only used by the
+        :meth:`neighbors` and :meth:`neighbor_array` methods.
 
     See also
     --------
     :func:`.pegasus_graph` : Describes the various coordinate conventions.
 
     """
-    def __init__(self, m):
+    def __init__(self, m, offset_lists=None, offsets_index=None, fabric_only=True):
 
         self.args = m, m - 1
 
+        if offset_lists is None:
+            offsets_index = offsets_index or 0
+            offset_lists = _pegasus_offset_lists[offsets_index]
+        elif offsets_index is not None:
+            raise DWaveNetworkXException("provide at most one of offsets_index and offset_lists")
+        self.offsets_index = offsets_index
+        self.offset_lists = tuple(tuple(offsets) for offsets in offset_lists)
+        self.fabric_only = fabric_only
+
     def pegasus_to_linear(self, q):
         """Converts a 4-term Pegasus coordinate into a linear index.
 
@@ -897,6 +938,167 @@ class pegasus_coordinates(object):
             offsets_index = 0,
         )
 
+    def _fabric_bounds(self, nice):
+        """Returns the number of minor offsets excluded at the start of the
+        first and the end of the last major offset, for each orientation.
+        """
+        if nice:
+            if self.offsets_index != 0:
+                raise NotImplementedError("nice coordinate system is only implemented for offsets_index 0")
+            return (4, 8), (8, 4)
+        elif self.fabric_only:
+            off0, off1 = self.offset_lists
+            return (min(off1), min(off0)), (12 - max(off1), 12 - max(off0))
+        else:
+            return (0, 0), (0, 0)
+
+    def _pegasus_neighbors(self, q, nice=False):
+        """Yields the neighbors of the 4-term Pegasus coordinate ``q`` in a
+        full-yield Pegasus graph.
+        """
+        m, m1 = self.args
+        off = self.offset_lists
+        fabric_start, fabric_end = self._fabric_bounds(nice)
+
+        def qfilter(u, w, k, z):
+            if w == 0 and k < fabric_start[u]:
+                return False
+            if w == m1 and k >= 12 - fabric_end[u]:
+                return False
+            return True
+
+        u, w, k, z = q
+        if not qfilter(u, w, k, z):
+            return
+
+        # internal edges
+        for s in range(12):
+            zs = w - (k < off[1 - u][s])
+            if 0 <= zs < m1:
+                p = (1 - u, z + (s < off[u][k]), s, zs)
+                if qfilter(*p):
+                    yield p
+        # odd edge
+        yield u, w, k ^ 1, z
+        # external edges
+        if z > 0:
+            yield u, w, k, z - 1
+        if z < m1 - 1:
+            yield u, w, k, z + 1
+
+    def neighbors(self, q, labels='int'):
+        """Returns the neighbors of a node in the full-yield Pegasus graph.
+
+        The neighbors are computed arithmetically, so no graph is constructed.
+        The lattice is described by the ``offset_lists``, ``offsets_index``
+        and ``fabric_only`` parameters of this object; nice coordinates
+        always refer to the graph constructed with ``nice_coordinates=True``.
+
+        Parameters
+        ----------
+        q : int or tuple
+            A node label.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``q`` and of the returned
+            neighbors; one of ``'int'`` (linear indices), ``'coordinate'``
+            (4-term Pegasus coordinates) or ``'nice'`` (5-term nice
+            coordinates).
+
+        Returns
+        -------
+        neighbors : list
+            The neighbors of ``q`` in the Pegasus graph.
+
+        Examples
+        --------
+        >>> len(dnx.pegasus_coordinates(16).neighbors(1000))
+        15
+
+        """
+        if labels == 'int':
+            return list(self.iter_pegasus_to_linear(
+                self._pegasus_neighbors(self.linear_to_pegasus(q))))
+        elif labels == 'coordinate':
+            return list(self._pegasus_neighbors(q))
+        elif labels == 'nice':
+            return list(self.iter_pegasus_to_nice(
+                self._pegasus_neighbors(self.nice_to_pegasus(q), nice=True)))
+        raise ValueError(f"Node labeling {labels} not recognized")
+
+    def neighbor_array(self, nodes, labels='int'):
+        """Computes the neighbors of many nodes in the full-yield Pegasus graph.
+
+        See :meth:`neighbors` for the lattice described.
+
+        Parameters
+        ----------
+        nodes : array_like
+            Node labels; a sequence of linear indices if ``labels='int'``, or
+            an array of shape (N, 4) of Pegasus coordinates if
+            ``labels='coordinate'``.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``nodes`` and of the returned
+            neighbors; either ``'int'`` or ``'coordinate'``.
+
+        Returns
+        -------
+        neighbors : numpy.ndarray
+            An array of shape (N, 15) (or (N, 15, 4) for coordinate labels)
+            where row ``i`` lists the neighbors of ``nodes[i]``, padded with -1.
+        degree : numpy.ndarray
+            An array of shape (N,) containing the degree of each node.
+
+        Examples
+        --------
+        >>> nbrs, degree = dnx.pegasus_coordinates(16).neighbor_array(range(1000, 1040))
+        >>> degree.max()
+        15
+
+        """
+        m, m1 = self.args
+        if labels == 'int':
+            r = np.asarray(nodes, dtype=np.int64).reshape(-1)
+            r, z = np.divmod(r, m1)
+            r, k = np.divmod(r, 12)
+            u, w = np.divmod(r, m)
+        elif labels == 'coordinate':
+            u, w, k, z = np.asarray(nodes, dtype=np.int64).reshape(-1, 4).T
+        else:
+            raise ValueError(f"Node labeling {labels} not supported")
+
+        off = np.array(self.offset_lists)
+        fabric_start, fabric_end = map(np.array, self._fabric_bounds(False))
+
+        def qfilter(u, w, k, z):
+            return (((w != 0) | (k >= fabric_start[u]))
+                    & ((w != m1) | (k < 12 - fabric_end[u])))
+
+        u, w, k, z = (x[:, None] for x in (u, w, k, z))
+
+        # internal edges occupy the first 12 slots, indexed by minor offset
+        s = np.arange(12)
+        zs = w - (k < off[1 - u, s])
+        internal = (1 - u + 0*s, z + (s < off[u, k]), s + 0*u, zs)
+        internal_mask = (zs >= 0) & (zs < m1)
+
+        # followed by the odd edge and two external edges
+        zz = np.concatenate((z, z - 1, z + 1), axis=1)
+        kk = np.concatenate((k ^ 1, k, k), axis=1)
+        other = (u + 0*zz, w + 0*zz, kk, zz)
+        other_mask = (zz >= 0) & (zz < m1)
+
+        columns = [np.concatenate(pair, axis=1) for pair in zip(internal, other)]
+        mask = np.concatenate((internal_mask, other_mask), axis=1)
+        mask &= qfilter(*columns) & qfilter(u, w, k, z)
+        (uu, ww, kk, zz), degree = _pack_neighbor_array(columns, mask)
+
+        if labels == 'int':
+            nbrs = ((m * uu + ww) * 12 + kk) * m1 + zz
+            nbrs[uu < 0] = -1
+        else:
+            nbrs = np.stack((uu, ww, kk, zz), axis=-1)
+        return nbrs, degree
+
     def int(self, q):
         """Deprecated alias of `pegasus_to_linear`."""
         msg = ('pegasus_coordinates.int is deprecated and will be removed in '
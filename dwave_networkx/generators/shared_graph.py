@@ -0,0 +1,296 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Topology graphs published in shared memory, for use by process pools.
+"""
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+import networkx as nx
+import numpy as np
+
+from .common import _LazyNodeData, _label_conversions
+
+__all__ = ['SharedGraph', 'share_graph']
+
+
+class _ReadOnlyNodeData(_LazyNodeData):
+    # Attributes of the nodes of a shared graph, computed on access.
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        raise TypeError("attributes of a shared graph are read-only")
+
+    def __delitem__(self, key):
+        raise TypeError("attributes of a shared graph are read-only")
+
+
+# attribute dict of every edge (and of every node of graphs without data)
+_EMPTY_ATTRIBUTES = _ReadOnlyNodeData(None, {})
+
+
+def share_graph(G):
+    """Publishes a topology graph in shared memory.
+
+    The nodes and adjacency of G are stored as compressed sparse row (CSR)
+    arrays in a :class:`multiprocessing.shared_memory.SharedMemory` block.
+    The returned handle can be pickled cheaply (only the name of the block
+    and the construction metadata of G are serialized) and sent to worker
+    processes, where :meth:`SharedGraph.graph` gives a read-only view of G
+    backed by the shared arrays, with no copy and no regeneration.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+        A graph constructed by :func:`.chimera_graph`, :func:`.pegasus_graph`
+        or :func:`.zephyr_graph`, possibly with missing nodes and edges.
+        Edge attributes are not shared.
+
+    Returns
+    -------
+    shared : :class:`SharedGraph`
+        The handle of the shared graph.  The shared memory is released by
+        :meth:`SharedGraph.unlink` in the process that created it, or when
+        the handle is used as a context manager.
+
+    Examples
+    --------
+    >>> G = dnx.pegasus_graph(4)
+    >>> with dnx.share_graph(G) as shared:
+    ...     H = shared.graph()        # typically, in a worker process
+    ...     H.number_of_edges() == G.number_of_edges()
+    True
+
+    """
+    return SharedGraph(G)
+
+
+class SharedGraph(object):
+    """Handle of a topology graph published in shared memory by
+    :func:`share_graph`.
+    """
+    def __init__(self, G):
+        if G.is_directed() or G.is_multigraph():
+            raise ValueError("only undirected simple graphs can be shared")
+
+        metadata = dict(G.graph)
+        to_linear = _label_conversions(metadata)[0]
+
+        nodelist = list(G)
+        if to_linear is None:
+            linear = np.fromiter(nodelist, dtype=np.int64, count=len(nodelist))
+        else:
+            linear = np.fromiter(map(to_linear, nodelist), dtype=np.int64, count=len(nodelist))
+        order = np.argsort(linear)
+        index = dict(zip(nodelist, np.argsort(order).tolist()))
+
+        degree = np.fromiter((len(G[v]) for v in nodelist), dtype=np.int64, count=len(nodelist))
+        indptr = np.zeros(len(nodelist) + 1, dtype=np.int64)
+        np.cumsum(degree[order], out=indptr[1:])
+
+        self._sizes = (len(nodelist), int(indptr[-1]))
+        self._metadata = metadata
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, 8*self._nbytes()))
+        self._owner = True
+
+        nodes, shared_indptr, indices = self._arrays()
+        nodes[:] = linear[order]
+        shared_indptr[:] = indptr
+        for i in order.tolist():
+            v = nodelist[i]
+            nbrs = sorted(index[u] for u in G[v])
+            k = index[v]
+            indices[indptr[k]:indptr[k + 1]] = nbrs
+
+    def _nbytes(self):
+        num_nodes, nnz = self._sizes
+        return 2*num_nodes + 1 + nnz
+
+    def _arrays(self):
+        num_nodes, nnz = self._sizes
+        buf = np.ndarray((self._nbytes(),), dtype=np.int64, buffer=self._shm.buf)
+        return (buf[:num_nodes],
+                buf[num_nodes:2*num_nodes + 1],
+                buf[2*num_nodes + 1:])
+
+    @property
+    def name(self):
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    def graph(self):
+        """Returns a read-only view of the shared graph.
+
+        The view is a frozen NetworkX graph (see :func:`networkx.freeze`)
+        with the same nodes, edges and graph attributes as the shared graph.
+        If the shared graph was constructed with ``data=True``, node
+        attributes are computed from the node labels on access.
+        Use ``nx.Graph(H)`` to obtain a mutable copy of a view ``H``.
+        """
+        nodes, indptr, indices = self._arrays()
+        for a in (nodes, indptr, indices):
+            a.flags.writeable = False
+
+        H = _SharedGraphView(self)
+        H.graph.update(self._metadata)
+        H._node = _CSRNodes(self, nodes)
+        H._adj = _CSRAdjacency(H._node, indptr, indices)
+        return nx.freeze(H)
+
+    def close(self):
+        """Closes access to the shared memory from this handle.
+
+        Raises :exc:`BufferError` while views returned by :meth:`graph` are
+        still alive.
+        """
+        self._shm.close()
+
+    def unlink(self):
+        """Destroys the shared memory block, once every process has closed
+        it.  Only the handle returned by :func:`share_graph` destroys the
+        block; for other handles, this does nothing."""
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.unlink()
+        try:
+            self.close()
+        except BufferError:
+            # views are still alive, the memory is released along with them
+            pass
+
+    def __getstate__(self):
+        return {'name': self.name, 'sizes': self._sizes, 'metadata': self._metadata}
+
+    def __setstate__(self, state):
+        self._sizes = state['sizes']
+        self._metadata = state['metadata']
+        self._owner = False
+        # the block is owned by the publishing process, which is responsible
+        # for unlinking it, so it is not tracked by the attaching processes
+        # where supported (Python 3.13+).  Otherwise, the workers of a pool
+        # share the resource tracker of their parent, where the block is
+        # already registered.
+        try:
+            self._shm = shared_memory.SharedMemory(name=state['name'], track=False)
+        except TypeError:
+            self._shm = shared_memory.SharedMemory(name=state['name'])
+
+
+class _SharedGraphView(nx.Graph):
+    # A graph whose node and adjacency mappings are backed by the arrays of
+    # a SharedGraph.  Pickling a view only pickles its handle, so that views
+    # can be sent to the workers of a pool directly.
+    def __init__(self, shared):
+        super().__init__()
+        self._shared = shared
+
+    def __reduce__(self):
+        return (SharedGraph.graph, (self._shared,))
+
+
+class _CSRNodes(Mapping):
+    # Node mapping of a shared graph.  The nodes are held as a sorted array of
+    # linear indices, so that the row of a node is found by binary search.
+    def __init__(self, shared, nodes):
+        self._nodes = nodes
+        self._to_linear, self._from_linear, attributes = _label_conversions(shared._metadata)
+        self._attributes = attributes if shared._metadata.get('data') else None
+
+    def _row(self, v):
+        # the row of node v, or -1 if v is not a node
+        try:
+            r = v if self._to_linear is None else self._to_linear(v)
+            i = int(np.searchsorted(self._nodes, r))
+        except (TypeError, ValueError, OverflowError):
+            return -1
+        if i < len(self._nodes) and self._nodes[i] == r:
+            return i
+        return -1
+
+    def _labels(self, rows):
+        linear = self._nodes[rows].tolist()
+        if self._from_linear is None:
+            return linear
+        return [self._from_linear(r) for r in linear]
+
+    def __getitem__(self, v):
+        if self._row(v) < 0:
+            raise KeyError(v)
+        if self._attributes is None:
+            return _EMPTY_ATTRIBUTES
+        return _ReadOnlyNodeData(v, self._attributes)
+
+    def __contains__(self, v):
+        return self._row(v) >= 0
+
+    def __iter__(self):
+        return iter(self._labels(slice(None)))
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class _CSRAdjacency(Mapping):
+    def __init__(self, nodes, indptr, indices):
+        self._nodes = nodes
+        self._indptr = indptr
+        self._indices = indices
+
+    def __getitem__(self, v):
+        i = self._nodes._row(v)
+        if i < 0:
+            raise KeyError(v)
+        return _CSRNeighbors(self._nodes, self._indices[self._indptr[i]:self._indptr[i + 1]])
+
+    def __contains__(self, v):
+        return v in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class _CSRNeighbors(Mapping):
+    # Neighbors of a node of a shared graph, given by their (sorted) rows.
+    def __init__(self, nodes, rows):
+        self._nodes = nodes
+        self._rows = rows
+
+    def __getitem__(self, u):
+        i = self._nodes._row(u)
+        k = np.searchsorted(self._rows, i)
+        if i < 0 or k == len(self._rows) or self._rows[k] != i:
+            raise KeyError(u)
+        return _EMPTY_ATTRIBUTES
+
+    def __contains__(self, u):
+        try:
+            self[u]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._nodes._labels(self._rows))
+
+    def __len__(self):
+        return len(self._rows)
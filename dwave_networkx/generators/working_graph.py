@@ -0,0 +1,172 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Generators for the working graphs of D-Wave systems from solver properties.
+"""
+import collections
+import hashlib
+import threading
+
+import networkx as nx
+import numpy as np
+
+from .chimera import chimera_graph, chimera_coordinates
+from .pegasus import pegasus_graph, pegasus_coordinates
+from .zephyr import zephyr_graph, zephyr_coordinates
+
+__all__ = ['working_graph_from_properties']
+
+
+# maximum number of working graphs kept by working_graph_from_properties
+_WORKING_GRAPH_CACHE_SIZE = 16
+
+_working_graph_cache = collections.OrderedDict()
+_working_graph_cache_lock = threading.Lock()
+
+
+def working_graph_from_properties(properties, data=True, cache=True):
+    """Creates the working graph of a solver from its properties.
+
+    The topology family and shape are read from ``properties['topology']``,
+    and the ``'qubits'`` and ``'couplers'`` properties are checked against
+    the full-yield graph of that topology before the graph is constructed.
+
+    Parameters
+    ----------
+    properties : dict
+        Solver properties, containing at least the ``'topology'``,
+        ``'qubits'`` and ``'couplers'`` keys.  The topology is a dict of the
+        form ``{'type': family, 'shape': shape}``, where family is one of
+        ``'chimera'`` (with shape ``[m, n, t]``), ``'pegasus'`` (with shape
+        ``[m]``) or ``'zephyr'`` (with shape ``[m, t]``).  Qubits are given
+        as linear indices and couplers as pairs of linear indices.
+    data : bool, optional (default :code:`True`)
+        If :code:`True`, each node has the coordinate attribute described by
+        the generator of the topology family.
+    cache : bool, optional (default :code:`True`)
+        If :code:`True`, the graph is memoized on a hash of the topology,
+        qubits and couplers, so that later calls with the same properties
+        return the same graph without checking or constructing it again.
+        The graph is then frozen (see :func:`networkx.freeze`); use
+        ``G.copy()`` to obtain a graph that can be modified.  Freezing does
+        not protect the graph attributes ``G.graph`` nor the node attributes,
+        and the same graph is returned to every caller, so changes to them
+        are seen by every later call with the same properties.
+
+    Returns
+    -------
+    G : NetworkX Graph
+        The working graph, with the same graph attributes as the graphs
+        constructed by :func:`.chimera_graph`, :func:`.pegasus_graph` or
+        :func:`.zephyr_graph`.
+
+    Raises
+    ------
+    ValueError
+        If the topology is not recognized, or if the qubits or couplers are
+        not compatible with it.
+
+    Examples
+    --------
+    >>> properties = {'topology': {'type': 'chimera', 'shape': [1, 1, 4]},
+    ...               'qubits': [0, 1, 4, 5],
+    ...               'couplers': [[0, 4], [0, 5], [1, 4]]}
+    >>> G = dnx.working_graph_from_properties(properties)
+    >>> G.number_of_edges()
+    3
+
+    """
+    try:
+        topology = properties['topology']
+        family = topology['type']
+        shape = tuple(int(s) for s in topology['shape'])
+    except (KeyError, TypeError):
+        raise ValueError("properties must describe the topology of the solver") from None
+
+    qubits = np.asarray(properties['qubits'], dtype=np.int64).reshape(-1)
+    couplers = np.asarray(properties['couplers'], dtype=np.int64).reshape(-1, 2)
+
+    if not cache:
+        return _working_graph(family, shape, qubits, couplers, data)
+
+    digest = hashlib.blake2b(repr((family, shape, bool(data))).encode())
+    digest.update(qubits.tobytes())
+    digest.update(b'|')
+    digest.update(couplers.tobytes())
+    key = digest.digest()
+
+    with _working_graph_cache_lock:
+        G = _working_graph_cache.get(key)
+        if G is not None:
+            _working_graph_cache.move_to_end(key)
+            return G
+
+    G = nx.freeze(_working_graph(family, shape, qubits, couplers, data))
+
+    with _working_graph_cache_lock:
+        _working_graph_cache[key] = G
+        while len(_working_graph_cache) > _WORKING_GRAPH_CACHE_SIZE:
+            _working_graph_cache.popitem(last=False)
+
+    return G
+
+
+def _working_graph(family, shape, qubits, couplers, data):
+    if family == 'chimera':
+        m, n, t = shape
+        num_nodes = 2*m*n*t
+        coords = chimera_coordinates(m, n, t)
+        def generator(node_list, edge_list):
+            return chimera_graph(m, n, t, node_list=node_list, edge_list=edge_list, data=data)
+    elif family == 'pegasus':
+        m, = shape
+        num_nodes = 24*m*(m - 1)
+        coords = pegasus_coordinates(m)
+        def generator(node_list, edge_list):
+            return pegasus_graph(m, node_list=node_list, edge_list=edge_list, data=data)
+    elif family == 'zephyr':
+        m, t = shape
+        num_nodes = 4*t*m*(2*m + 1)
+        coords = zephyr_coordinates(m, t)
+        def generator(node_list, edge_list):
+            return zephyr_graph(m, t, node_list=node_list, edge_list=edge_list, data=data)
+    else:
+        raise ValueError(f"topology type {family!r} not recognized")
+
+    if ((qubits < 0) | (qubits >= num_nodes)).any():
+        raise ValueError("qubits contains nodes incompatible with the topology")
+    if len(np.unique(qubits)) < len(qubits):
+        raise ValueError("qubits contains duplicates")
+
+    # a node of the full-yield graph has at least one neighbor, which
+    # excludes e.g. the nodes outside of the Pegasus fabric
+    nbrs, degree = coords.neighbor_array(qubits)
+    if not degree.all():
+        raise ValueError("qubits contains nodes incompatible with the topology")
+
+    # every coupler must join two qubits which are adjacent in the full-yield
+    # graph; each coupler is located by a binary search in the sorted qubits
+    if not np.isin(couplers, qubits).all():
+        raise ValueError("couplers contains nodes absent from qubits")
+    order = np.argsort(qubits)
+    pos = np.searchsorted(qubits[order], couplers)
+    rows = order[pos[:, 0]]
+    if not (nbrs[rows] == couplers[:, 1:]).any(axis=1).all():
+        raise ValueError("couplers contains edges incompatible with the topology")
+    edges = np.sort(couplers, axis=1)
+    if len(np.unique(edges, axis=0)) < len(edges):
+        raise ValueError("couplers contains duplicates")
+
+    return generator(qubits.tolist(), couplers.tolist())
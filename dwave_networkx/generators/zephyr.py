@@ -20,12 +20,14 @@ import warnings
 from itertools import product
 
 import networkx as nx
+import numpy as np
 
 from dwave_networkx.exceptions import DWaveNetworkXException
 
 from .chimera import _chimera_coordinates_cache
 
-from .common import _add_compatible_edges, _add_compatible_nodes, _add_compatible_terms
+from .common import (_add_compatible_edges, _add_compatible_nodes, _add_compatible_terms,
+                     _pack_neighbor_array, _set_lazy_node_data, _TopologyGraph)
 
 __all__ = ['zephyr_graph',
            'zephyr_coordinates',
@@ -64,11 +66,12 @@ def zephyr_graph(m, t=4, create_using=None, node_list=None, edge_list=None,
         per the topology description below; incompatible edges are ignored 
         unless you set :code:`check_edge_list=True`. If not specified, all edges
         compatible with the ``node_list`` and topology description are included.
-    data : bool, optional (default :code:`True`)
+    data : bool or 'lazy', optional (default :code:`True`)
         If :code:`True`, adds to each node an attribute with a format that depends on
         the ``coordinates`` parameter: a 5-tuple ``'zephyr_index'`` if
         :code:`coordinates=False` and an integer ``'linear_index'`` if ``coordinates``
-        is :code:`True`.
+        is :code:`True`.  If ``'lazy'``, the attribute is not stored but computed
+        from the node label each time it is accessed.
     coordinates : bool, optional (default :code:`False`)
         If :code:`True`, node labels are 5-tuple Zephyr indices.
     check_node_list : bool (optional, default :code:`False`)
@@ -89,6 +92,9 @@ def zephyr_graph(m, t=4, create_using=None, node_list=None, edge_list=None,
     -------
     G : NetworkX Graph
         A Zephyr lattice for grid parameter ``m`` and tile parameter ``t``.
+        Pickling or copying the graph with :mod:`copy` stores its construction
+        parameters and the nodes and edges it lacks, so the copy has the same
+        nodes, edges and attributes, listed in the order of the generator.
 
 
     The maximum degree of this graph is :math:`4t+4`. The number of nodes is
@@ -163,7 +169,7 @@ def zephyr_graph(m, t=4, create_using=None, node_list=None, edge_list=None,
     October 2021.
     https://dwavesys.com/media/fawfas04/14-1056a-a_zephyr_topology_of_d-wave_quantum_processors.pdf
     """
-    G = nx.empty_graph(0, create_using)
+    G = nx.empty_graph(0, _TopologyGraph if create_using is None else create_using)
     m = int(m)
     t = int(t)
 
@@ -228,7 +234,13 @@ def zephyr_graph(m, t=4, create_using=None, node_list=None, edge_list=None,
             G.remove_nodes_from(set(G) - nodes)
             G.add_nodes_from(nodes)  # for singleton nodes
 
-    if data:
+    if data == 'lazy':
+        coords = zephyr_coordinates(m, t)
+        if coordinates:
+            _set_lazy_node_data(G, {'linear_index': coords.zephyr_to_linear}, (2, M, t, 2, m))
+        else:
+            _set_lazy_node_data(G, {'zephyr_index': coords.linear_to_zephyr}, 2*M*t*2*m)
+    elif data:
         if coordinates:
             def fill_data():
                 d = get_node_data((u, w, k, j, z))
@@ -416,6 +428,127 @@ class zephyr_coordinates(object):
             coordinates=True,
         )
 
+    def _zephyr_neighbors(self, q):
+        """Yields the neighbors of the 5-term Zephyr coordinate ``q`` in a
+        full-yield Zephyr graph.
+        """
+        m, M, t = self.args
+        u, w, k, j, z = q
+        # internal edges
+        for i in (0, 1):
+            wi = (w - i) // 2
+            if 0 <= wi < m:
+                for b in (0, 1):
+                    for h in range(t):
+                        yield 1 - u, 2*z + 1 + b*(2*j - 1), h, i, wi
+        # odd edges
+        yield u, w, k, 1 - j, z
+        if 0 <= z + 2*j - 1 < m:
+            yield u, w, k, 1 - j, z + 2*j - 1
+        # external edges
+        if z > 0:
+            yield u, w, k, j, z - 1
+        if z < m - 1:
+            yield u, w, k, j, z + 1
+
+    def neighbors(self, q, labels='int'):
+        """Returns the neighbors of a node in the full-yield Zephyr graph.
+
+        The neighbors are computed arithmetically, so no graph is constructed.
+
+        Parameters
+        ----------
+        q : int or 5-tuple
+            A node label.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``q`` and of the returned
+            neighbors; either ``'int'`` (linear indices) or ``'coordinate'``
+            (5-term Zephyr coordinates).
+
+        Returns
+        -------
+        neighbors : list
+            The neighbors of ``q`` in ``zephyr_graph(m, t)``.
+
+        Examples
+        --------
+        >>> len(dnx.zephyr_coordinates(2).neighbors(26))
+        19
+
+        """
+        if labels == 'int':
+            return list(self.iter_zephyr_to_linear(
+                self._zephyr_neighbors(self.linear_to_zephyr(q))))
+        elif labels == 'coordinate':
+            return list(self._zephyr_neighbors(q))
+        raise ValueError(f"Node labeling {labels} not recognized")
+
+    def neighbor_array(self, nodes, labels='int'):
+        """Computes the neighbors of many nodes in the full-yield Zephyr graph.
+
+        Parameters
+        ----------
+        nodes : array_like
+            Node labels; a sequence of linear indices if ``labels='int'``, or
+            an array of shape (N, 5) of Zephyr coordinates if
+            ``labels='coordinate'``.
+        labels : str, optional (default 'int')
+            The node labeling convention of ``nodes`` and of the returned
+            neighbors; either ``'int'`` or ``'coordinate'``.
+
+        Returns
+        -------
+        neighbors : numpy.ndarray
+            An array of shape (N, 4t + 4) (or (N, 4t + 4, 5) for coordinate
+            labels) where row ``i`` lists the neighbors of ``nodes[i]``,
+            padded with -1.
+        degree : numpy.ndarray
+            An array of shape (N,) containing the degree of each node.
+
+        Examples
+        --------
+        >>> nbrs, degree = dnx.zephyr_coordinates(2).neighbor_array([0, 26])
+        >>> degree
+        array([10, 19])
+
+        """
+        m, M, t = self.args
+        if labels == 'int':
+            r = np.asarray(nodes, dtype=np.int64).reshape(-1)
+            r, z = np.divmod(r, m)
+            r, j = np.divmod(r, 2)
+            r, k = np.divmod(r, t)
+            u, w = np.divmod(r, M)
+        elif labels == 'coordinate':
+            u, w, k, j, z = np.asarray(nodes, dtype=np.int64).reshape(-1, 5).T
+        else:
+            raise ValueError(f"Node labeling {labels} not recognized")
+
+        u, w, k, j, z = (x[:, None] for x in (u, w, k, j, z))
+
+        # internal edges occupy the first 4t slots, indexed by (i, b, h)
+        i, b, h = (x.ravel() for x in np.meshgrid((0, 1), (0, 1), np.arange(t), indexing='ij'))
+        wi = (w - i) // 2
+        internal = (1 - u + 0*i, 2*z + 1 + b*(2*j - 1), h + 0*u, i + 0*u, wi)
+        internal_mask = (wi >= 0) & (wi < m)
+
+        # followed by two odd and two external edges
+        zz = np.concatenate((z, z + 2*j - 1, z - 1, z + 1), axis=1)
+        jj = np.concatenate((1 - j, 1 - j, j, j), axis=1)
+        other = (u + 0*zz, w + 0*zz, k + 0*zz, jj, zz)
+        other_mask = (zz >= 0) & (zz < m)
+
+        columns = [np.concatenate(pair, axis=1) for pair in zip(internal, other)]
+        mask = np.concatenate((internal_mask, other_mask), axis=1)
+        (uu, ww, kk, jj, zz), degree = _pack_neighbor_array(columns, mask)
+
+        if labels == 'int':
+            nbrs = (((uu * M + ww) * t + kk) * 2 + jj) * m + zz
+            nbrs[uu < 0] = -1
+        else:
+            nbrs = np.stack((uu, ww, kk, jj, zz), axis=-1)
+        return nbrs, degree
+
 
 class __zephyr_coordinates_cache_dict(dict):
     """An internal-use cached factory for `zephyr_coordinates` objects"""
@@ -156,3 +156,87 @@ class TestVertexColorQUBO(unittest.TestCase):
         self.assertEqual(len(bqm), len(G)*len(colors))
         self.assertEqual(len(bqm.quadratic), len(G)*len(colors)*(len(colors)-1)/2
                          + len(G.edges)*len(colors))
+
+
+def _reference_qubo(G, colors):
+    # the vertex coloring QUBO, built one bias at a time
+    Q = {}
+    for v in G.nodes:
+        for c in colors:
+            Q[(v, c), (v, c)] = -1
+        for c0, c1 in itertools.combinations(colors, 2):
+            Q[(v, c0), (v, c1)] = 2
+    for u, v in G.edges:
+        for c in colors:
+            Q[(u, c), (v, c)] = 1
+    return Q
+
+
+class TestVertexColorBQM(unittest.TestCase):
+    def assertSameBQM(self, bqm, labels, Q):
+        self.assertIs(bqm.vartype, dimod.BINARY)
+        self.assertEqual(len(labels), len(bqm))
+        bqm = bqm.relabel_variables(dict(enumerate(labels)), inplace=False)
+        self.assertEqual(bqm, dimod.BinaryQuadraticModel.from_qubo(Q))
+
+    def test_empty(self):
+        bqm, labels = dnx.vertex_color_bqm(nx.Graph(), 3)
+        self.assertEqual(len(bqm), 0)
+        self.assertEqual(list(labels), [])
+
+    def test_labels(self):
+        bqm, labels = dnx.vertex_color_bqm(nx.path_graph('ab'), ['red', 'blue'])
+        self.assertEqual(list(labels), [('a', 'red'), ('a', 'blue'), ('b', 'red'), ('b', 'blue')])
+        self.assertEqual(labels[-1], ('b', 'blue'))
+        self.assertEqual(labels[1:3], [('a', 'blue'), ('b', 'red')])
+        self.assertEqual(labels.index(('b', 'red')), 2)
+        self.assertIn(('a', 'blue'), labels)
+        with self.assertRaises(IndexError):
+            labels[4]
+
+    def test_reference(self):
+        G = nx.karate_club_graph()
+        for colors in [1, 4, ['red', 'green', 'blue']]:
+            with self.subTest(colors=colors):
+                reference = _reference_qubo(G, range(colors) if isinstance(colors, int) else colors)
+                self.assertSameBQM(*dnx.vertex_color_bqm(G, colors), reference)
+                self.assertEqual(dimod.BinaryQuadraticModel.from_qubo(dnx.vertex_color_qubo(G, colors)),
+                                 dimod.BinaryQuadraticModel.from_qubo(reference))
+
+    def test_self_loop(self):
+        G = nx.Graph([(0, 1), (1, 1)])
+        self.assertSameBQM(*dnx.vertex_color_bqm(G, 3), _reference_qubo(G, range(3)))
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (1, 0), (1, 2)])
+        self.assertSameBQM(*dnx.vertex_color_bqm(G, 3), _reference_qubo(G, range(3)))
+
+    def test_docstring_stats(self):
+        G = nx.karate_club_graph()
+        bqm, __ = dnx.vertex_color_bqm(G, 10)
+
+        self.assertEqual(len(bqm), len(G)*10)
+        self.assertEqual(len(bqm.quadratic), len(G)*10*9/2 + len(G.edges)*10)
+
+    def test_min_vertex_color(self):
+        G = nx.petersen_graph()
+
+        # the bounds are 3 and 4 colors, the fourth color is penalized
+        Q = _reference_qubo(G, range(4))
+        for v in G:
+            Q[(v, 3), (v, 3)] += 0.5
+
+        self.assertSameBQM(*dnx.min_vertex_color_bqm(G, chromatic_lb=3, chromatic_ub=4), Q)
+        self.assertEqual(
+            dimod.BinaryQuadraticModel.from_qubo(dnx.min_vertex_color_qubo(G, chromatic_lb=3, chromatic_ub=4)),
+            dimod.BinaryQuadraticModel.from_qubo(Q))
+
+    def test_min_vertex_color_ground_state(self):
+        G = nx.cycle_graph(5)
+
+        bqm, labels = dnx.min_vertex_color_bqm(G)
+        sample = dimod.ExactSolver().sample(bqm).first.sample
+        coloring = dict(labels[i] for i, val in sample.items() if val)
+
+        self.assertTrue(dnx.is_vertex_coloring(G, coloring))
+        self.assertEqual(len(set(coloring.values())), 3)
@@ -0,0 +1,104 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import networkx as nx
+import numpy as np
+
+import dwave_networkx as dnx
+
+
+def _reference_distances(G, sources, nodelist):
+    D = np.full((len(sources), len(nodelist)), -1)
+    for i, s in enumerate(sources):
+        lengths = nx.single_source_shortest_path_length(G, s)
+        for j, v in enumerate(nodelist):
+            D[i, j] = lengths.get(v, -1)
+    return D
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    def check_distances(self, G, **kwargs):
+        nodelist = kwargs.get('nodelist', list(G))
+        sources = kwargs.get('sources', nodelist)
+        D = dnx.distance_matrix(G, **kwargs)
+        self.assertEqual(D.shape, (len(sources), len(nodelist)))
+        np.testing.assert_array_equal(D, _reference_distances(G, sources, nodelist))
+
+    def test_empty(self):
+        D = dnx.distance_matrix(nx.Graph())
+        self.assertEqual(D.shape, (0, 0))
+
+    def test_disconnected(self):
+        G = nx.path_graph(5)
+        G.add_nodes_from('ab')
+        G.add_edge(2, 2)
+        self.check_distances(G)
+        self.check_distances(G, sources=['a', 3, 3], batch_size=1)
+
+    def test_directed(self):
+        D = dnx.distance_matrix(nx.DiGraph([(0, 1)]))
+        np.testing.assert_array_equal(D, [[0, 1], [-1, 0]])
+
+        G = nx.gnp_random_graph(30, .08, seed=1, directed=True)
+        self.check_distances(G)
+        self.check_distances(nx.MultiDiGraph(G), sources=[3, 5])
+
+    def test_batches(self):
+        G = nx.grid_2d_graph(13, 11)
+        self.check_distances(G, batch_size=64)
+        self.check_distances(G, sources=[(0, 0), (12, 10)], nodelist=sorted(G))
+
+    def test_chimera(self):
+        for m, n, t in [(1, 1, 1), (2, 3, 4), (4, 2, 2)]:
+            for coordinates in (False, True):
+                G = dnx.chimera_graph(m, n, t, coordinates=coordinates)
+                self.check_distances(G)
+
+        # a working graph falls back on the breadth-first search
+        G = dnx.chimera_graph(3)
+        G.remove_nodes_from([5, 13, 40])
+        self.check_distances(G)
+
+    def test_chimera_same_counts(self):
+        # the node and edge counts are those of a full-yield graph, but one
+        # coupler was replaced by an edge that is not a coupler
+        G = dnx.chimera_graph(2, 2, 2)
+        G.remove_edge(0, 2)
+        G.add_edge(0, 1)
+        self.check_distances(G)
+
+        G = dnx.chimera_graph(2, 2, 2, coordinates=True)
+        G.remove_edge((0, 0, 0, 0), (0, 0, 1, 0))
+        G.add_edge((0, 0, 0, 0), (1, 1, 1, 1))
+        self.check_distances(G)
+
+    def test_pegasus(self):
+        G = dnx.pegasus_graph(3)
+        G.remove_edges_from(list(G.edges)[::7])
+        self.check_distances(G)
+
+    def test_zephyr(self):
+        G = dnx.zephyr_graph(2, coordinates=True)
+        self.check_distances(G, sources=list(G)[::5])
+
+    def test_bad_nodes(self):
+        G = nx.path_graph(3)
+        with self.assertRaises(ValueError):
+            dnx.distance_matrix(G, sources=[3])
+        with self.assertRaises(ValueError):
+            dnx.distance_matrix(G, nodelist=[0, 1])
+        with self.assertRaises(ValueError):
+            dnx.distance_matrix(dnx.chimera_graph(1), sources=[8])
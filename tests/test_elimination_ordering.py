@@ -12,12 +12,39 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import itertools
+import random
 import unittest
 
 import networkx as nx
 import dwave_networkx as dnx
 
 
+def _exact_treewidth(G):
+    # the treewidth of G by dynamic programming over the sets of eliminated
+    # vertices: eliminating v after the set S costs the number of vertices
+    # outside of S, other than v, reachable from v through S
+    nodes = list(G)
+
+    def cost(S, v):
+        seen, stack, reached = {v}, [v], 0
+        while stack:
+            for u in G[stack.pop()]:
+                if u not in seen:
+                    seen.add(u)
+                    if u in S:
+                        stack.append(u)
+                    else:
+                        reached += 1
+        return reached
+
+    tw = {frozenset(): -1}
+    for size in range(1, len(nodes) + 1):
+        for S in map(frozenset, itertools.combinations(nodes, size)):
+            tw[S] = min(max(tw[S - {v}], cost(S - {v}, v)) for v in S)
+    return max(tw[frozenset(nodes)], 0)
+
+
 class HeuristicCases:
     """Change the name for compatibility with nose."""
 
@@ -96,16 +123,71 @@ class TestMinWidth(unittest.TestCase, HeuristicCases):
     def setUp(self):
         self.heuristic = dnx.min_width_heuristic
 
+    def test_seed(self):
+        G = nx.gnp_random_graph(30, .2, seed=5)
+        self.assertEqual(dnx.min_width_heuristic(G, seed=17), dnx.min_width_heuristic(G, seed=17))
+
+    def test_min_width(self):
+        # each node of the order has minimum degree when it is eliminated
+        for seed in range(10):
+            G = nx.gnp_random_graph(25, .2, seed=seed)
+            tw, order = dnx.min_width_heuristic(G, seed=seed)
+            self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+            G = G.copy()
+            for v in order:
+                self.assertEqual(G.degree(v), min(d for _, d in G.degree))
+                G.add_edges_from(itertools.combinations(G[v], 2))
+                G.remove_node(v)
+
 
 class TestMinFill(unittest.TestCase, HeuristicCases):
     def setUp(self):
         self.heuristic = dnx.min_fill_heuristic
 
+    def test_seed(self):
+        G = nx.gnp_random_graph(30, .2, seed=5)
+        self.assertEqual(dnx.min_fill_heuristic(G, seed=17), dnx.min_fill_heuristic(G, seed=17))
+
+    def test_min_fill(self):
+        # each node of the order has minimum fill when it is eliminated
+        def fill(G, v):
+            return sum(not G.has_edge(a, b) for a, b in itertools.combinations(G[v], 2))
+
+        for seed in range(10):
+            G = nx.gnp_random_graph(25, .3, seed=seed)
+            tw, order = dnx.min_fill_heuristic(G, seed=seed)
+            self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+            G = G.copy()
+            for v in order:
+                self.assertEqual(fill(G, v), min(fill(G, u) for u in G))
+                G.add_edges_from(itertools.combinations(G[v], 2))
+                G.remove_node(v)
+
 
 class TestMaxCardinality(unittest.TestCase, HeuristicCases):
     def setUp(self):
         self.heuristic = dnx.max_cardinality_heuristic
 
+    def test_seed(self):
+        G = nx.gnp_random_graph(30, .2, seed=5)
+        self.assertEqual(dnx.max_cardinality_heuristic(G, seed=17),
+                         dnx.max_cardinality_heuristic(G, seed=17))
+
+    def test_max_cardinality(self):
+        # working backwards, each node has the most labelled neighbors
+        for seed in range(10):
+            G = nx.gnp_random_graph(25, .2, seed=seed)
+            tw, order = dnx.max_cardinality_heuristic(G, seed=seed)
+            self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+            labelled = set()
+            for v in reversed(order):
+                count = {u: len(labelled.intersection(G[u])) for u in G if u not in labelled}
+                self.assertEqual(count[v], max(count.values()))
+                labelled.add(v)
+
 
 class TestMinorMinWidth(unittest.TestCase):
     def test_basic(self):
@@ -140,6 +222,24 @@ class TestMinorMinWidth(unittest.TestCase):
 
         lb = dnx.minor_min_width(graph)
 
+    def test_contraction(self):
+        for seed in range(20):
+            G = nx.gnp_random_graph(8, .4, seed=seed)
+            tw, __ = dnx.treewidth_branch_and_bound(G)
+            for contraction in ['least-c', 'min-d', None]:
+                self.assertLessEqual(dnx.minor_min_width(G, contraction), tw)
+
+            # without contraction, the bound is the degeneracy
+            self.assertEqual(dnx.minor_min_width(G, None), max(nx.core_number(G).values()))
+
+        G = nx.grid_2d_graph(6, 6)
+        self.assertEqual(dnx.minor_min_width(G, None), 2)
+        self.assertGreater(dnx.minor_min_width(G, 'least-c'), 2)
+
+    def test_invalid_contraction(self):
+        with self.assertRaises(ValueError):
+            dnx.minor_min_width(nx.path_graph(3), 'max-d')
+
 
 class TestSimplicialTests(unittest.TestCase):
     def test_typical(self):
@@ -295,6 +395,288 @@ class TestBranchAndBound(unittest.TestCase):
 
         self.assertEqual(tw, 2)
 
+    def test_random(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(7, .4, seed=seed)
+            true_tw = min(dnx.elimination_order_width(G, order)
+                          for order in itertools.permutations(G))
+
+            tw, order = dnx.treewidth_branch_and_bound(G)
+            self.check_order(G, order)
+            self.assertEqual(tw, true_tw)
+            self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+    def test_workers(self):
+        for G in [dnx.chimera_graph(2, 2, 3),
+                  nx.grid_2d_graph(4, 5),
+                  nx.gnp_random_graph(15, .4, seed=0)]:
+            true_tw, __ = dnx.treewidth_branch_and_bound(G)
+
+            tw, order = dnx.treewidth_branch_and_bound(G, workers=2)
+            self.check_order(G, order)
+            self.assertEqual(tw, true_tw)
+            self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+            # the order does not depend on the scheduling of the workers
+            self.assertEqual(dnx.treewidth_branch_and_bound(G, workers=3), (tw, order))
+
+        with self.assertRaises(ValueError):
+            dnx.treewidth_branch_and_bound(nx.complete_graph(3), workers=0)
+
+    def test_workers_upperbound(self):
+        G = nx.grid_2d_graph(3, 4)
+
+        tw, order = dnx.treewidth_branch_and_bound(G, treewidth_upperbound=3, workers=2)
+        self.assertEqual(tw, 3)
+        self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+        tw, order = dnx.treewidth_branch_and_bound(G, treewidth_upperbound=2, workers=2)
+        self.assertEqual(order, [])
+
+    def test_info(self):
+        G = dnx.chimera_graph(2, 2, 3)
+
+        info = {}
+        tw, order = dnx.treewidth_branch_and_bound(G, info=info)
+        self.assertEqual(info['lower_bound'], tw)
+        self.assertTrue(info['optimal'])
+        self.assertGreater(info['nodes_expanded'], 0)
+        for key in ['pruned_lower_bound', 'pruned_theorem6p1', 'pruned_theorem6p2',
+                    'pruned_theorem6p4', 'edges_theorem5p4', 'reductions']:
+            self.assertGreaterEqual(info[key], 0)
+
+        info = {}
+        self.assertEqual(dnx.treewidth_branch_and_bound(G, workers=2, info=info)[0], tw)
+        self.assertEqual(info['lower_bound'], tw)
+        self.assertTrue(info['optimal'])
+
+        info = {}
+        dnx.treewidth_branch_and_bound(nx.complete_graph(5), info=info)
+        self.assertEqual(info['lower_bound'], 4)
+        self.assertTrue(info['optimal'])
+
+    def test_limits(self):
+        G = nx.gnp_random_graph(22, .3, seed=2)
+
+        for kwargs in [dict(node_limit=10), dict(time_limit=0)]:
+            info = {}
+            ub, order = dnx.treewidth_branch_and_bound(G, info=info, **kwargs)
+            self.check_order(G, order)
+            self.assertLessEqual(dnx.elimination_order_width(G, order), ub)
+            self.assertLessEqual(info['lower_bound'], 10)  # the treewidth
+            self.assertGreaterEqual(ub, 10)
+            self.assertFalse(info['optimal'])
+            self.assertLessEqual(info['nodes_expanded'], kwargs.get('node_limit', 1))
+
+        with self.assertRaises(ValueError):
+            dnx.treewidth_branch_and_bound(G, workers=2, time_limit=1)
+
+    def test_callback(self):
+        G = dnx.chimera_graph(2, 2, 3)  # min-fill finds an order of width 8
+        found = []
+
+        def callback(width, order):
+            self.check_order(G, order)
+            self.assertEqual(dnx.elimination_order_width(G, order), width)
+            found.append(width)
+
+        tw, order = dnx.treewidth_branch_and_bound(G, callback=callback)
+        self.assertEqual(found[-1], tw)
+        self.assertEqual(found, sorted(found, reverse=True))
+
+    def test_table_size(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(16, .35, seed=seed)
+            true_tw, __ = dnx.treewidth_branch_and_bound(G, table_size=0)
+
+            for table_size in [1, 16, 2**16]:
+                info = {}
+                tw, order = dnx.treewidth_branch_and_bound(G, table_size=table_size, info=info)
+                self.assertEqual(tw, true_tw)
+                self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+        G = nx.gnp_random_graph(20, .3, seed=2)
+        info = {}
+        dnx.treewidth_branch_and_bound(G, info=info)
+        self.assertGreater(info['pruned_theorem6p1'], 0)
+
+        info = {}
+        dnx.treewidth_branch_and_bound(G, table_size=0, info=info)
+        self.assertEqual(info['pruned_theorem6p1'], 0)
+
+    def test_brute_force(self):
+        graphs = [nx.gnp_random_graph(n, p, seed=seed)
+                  for n, p, seed in [(8, .4, 0), (9, .5, 1), (10, .3, 2), (10, .6, 3)]]
+        # an order of larger width was once returned as optimal on this graph
+        G = nx.gnp_random_graph(10, .5, seed=268)
+
+        for H in graphs + [G]:
+            tw = _exact_treewidth(H)
+            for seed in range(5 if H is not G else 30):
+                random.seed(seed)
+                info = {}
+                width, order = dnx.treewidth_branch_and_bound(H, info=info)
+                self.assertEqual(width, tw)
+                self.assertEqual(dnx.elimination_order_width(H, order), tw)
+                self.assertEqual(info['lower_bound'], tw)
+                self.assertTrue(info['optimal'])
+
+    def test_theorem5p4(self):
+        theorem5p4 = dnx.algorithms.elimination_ordering._theorem5p4
+
+        for seed in range(50):
+            G = nx.gnp_random_graph(12, .5, seed=seed)
+            ub = seed % 6
+
+            # add an edge between any two vertices with ub + 1 common neighbors,
+            # until there are none
+            H = G.copy()
+            while True:
+                new_edges = [(u, v) for u, v in itertools.combinations(H, 2)
+                             if not H.has_edge(u, v) and len(set(H[u]) & set(H[v])) > ub]
+                if not new_edges:
+                    break
+                H.add_edges_from(new_edges)
+
+            adj = [sum(1 << u for u in G[v]) for v in G]
+            undo = []
+            num_edges = theorem5p4(adj, (1 << len(G)) - 1, ub, undo)
+            self.assertEqual(num_edges, H.number_of_edges() - G.number_of_edges())
+            self.assertEqual(adj, [sum(1 << u for u in H[v]) for v in H])
+
+    def test_contraction(self):
+        G = dnx.chimera_graph(2, 2, 3)
+        for contraction in ['least-c', 'min-d', None]:
+            tw, order = dnx.treewidth_branch_and_bound(G, contraction=contraction)
+            self.check_order(G, order)
+            self.assertEqual(tw, 6)
+
+        with self.assertRaises(ValueError):
+            dnx.treewidth_branch_and_bound(G, contraction='max-d')
+
+    def test_labels(self):
+        G = nx.relabel_nodes(nx.grid_2d_graph(3, 5), str)
+
+        tw, order = dnx.treewidth_branch_and_bound(G)
+        self.check_order(G, order)
+        self.assertEqual(tw, 3)
+        self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+
+class TestBestEliminationOrder(unittest.TestCase):
+    def check_order(self, G, tw, order):
+        self.assertEqual(set(order), set(G))
+        self.assertEqual(len(order), len(G))
+        self.assertEqual(dnx.elimination_order_width(G, order), tw)
+
+    def test_empty(self):
+        self.assertEqual(dnx.best_elimination_order(nx.Graph()), (0, []))
+
+    def test_seed(self):
+        G = nx.relabel_nodes(nx.gnp_random_graph(30, .2, seed=5), str)
+
+        tw, order = dnx.best_elimination_order(G, restarts=5, seed=7)
+        self.check_order(G, tw, order)
+        self.assertEqual(dnx.best_elimination_order(G, restarts=5, seed=7), (tw, order))
+
+        self.assertGreaterEqual(tw, dnx.minor_min_width(G))
+
+    def test_heuristics(self):
+        G = dnx.chimera_graph(2, 2, 3)
+
+        tw, order = dnx.best_elimination_order(G, heuristics=[dnx.min_width_heuristic], restarts=3, seed=1)
+        self.check_order(G, tw, order)
+
+    def test_lower_bound(self):
+        # the first order found is optimal, so no more heuristics are run
+        def heuristic(G, seed=None):
+            calls.append(seed)
+            return dnx.min_fill_heuristic(G, seed=seed)
+
+        calls = []
+        G = nx.grid_2d_graph(4, 4)
+        tw, order = dnx.best_elimination_order(G, heuristics=[heuristic], restarts=10, seed=2)
+        self.check_order(G, tw, order)
+        self.assertEqual(tw, 4)
+        self.assertLess(len(calls), 10)
+
+    def test_workers(self):
+        G = nx.gnp_random_graph(40, .15, seed=3)
+
+        result = dnx.best_elimination_order(G, restarts=4, seed=11)
+        self.check_order(G, *result)
+        self.assertEqual(dnx.best_elimination_order(G, restarts=4, workers=2, seed=11), result)
+
+    def test_self_loop(self):
+        G = nx.complete_graph(4)
+        G.add_edge(0, 0)
+        self.assertEqual(dnx.best_elimination_order(G, seed=0)[0], 3)
+
+    def test_exceptions(self):
+        G = nx.path_graph(3)
+        with self.assertRaises(ValueError):
+            dnx.best_elimination_order(G, restarts=0)
+        with self.assertRaises(ValueError):
+            dnx.best_elimination_order(G, workers=0)
+
+
+class TestTreewidthReduction(unittest.TestCase):
+    def check_reduction(self, G, lower_bound=0):
+        tw, __ = dnx.treewidth_branch_and_bound(G)
+        H, order, low = dnx.treewidth_reduction(G, lower_bound)
+
+        self.assertEqual(set(order) | set(H), set(G))
+        self.assertEqual(len(order) + len(H), len(G))
+        self.assertGreaterEqual(low, lower_bound)
+
+        tw_H, order_H = dnx.treewidth_branch_and_bound(H)
+        self.assertEqual(max(low, tw_H), tw)
+        self.assertLessEqual(dnx.elimination_order_width(G, order + order_H), tw)
+        return H, order, low
+
+    def test_empty(self):
+        self.assertEqual(len(dnx.treewidth_reduction(nx.Graph())[0]), 0)
+
+    def test_trees(self):
+        for G in [nx.path_graph(5), nx.star_graph(6), nx.balanced_tree(2, 3)]:
+            H, order, low = self.check_reduction(G)
+            self.assertEqual(len(H), 0)
+            self.assertEqual(low, 1)
+
+    def test_series_parallel(self):
+        G = nx.cycle_graph(6)
+        G.add_edges_from([(0, 6), (6, 3)])
+        H, order, low = self.check_reduction(G)
+        self.assertEqual(len(H), 7)  # no simplicial vertex to start from
+        H, order, low = self.check_reduction(G, dnx.minor_min_width(G))
+        self.assertEqual(len(H), 0)
+        self.assertEqual(low, 2)
+
+    def test_buddy(self):
+        G = nx.complete_bipartite_graph(3, 3)
+        H, order, low = self.check_reduction(G)
+        self.assertEqual(len(H), 6)
+        H, order, low = self.check_reduction(G, 3)
+        self.assertEqual(len(H), 0)
+
+    def test_cube(self):
+        G = nx.relabel_nodes(nx.hypercube_graph(3), str)
+        H, order, low = self.check_reduction(G, 3)
+        self.assertEqual(len(H), 0)
+        self.assertEqual(low, 3)
+
+    def test_random(self):
+        for seed in range(50):
+            G = nx.gnp_random_graph(9, .3, seed=seed)
+            self.check_reduction(G)
+            self.check_reduction(G, dnx.minor_min_width(G))
+
+    def test_self_loop(self):
+        G = nx.complete_graph(4)
+        G.add_edge(0, 0)
+        H, order, low = self.check_reduction(G)
+        self.assertEqual(low, 3)
+
 
 class TestEliminationOrderWidth(unittest.TestCase):
     def test_trivial(self):
@@ -340,6 +722,59 @@ class TestEliminationOrderWidth(unittest.TestCase):
             dnx.elimination_order_width(G, order)
 
 
+class TestEliminationOrderEvaluator(unittest.TestCase):
+    def test_widths(self):
+        rng = random.Random(5)
+        G = nx.relabel_nodes(nx.gnp_random_graph(20, .2, seed=5), str)
+        G.add_edge('0', '0')
+        nodes = list(G)
+        orders = [rng.sample(nodes, len(nodes)) for __ in range(20)]
+
+        evaluator = dnx.EliminationOrderEvaluator(G)
+        self.assertEqual(len(evaluator), 20)
+
+        widths = [dnx.elimination_order_width(G, order) for order in orders]
+        self.assertEqual(evaluator.widths(orders), widths)
+        self.assertEqual([evaluator.width(order) for order in orders], widths)
+
+        # the graph is not modified
+        self.assertEqual(evaluator.widths(orders), widths)
+
+    def test_bound(self):
+        G = dnx.chimera_graph(2, 2, 3)
+        order = dnx.chimera_elimination_order(2, 2, 3)
+        evaluator = dnx.EliminationOrderEvaluator(G)
+
+        self.assertEqual(evaluator.width(order, bound=6), 6)
+        self.assertGreater(evaluator.width(order, bound=5), 5)
+        self.assertGreater(evaluator.width(list(G), bound=6), 6)
+
+    def test_workers(self):
+        rng = random.Random(3)
+        G = dnx.chimera_graph(2, 2, 3)
+        nodes = list(G)
+        orders = [rng.sample(nodes, len(nodes)) for __ in range(10)]
+
+        evaluator = dnx.EliminationOrderEvaluator(G)
+        self.assertEqual(evaluator.widths(orders, workers=2), evaluator.widths(orders))
+
+    def test_empty(self):
+        evaluator = dnx.EliminationOrderEvaluator(nx.Graph())
+        self.assertEqual(evaluator.width([]), 0)
+        self.assertEqual(evaluator.widths([]), [])
+
+    def test_exceptions(self):
+        evaluator = dnx.EliminationOrderEvaluator(nx.path_graph(3))
+        with self.assertRaises(ValueError):
+            evaluator.width([0, 1])
+        with self.assertRaises(ValueError):
+            evaluator.width([0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            evaluator.width([0, 1, 1])
+        with self.assertRaises(ValueError):
+            evaluator.widths([[0, 1, 2]], workers=0)
+
+
 class TestChimeraEliminationOrder(unittest.TestCase):
     def test_variable_order(self):
         n = 8
@@ -367,3 +802,90 @@ class TestPegasusEliminationOrder(unittest.TestCase):
         o = dnx.pegasus_elimination_order(n, coordinates=True)
         tw = dnx.elimination_order_width(p, o)
         self.assertEqual(tw, 12*n-4)
+
+
+class TestTorusEliminationOrder(unittest.TestCase):
+    def check_order(self, G, order, bound):
+        self.assertEqual(set(order), set(G))
+        self.assertEqual(len(order), len(G))
+        tw = dnx.elimination_order_width(G, order)
+        self.assertLessEqual(tw, bound)
+        return tw
+
+    def test_chimera(self):
+        for m, n, t in [(1, 1, 4), (2, 3, 2), (3, 3, 4), (3, 5, 2), (5, 3, 2)]:
+            G = dnx.chimera_torus(m, n, t)
+            self.check_order(G, dnx.chimera_torus_elimination_order(m, n, t), 2*t*min(m, n))
+
+        G = dnx.chimera_torus(4, 6)
+        tw = self.check_order(G, dnx.chimera_torus_elimination_order(4, 6), 32)
+        self.assertLess(tw, dnx.min_fill_heuristic(G, seed=0)[0])
+
+    def test_pegasus(self):
+        for m in [2, 3]:
+            G = dnx.pegasus_torus(m)
+            self.check_order(G, dnx.pegasus_torus_elimination_order(m), 24*(m - 1))
+
+        G = dnx.pegasus_torus(4)
+        tw = self.check_order(G, dnx.pegasus_torus_elimination_order(4), 72)
+        self.assertLess(tw, dnx.min_fill_heuristic(G, seed=0)[0])
+
+    def test_zephyr(self):
+        for m, t in [(1, 1), (1, 4), (2, 2), (2, 3)]:
+            G = dnx.zephyr_torus(m, t)
+            self.check_order(G, dnx.zephyr_torus_elimination_order(m, t), 8*t*m)
+
+        G = dnx.zephyr_torus(3)
+        tw = self.check_order(G, dnx.zephyr_torus_elimination_order(3), 96)
+        self.assertLess(tw, dnx.min_fill_heuristic(G, seed=0)[0])
+
+
+class TestWorkingGraphEliminationOrder(unittest.TestCase):
+    def check_order(self, G, perfect_width, window=1):
+        tw, order = dnx.working_graph_elimination_order(G, window)
+        self.assertEqual(set(order), set(G))
+        self.assertEqual(len(order), len(G))
+        self.assertEqual(dnx.elimination_order_width(G, order), tw)
+        self.assertLessEqual(tw, perfect_width)
+        return tw
+
+    def remove_random(self, G, seed):
+        rng = random.Random(seed)
+        G.remove_nodes_from(rng.sample(sorted(G), len(G) // 20))
+        G.remove_edges_from(rng.sample(sorted(G.edges), len(G.edges) // 50))
+        return G
+
+    def test_perfect(self):
+        self.assertEqual(self.check_order(dnx.chimera_graph(3, 5, 2), 6), 6)
+        self.assertEqual(self.check_order(dnx.pegasus_graph(3), 32), 32)
+        self.assertEqual(self.check_order(dnx.zephyr_graph(2, 2), 20), 20)
+
+    def test_chimera(self):
+        for seed, coordinates in enumerate([False, True]):
+            G = self.remove_random(dnx.chimera_graph(4, 3, coordinates=coordinates), seed)
+            self.check_order(G, 12)
+            self.check_order(G, 12, window=4)
+
+    def test_pegasus(self):
+        for seed, labels in enumerate([{}, {'coordinates': True}, {'nice_coordinates': True}]):
+            G = self.remove_random(dnx.pegasus_graph(3, **labels), seed)
+            self.check_order(G, 32)
+            self.check_order(G, 32, window=4)
+
+    def test_zephyr(self):
+        for seed, coordinates in enumerate([False, True]):
+            G = self.remove_random(dnx.zephyr_graph(2, 3, coordinates=coordinates), seed)
+            self.check_order(G, 30)
+            self.check_order(G, 30, window=4)
+
+    def test_torus(self):
+        for seed, (G, bound) in enumerate([(dnx.chimera_torus(3, 4, 2), 12),
+                                           (dnx.pegasus_torus(3), 48),
+                                           (dnx.zephyr_torus(2, 2), 32)]):
+            self.check_order(self.remove_random(G, seed), bound)
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            dnx.working_graph_elimination_order(nx.path_graph(3))
+        with self.assertRaises(ValueError):
+            dnx.working_graph_elimination_order(dnx.chimera_graph(2), window=0)
@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import pickle
 import unittest
 
 import networkx as nx
@@ -89,6 +90,49 @@ class TestChimeraGraph(unittest.TestCase):
         # 3 should be added as a singleton
         self.assertEqual(len(G[3]), 0)
 
+    def test_lazy_data(self):
+        for coordinates in (False, True):
+            G = dnx.chimera_graph(3, 2, 3, coordinates=coordinates)
+            H = dnx.chimera_graph(3, 2, 3, coordinates=coordinates, data='lazy')
+            self.assertEqual(H.graph['data'], 'lazy')
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+            self.assertEqual(dict(H.copy().nodes(data=True)), dict(G.nodes(data=True)))
+
+        H = dnx.chimera_graph(2, data='lazy')
+        self.assertEqual(H.nodes[9]['chimera_index'], (0, 1, 0, 1))
+        H.nodes[9]['weight'] = 2
+        self.assertEqual(H.nodes[9], {'chimera_index': (0, 1, 0, 1), 'weight': 2})
+        self.assertNotIn('weight', H.nodes[10])
+        pos = dnx.chimera_layout(dnx.chimera_graph(2))
+        for v, xy in dnx.chimera_layout(H).items():
+            np.testing.assert_array_equal(xy, pos[v])
+
+        # nodes outside of the lattice get no attributes, as with data=True
+        for node_list in ([0, 1, 1000, 'a'], [(0, 0, 0, 0), (0, 0, 2, 0), (2, 0, 0, 0), 5]):
+            coordinates = isinstance(node_list[0], tuple)
+            G = dnx.chimera_graph(2, node_list=node_list, coordinates=coordinates)
+            H = dnx.chimera_graph(2, node_list=node_list, coordinates=coordinates, data='lazy')
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+        self.assertEqual(dnx.chimera_graph(2, data='lazy', node_list=[0, 1, 1000]).nodes[1000], {})
+
+    def test_pickle(self):
+        for G in [dnx.chimera_graph(3, 2, 3), dnx.chimera_graph(2, coordinates=True, data=False)]:
+            G.remove_nodes_from(list(G)[::5])
+            G.remove_edges_from(list(G.edges)[::3])
+            s = pickle.dumps(G)
+            # the pickle does not hold every node and edge
+            self.assertLess(len(s), len(pickle.dumps(nx.Graph(G))) // 2)
+            H = pickle.loads(s)
+            self.assertEqual(set(H.nodes), set(G.nodes))
+            self.assertTrue(nx.utils.edges_equal(H.edges, G.edges))
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+            self.assertEqual(H.graph, G.graph)
+
+        # graphs with foreign edges are pickled as usual
+        G = dnx.chimera_graph(2)
+        G.add_edge(0, 1)
+        self.assertTrue(nx.utils.edges_equal(pickle.loads(pickle.dumps(G)).edges, G.edges))
+
     def test_float_robustness(self):
         G = dnx.chimera_graph(8 / 2)
 
@@ -370,6 +414,26 @@ class TestChimeraGraph(unittest.TestCase):
             edge_list = [(0, t), (0, t)]
             G = dnx.chimera_graph(m, edge_list=edge_list,
                                   check_edge_list=True)
+
+    def test_coordinate_neighbors(self):
+        for m, n, t in [(1, 1, 3), (2, 3, 4), (3, 2, 2)]:
+            coords = dnx.chimera_coordinates(m, n, t)
+            for coordinates, labels in [(False, 'int'), (True, 'coordinate')]:
+                G = dnx.chimera_graph(m, n, t, coordinates=coordinates)
+                nodes = list(G)
+                for v in nodes:
+                    self.assertEqual(set(coords.neighbors(v, labels=labels)), set(G[v]))
+
+                nbrs, degree = coords.neighbor_array(nodes, labels=labels)
+                self.assertEqual(nbrs.shape[:2], (len(G), t + 2))
+                for v, row, d in zip(nodes, nbrs, degree):
+                    self.assertEqual(d, G.degree(v))
+                    self.assertTrue((row[d:] == -1).all())
+                    if coordinates:
+                        self.assertEqual(set(map(tuple, row[:d])), set(G[v]))
+                    else:
+                        self.assertEqual(set(row[:d]), set(G[v]))
+
        
 class TestChimeraTorus(unittest.TestCase):
     def test(self):
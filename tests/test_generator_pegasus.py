@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import pickle
 import unittest
 import warnings
 
@@ -50,6 +51,58 @@ class TestPegasusGraph(unittest.TestCase):
             self.assertLessEqual(len(w), 13)
             self.assertGreaterEqual(len(w), 12)
 
+    def test_lazy_data(self):
+        for kwargs in [{}, {'coordinates': True}, {'nice_coordinates': True}, {'fabric_only': False}]:
+            G = dnx.pegasus_graph(3, **kwargs)
+            H = dnx.pegasus_graph(3, data='lazy', **kwargs)
+            self.assertEqual(H.graph['data'], 'lazy')
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+
+        # nodes outside of the lattice get no attributes, as with data=True
+        for kwargs, node_list in [({}, [0, 143, 144, -1]),
+                                  ({'coordinates': True}, [(0, 0, 4, 0), (0, 3, 0, 0), (0, 0, 12, 0)]),
+                                  ({'nice_coordinates': True}, [(2, 1, 1, 1, 3), (3, 0, 0, 0, 0)])]:
+            G = dnx.pegasus_graph(3, node_list=node_list, **kwargs)
+            H = dnx.pegasus_graph(3, node_list=node_list, data='lazy', **kwargs)
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+
+        H = dnx.pegasus_graph(3, node_list=[4, 40], edge_list=[], data='lazy')
+        self.assertEqual(H.nodes[40]['pegasus_index'], (0, 1, 8, 0))
+        del H.nodes[40]['pegasus_index']
+        self.assertEqual(len(H.nodes[40]), 0)
+        self.assertEqual(len(H.nodes[4]), 1)
+
+    def test_pickle(self):
+        for G in [dnx.pegasus_graph(4), dnx.pegasus_graph(4, fabric_only=False, coordinates=True),
+                  dnx.pegasus_graph(3, nice_coordinates=True, data='lazy')]:
+            G.remove_nodes_from(list(G)[::5])
+            G.remove_edges_from(list(G.edges)[::3])
+            s = pickle.dumps(G)
+            self.assertLess(len(s), len(pickle.dumps(nx.Graph(G))) // 2)
+            H = pickle.loads(s)
+            self.assertEqual(set(H.nodes), set(G.nodes))
+            self.assertTrue(nx.utils.edges_equal(H.edges, G.edges))
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+            self.assertEqual(H.graph, G.graph)
+
+        # copies and graphs built from node and edge lists, in any order, are
+        # pickled compactly, their nodes and edges in the generator's order
+        G = dnx.pegasus_graph(4)
+        node_list = list(G)[::-1][5:]
+        edge_list = [(v, u) for u, v in G.edges if u in node_list and v in node_list][::-2]
+        for H in [G.copy(), dnx.pegasus_graph(4, node_list=node_list, edge_list=edge_list)]:
+            s = pickle.dumps(H)
+            self.assertLess(len(s), len(pickle.dumps(nx.Graph(H))) // 2)
+            K = pickle.loads(s)
+            self.assertEqual(set(K.nodes), set(H.nodes))
+            self.assertTrue(nx.utils.edges_equal(K.edges, H.edges))
+            self.assertEqual(list(K), [v for v in G if v in H])
+
+        # graphs with modified attributes are pickled as usual
+        G = dnx.pegasus_graph(2)
+        G.nodes[10]['pegasus_index'] = None
+        self.assertEqual(pickle.loads(pickle.dumps(G)).nodes[10], {'pegasus_index': None})
+
 class TestPegasusTorus(unittest.TestCase):
     def test(self):
         for m in [4]:
@@ -402,6 +455,41 @@ class TestPegasusCoordinates(unittest.TestCase):
             G = dnx.pegasus_graph(m, edge_list=edge_list, fabric_only=False,
                                   check_edge_list=True)
 
+    def test_coordinate_neighbors(self):
+        for m in (2, 4):
+            for offsets_index, fabric_only in [(0, True), (5, True), (2, False)]:
+                coords = dnx.pegasus_coordinates(m, offsets_index=offsets_index, fabric_only=fabric_only)
+                for coordinates, labels in [(False, 'int'), (True, 'coordinate')]:
+                    G = dnx.pegasus_graph(m, offsets_index=offsets_index, fabric_only=fabric_only,
+                                          coordinates=coordinates)
+                    nodes = list(G)
+                    for v in nodes:
+                        self.assertEqual(set(coords.neighbors(v, labels=labels)), set(G[v]))
+
+                    nbrs, degree = coords.neighbor_array(nodes, labels=labels)
+                    self.assertEqual(nbrs.shape[:2], (len(G), 15))
+                    for v, row, d in zip(nodes, nbrs, degree):
+                        self.assertEqual(d, G.degree(v))
+                        self.assertTrue((row[d:] == -1).all())
+                        if coordinates:
+                            self.assertEqual(set(map(tuple, row[:d])), set(G[v]))
+                        else:
+                            self.assertEqual(set(row[:d]), set(G[v]))
+
+            G = dnx.pegasus_graph(m, nice_coordinates=True)
+            coords = dnx.pegasus_coordinates(m)
+            for v in G:
+                self.assertEqual(set(coords.neighbors(v, labels='nice')), set(G[v]))
+
+        # nodes outside of the fabric have no neighbors
+        G = dnx.pegasus_graph(3)
+        coords = dnx.pegasus_coordinates(3)
+        missing = [v for v in range(24*3*2) if v not in G]
+        self.assertTrue(missing)
+        nbrs, degree = coords.neighbor_array(missing)
+        self.assertTrue((degree == 0).all())
+        self.assertEqual(coords.neighbors(missing[0]), [])
+
 class TestTupleFragmentation(unittest.TestCase):
 
     def test_empty_list(self):
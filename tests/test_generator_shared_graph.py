@@ -0,0 +1,84 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import multiprocessing
+import pickle
+import unittest
+
+import networkx as nx
+import dwave_networkx as dnx
+
+
+def _summary(H):
+    return len(H), H.number_of_edges(), sorted(H[H.graph['rows']*10])
+
+
+class TestSharedGraph(unittest.TestCase):
+    def assertSameGraph(self, H, G):
+        self.assertEqual(set(H), set(G))
+        self.assertEqual(len(H), len(G))
+        self.assertEqual(set(map(frozenset, H.edges)), set(map(frozenset, G.edges)))
+        self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+        self.assertEqual(H.graph, G.graph)
+        for v in G:
+            self.assertEqual(set(H[v]), set(G[v]))
+
+    def test_families(self):
+        for G in [dnx.chimera_graph(2, 3, 2),
+                  dnx.chimera_graph(2, 3, 2, coordinates=True),
+                  dnx.pegasus_graph(3),
+                  dnx.pegasus_graph(3, coordinates=True, fabric_only=False),
+                  dnx.pegasus_graph(3, nice_coordinates=True),
+                  dnx.zephyr_graph(2, 2),
+                  dnx.zephyr_graph(2, 2, coordinates=True, data=False)]:
+            G.remove_nodes_from(list(G)[::7])
+            G.remove_edges_from(list(G.edges)[::5])
+            with dnx.share_graph(G) as shared:
+                H = shared.graph()
+                self.assertSameGraph(H, G)
+                self.assertSameGraph(pickle.loads(pickle.dumps(H)), G)
+                del H
+
+    def test_view(self):
+        G = dnx.chimera_graph(2)
+        with dnx.share_graph(G) as shared:
+            H = shared.graph()
+            self.assertTrue(nx.is_frozen(H))
+            with self.assertRaises(nx.NetworkXError):
+                H.add_edge(0, 1)
+            with self.assertRaises(TypeError):
+                H.nodes[0]['chimera_index'] = None
+            self.assertNotIn(32, H)
+            self.assertNotIn('a', H)
+            self.assertNotIn(1, H[0])
+            self.assertIn(4, H[0])
+            self.assertEqual(nx.shortest_path_length(H, 0, 31), nx.shortest_path_length(G, 0, 31))
+
+            K = nx.Graph(H)
+            K.add_edge(0, 1)
+            self.assertEqual(K.number_of_edges(), G.number_of_edges() + 1)
+
+    def test_pool(self):
+        G = dnx.zephyr_graph(2)
+        G.remove_nodes_from([0, 1, 2])
+        with dnx.share_graph(G) as shared:
+            with multiprocessing.Pool(2) as pool:
+                results = pool.map(_summary, [shared.graph()]*4)
+        self.assertEqual(results, [_summary(G)]*4)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            dnx.share_graph(nx.complete_graph(3))
+        with self.assertRaises(ValueError):
+            dnx.share_graph(nx.DiGraph(dnx.chimera_graph(1)))
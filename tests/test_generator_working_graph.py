@@ -0,0 +1,108 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import pickle
+import unittest
+
+import networkx as nx
+import dwave_networkx as dnx
+
+
+def _properties(family, shape, G):
+    return {'topology': {'type': family, 'shape': list(shape)},
+            'qubits': sorted(G),
+            'couplers': sorted(sorted(e) for e in G.edges)}
+
+
+def _broken(G, seed=0):
+    # remove a few nodes and edges, as in a typical working graph
+    G = G.copy()
+    nodes = sorted(G)
+    G.remove_nodes_from(nodes[seed::17])
+    G.remove_edges_from(sorted(G.edges)[seed::13])
+    return G
+
+
+class TestWorkingGraphFromProperties(unittest.TestCase):
+    def test_families(self):
+        for family, shape, generator in [
+                ('chimera', (3, 2, 4), dnx.chimera_graph),
+                ('pegasus', (4,), dnx.pegasus_graph),
+                ('zephyr', (2, 3), dnx.zephyr_graph)]:
+            P = generator(*shape)
+            for H in (P, _broken(P)):
+                props = _properties(family, shape, H)
+                G = dnx.working_graph_from_properties(props, cache=False)
+                expected = generator(*shape, node_list=props['qubits'],
+                                     edge_list=props['couplers'],
+                                     check_node_list=True, check_edge_list=True)
+                self.assertEqual(set(G.nodes), set(expected.nodes))
+                self.assertTrue(nx.utils.edges_equal(G.edges, expected.edges))
+                self.assertEqual(G.graph, expected.graph)
+                self.assertEqual(dict(G.nodes(data=True)), dict(expected.nodes(data=True)))
+
+    def test_cache(self):
+        H = _broken(dnx.pegasus_graph(3), seed=1)
+        props = _properties('pegasus', (3,), H)
+
+        G = dnx.working_graph_from_properties(props)
+        self.assertIs(dnx.working_graph_from_properties(dict(props)), G)
+        self.assertTrue(nx.is_frozen(G))
+        with self.assertRaises(nx.NetworkXError):
+            G.add_edge(0, 1)
+        self.assertFalse(nx.is_frozen(G.copy()))
+
+        # a different coupler list is a different working graph
+        props['couplers'] = props['couplers'][1:]
+        G2 = dnx.working_graph_from_properties(props)
+        self.assertIsNot(G2, G)
+        self.assertEqual(G2.number_of_edges(), G.number_of_edges() - 1)
+
+        self.assertIsNot(dnx.working_graph_from_properties(props, data=False), G2)
+        self.assertIsNot(dnx.working_graph_from_properties(props, cache=False), G2)
+
+    def test_pickle(self):
+        props = _properties('pegasus', (4,), _broken(dnx.pegasus_graph(4)))
+        for G in [dnx.working_graph_from_properties(props),
+                  dnx.working_graph_from_properties(props, cache=False)]:
+            s = pickle.dumps(G)
+            self.assertLess(len(s), len(pickle.dumps(nx.Graph(G))) // 2)
+            H = pickle.loads(s)
+            self.assertEqual(set(H.nodes), set(G.nodes))
+            self.assertTrue(nx.utils.edges_equal(H.edges, G.edges))
+            self.assertEqual(nx.is_frozen(H), nx.is_frozen(G))
+
+    def test_invalid(self):
+        props = _properties('chimera', (2, 2, 4), dnx.chimera_graph(2, 2, 4))
+
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties(dict(props, topology={'type': 'king', 'shape': [2]}))
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties({'qubits': [], 'couplers': []})
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties(dict(props, qubits=props['qubits'] + [32]), cache=False)
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties(dict(props, qubits=props['qubits'][1:]), cache=False)
+        with self.assertRaises(ValueError):
+            # 0 and 1 are both vertical qubits in the same tile
+            dnx.working_graph_from_properties(dict(props, couplers=[[0, 1]]), cache=False)
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties(dict(props, couplers=[[0, 4], [4, 0]]), cache=False)
+        with self.assertRaisesRegex(ValueError, "absent from qubits"):
+            dnx.working_graph_from_properties(dict(props, qubits=[]), cache=False)
+
+        # node 0 of pegasus_graph(2) is outside of the fabric
+        props = _properties('pegasus', (2,), dnx.pegasus_graph(2))
+        with self.assertRaises(ValueError):
+            dnx.working_graph_from_properties(dict(props, qubits=[0] + props['qubits']), cache=False)
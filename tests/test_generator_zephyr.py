@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import pickle
 import unittest
 
 import networkx as nx
@@ -51,6 +52,37 @@ class TestZephyrGraph(unittest.TestCase):
         self.assertEqual(len(G), 4)
         self.assertEqual(len(G.edges()), 2)
 
+    def test_lazy_data(self):
+        for coordinates in (False, True):
+            G = dnx.zephyr_graph(2, 3, coordinates=coordinates)
+            H = dnx.zephyr_graph(2, 3, coordinates=coordinates, data='lazy')
+            self.assertEqual(H.graph['data'], 'lazy')
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+
+        # nodes outside of the lattice get no attributes, as with data=True
+        for coordinates, node_list in [(False, [0, 119, 120]),
+                                       (True, [(1, 4, 2, 1, 1), (1, 5, 0, 0, 0), (0, 0, 3, 0, 0)])]:
+            G = dnx.zephyr_graph(2, 3, node_list=node_list, coordinates=coordinates)
+            H = dnx.zephyr_graph(2, 3, node_list=node_list, coordinates=coordinates, data='lazy')
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+
+        H = dnx.zephyr_graph(2, 3, data='lazy')
+        self.assertEqual(H.nodes(data='zephyr_index')[5], (0, 0, 1, 0, 1))
+        H = dnx.zephyr_coordinates(2, 3).graph_to_zephyr(H)
+        self.assertEqual(H.nodes[(0, 0, 1, 0, 1)], {'linear_index': 5})
+
+    def test_pickle(self):
+        for G in [dnx.zephyr_graph(2, 3), dnx.zephyr_graph(2, coordinates=True)]:
+            G.remove_nodes_from(list(G)[::5])
+            G.remove_edges_from(list(G.edges)[::3])
+            s = pickle.dumps(G)
+            self.assertLess(len(s), len(pickle.dumps(nx.Graph(G))) // 2)
+            H = pickle.loads(s)
+            self.assertEqual(set(H.nodes), set(G.nodes))
+            self.assertTrue(nx.utils.edges_equal(H.edges, G.edges))
+            self.assertEqual(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+            self.assertEqual(H.graph, G.graph)
+
     def test_float_robustness(self):
         G = dnx.zephyr_graph(8 / 2)
 
@@ -275,6 +307,25 @@ class TestZephyrGraph(unittest.TestCase):
                                   check_edge_list=True)
 
             
+    def test_coordinate_neighbors(self):
+        for m, t in [(1, 2), (2, 4), (3, 1)]:
+            coords = dnx.zephyr_coordinates(m, t)
+            for coordinates, labels in [(False, 'int'), (True, 'coordinate')]:
+                G = dnx.zephyr_graph(m, t, coordinates=coordinates)
+                nodes = list(G)
+                for v in nodes:
+                    self.assertEqual(set(coords.neighbors(v, labels=labels)), set(G[v]))
+
+                nbrs, degree = coords.neighbor_array(nodes, labels=labels)
+                self.assertEqual(nbrs.shape[:2], (len(G), 4*t + 4))
+                for v, row, d in zip(nodes, nbrs, degree):
+                    self.assertEqual(d, G.degree(v))
+                    self.assertTrue((row[d:] == -1).all())
+                    if coordinates:
+                        self.assertEqual(set(map(tuple, row[:d])), set(G[v]))
+                    else:
+                        self.assertEqual(set(row[:d]), set(G[v]))
+
 class TestZephyrTorus(unittest.TestCase):
     def test(self):
         for m in [2,3,4]:
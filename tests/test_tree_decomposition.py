@@ -0,0 +1,123 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import itertools
+import unittest
+
+import networkx as nx
+import dwave_networkx as dnx
+
+
+class TestTreeDecomposition(unittest.TestCase):
+    def check_decomposition(self, G, order, td):
+        self.assertEqual(td.nodes, list(order))
+        self.assertEqual(td.width, dnx.elimination_order_width(G, order))
+
+        bags = [set(td.bag(i)) for i in range(len(td))]
+
+        # every edge is in a bag
+        for u, v in G.edges:
+            self.assertTrue(any(u in bag and v in bag for bag in bags))
+
+        # parents come after their children, and share the separator
+        for i, p in enumerate(td.parent.tolist()):
+            self.assertEqual(set(td.eliminated(i)) | set(td.separator(i)), bags[i])
+            self.assertFalse(set(td.eliminated(i)) & set(td.separator(i)))
+            if p < 0:
+                self.assertEqual(td.separator(i), [])
+            else:
+                self.assertGreater(p, i)
+                self.assertEqual(set(td.separator(i)), bags[i] & bags[p])
+
+        # every node is eliminated exactly once, and the bags containing a
+        # node form a subtree
+        eliminated = [v for i in range(len(td)) for v in td.eliminated(i)]
+        self.assertEqual(sorted(map(order.index, eliminated)), list(range(len(G))))
+
+        T = td.to_networkx_graph()
+        self.assertEqual(len(T), len(td))
+        if len(T):
+            self.assertTrue(nx.is_forest(T))
+        for v in G:
+            self.assertTrue(nx.is_connected(T.subgraph(bag for bag in T if v in bag)))
+
+    def test_tree_decomposition(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(15, .25, seed=seed)
+            tw, order = dnx.min_fill_heuristic(G, seed=seed)
+
+            td = dnx.tree_decomposition(G, order)
+            self.assertEqual(len(td), len(G))
+            self.assertEqual(td.width, tw)
+            self.check_decomposition(G, order, td)
+
+    def test_junction_tree(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(15, .25, seed=seed)
+            tw, order = dnx.min_width_heuristic(G, seed=seed)
+
+            jt = dnx.junction_tree(G, order)
+            self.check_decomposition(G, order, jt)
+
+            # the bags are the maximal cliques of the triangulation of G
+            H = G.copy()
+            F = G.copy()
+            for v in order:
+                fill = list(itertools.combinations(F[v], 2))
+                H.add_edges_from(fill)
+                F.add_edges_from(fill)
+                F.remove_node(v)
+            bags = set(frozenset(jt.bag(i)) for i in range(len(jt)))
+            self.assertEqual(len(bags), len(jt))
+            self.assertEqual(bags, set(nx.chordal_graph_cliques(H)))
+
+    def test_chimera(self):
+        G = dnx.chimera_graph(2, 3, 4)
+        order = dnx.chimera_elimination_order(2, 3, 4)
+
+        jt = dnx.junction_tree(G, order)
+        self.assertEqual(jt.width, 8)
+        self.check_decomposition(G, order, jt)
+
+    def test_labels(self):
+        G = nx.relabel_nodes(nx.cycle_graph(5), 'abcde'.__getitem__)
+
+        td = dnx.tree_decomposition(G, 'abcde')
+        self.assertEqual(td.bag(0), ['a', 'b', 'e'])
+        self.check_decomposition(G, list('abcde'), td)
+
+        jt = dnx.junction_tree(G, 'abcde')
+        self.assertEqual([jt.bag(i) for i in range(len(jt))],
+                         [['a', 'b', 'e'], ['b', 'c', 'e'], ['c', 'd', 'e']])
+        self.assertEqual(jt.parent.tolist(), [1, 2, -1])
+
+    def test_empty(self):
+        td = dnx.tree_decomposition(nx.Graph(), [])
+        self.assertEqual(len(td), 0)
+        self.assertEqual(td.width, 0)
+        self.assertEqual(len(dnx.junction_tree(nx.Graph(), [])), 0)
+
+        G = nx.empty_graph(3)
+        jt = dnx.junction_tree(G, [2, 1, 0])
+        self.assertEqual([jt.bag(i) for i in range(len(jt))], [[2], [1], [0]])
+        self.assertEqual(jt.parent.tolist(), [-1, -1, -1])
+
+    def test_exceptions(self):
+        G = nx.path_graph(3)
+        with self.assertRaises(ValueError):
+            dnx.tree_decomposition(G, [0, 1])
+        with self.assertRaises(ValueError):
+            dnx.tree_decomposition(G, [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            dnx.tree_decomposition(G, [0, 1, 1])
@@ -16,6 +16,7 @@ import itertools
 import unittest
 
 import networkx as nx
+import numpy as np
 
 import dimod
 
@@ -134,6 +135,18 @@ class TestTSP(unittest.TestCase):
 
         self.assertEqual(cost, 4)
 
+    def test_skip_missing_edges(self):
+        # a 5-cycle with two chords, its only Hamiltonian cycle is the 5-cycle
+        G = nx.cycle_graph(5)
+        G.add_edges_from([(0, 2), (0, 3)])
+        nx.set_edge_attributes(G, 1, 'weight')
+
+        route = dnx.traveling_salesperson(G, dimod.ExactSolver(), start=0,
+                                          skip_missing_edges=True)
+
+        self.assertEqual(route[0], 0)
+        self.assertEqual(path_weight(G, route), 5)
+
 
 class TestTSPQUBO(unittest.TestCase):
     def test_empty(self):
@@ -363,3 +376,112 @@ class TestTSPQUBO(unittest.TestCase):
 
             self.assertEqual(len(bqm), n**2)
             self.assertEqual(len(bqm.quadratic), 2*n*n*(n - 1))
+
+
+class TestTSPBQM(unittest.TestCase):
+    def assertSameEnergies(self, bqm0, bqm1):
+        self.assertEqual(set(bqm0.variables), set(bqm1.variables))
+        samples = dimod.ExactSolver().sample(bqm0)
+        np.testing.assert_allclose(bqm1.energies(samples), samples.record.energy)
+
+    def test_empty(self):
+        bqm = dnx.traveling_salesperson_bqm(nx.Graph())
+        self.assertEqual(len(bqm), 0)
+
+    def test_qubo(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([('a', 'b', 0.5),
+                                   ('b', 'a', 0.8),
+                                   ('c', 'b', 0.7),
+                                   ('a', 'c', 2.0),
+                                   ('c', 'a', 2.0)])
+        G.add_edge('b', 'c')  # no weight
+
+        bqm = dnx.traveling_salesperson_bqm(G, lagrange=10, missing_edge_weight=1.5)
+        Q = dnx.traveling_salesperson_qubo(G, lagrange=10, missing_edge_weight=1.5)
+        self.assertIs(bqm.vartype, dimod.BINARY)
+        self.assertSameEnergies(bqm, dimod.BinaryQuadraticModel.from_qubo(Q))
+
+    def test_matrix(self):
+        D = [[0, 1, 4, 2],
+             [1, 0, 3, 5],
+             [4, 3, 0, 1],
+             [2, 5, 1, 0]]
+        G = nx.Graph()
+        G.add_weighted_edges_from((u, v, D[u][v]) for u, v in itertools.combinations(range(4), 2))
+
+        self.assertSameEnergies(dnx.traveling_salesperson_bqm(D),
+                                dnx.traveling_salesperson_bqm(G))
+
+    def test_route(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 1), (2, 3, 1),
+                                   (3, 0, 1), (0, 2, 2), (1, 3, 2)])
+
+        sampleset = dimod.ExactSolver().sample(dnx.traveling_salesperson_bqm(G, lagrange=10))
+        route = [None]*len(G)
+        for (city, time), val in sampleset.first.sample.items():
+            if val:
+                route[time] = city
+        self.assertEqual(path_weight(G, route), 4)
+
+    def test_reduced(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 2), (2, 3, 1), (3, 0, 3),
+                                   (1, 0, 2), (2, 0, 1), (0, 3, 4), (3, 1, 1)])
+
+        full = dnx.traveling_salesperson_bqm(G, lagrange=30)
+
+        for start, skip in [(0, False), (None, True), (0, True)]:
+            with self.subTest(start=start, skip_missing_edges=skip):
+                bqm = dnx.traveling_salesperson_bqm(G, lagrange=30, start=start,
+                                                    skip_missing_edges=skip)
+
+                # the routes have the same energies as in the full bqm
+                for perm in itertools.permutations(range(1, 4)):
+                    route = (0,) + perm
+                    sample = {v: 0 for v in full.variables}
+                    sample.update(((c, t), 1) for t, c in enumerate(route))
+                    self.assertAlmostEqual(
+                        bqm.energy({v: sample[v] for v in bqm.variables}),
+                        full.energy(sample))
+
+                # and the ground state is a minimum route
+                sample = dimod.ExactSolver().sample(bqm).first.sample
+                route = [None]*len(G)
+                if start is not None:
+                    route[0] = start
+                for (city, time), val in sample.items():
+                    if val:
+                        route[time] = city
+                self.assertEqual(sorted(route), list(G))
+                self.assertEqual(path_weight(G, route), 7)
+
+    def test_reduced_size(self):
+        G = nx.cycle_graph(6)
+        nx.set_edge_attributes(G, 1, 'weight')
+
+        bqm = dnx.traveling_salesperson_bqm(G, start=0)
+        self.assertEqual(len(bqm), 25)
+        self.assertNotIn((0, 0), bqm.variables)
+
+        bqm = dnx.traveling_salesperson_bqm(G, skip_missing_edges=True)
+        self.assertEqual(len(bqm), 36)
+        # the row and column constraints, and 2 directions of 6 edges at 6 times
+        self.assertEqual(len(bqm.quadratic), 2*6*15 + 2*6*6)
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            dnx.traveling_salesperson_bqm(nx.complete_graph(3), start=3)
+        with self.assertRaises(ValueError):
+            dnx.traveling_salesperson_bqm([[0, 1], [1, 0]])
+        with self.assertRaises(ValueError):
+            dnx.traveling_salesperson_bqm([[0, 1, 2], [1, 0, 3]])
+
+    def test_docstring_size(self):
+        for n in range(3, 20):
+            G = nx.complete_graph(n)
+            bqm = dnx.traveling_salesperson_bqm(G)
+
+            self.assertEqual(len(bqm), n**2)
+            self.assertEqual(len(bqm.quadratic), 2*n*n*(n - 1))
@@ -0,0 +1,93 @@
+# Copyright 2026 D-Wave Systems Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import dimod
+import dimod.testing
+import numpy as np
+import dwave_networkx as dnx
+
+
+class TestVariableEliminationSampler(unittest.TestCase):
+    def setUp(self):
+        self.sampler = dnx.VariableEliminationSampler()
+
+    def test_api(self):
+        dimod.testing.assert_sampler_api(self.sampler)
+
+    def test_ground_state(self):
+        for seed in range(10):
+            for vartype in [dimod.SPIN, dimod.BINARY]:
+                bqm = dimod.generators.gnp_random_bqm(10, .4, vartype, random_state=seed)
+                bqm.offset = 1.5
+
+                sampleset = self.sampler.sample(bqm)
+                dimod.testing.assert_sampleset_energies(sampleset, bqm)
+                self.assertEqual(len(sampleset), 1)
+                self.assertAlmostEqual(sampleset.first.energy,
+                                       dimod.ExactSolver().sample(bqm).first.energy)
+
+    def test_log_partition_function(self):
+        for seed in range(10):
+            for vartype in [dimod.SPIN, dimod.BINARY]:
+                bqm = dimod.generators.gnp_random_bqm(8, .5, vartype, random_state=seed)
+                bqm.offset = -2
+
+                energies = dimod.ExactSolver().sample(bqm).record.energy
+                for beta in [.1, 1, 3]:
+                    log_z = np.log(np.exp(-beta * energies).sum())
+                    self.assertAlmostEqual(self.sampler.log_partition_function(bqm, beta), log_z)
+
+    def test_elimination_order(self):
+        G = dnx.chimera_graph(2, 6, 4)
+        order = dnx.chimera_elimination_order(2, 6, 4)
+        bqm = dimod.generators.ran_r(1, G, seed=5)
+
+        sampleset = self.sampler.sample(bqm, elimination_order=order, max_width=8)
+        dimod.testing.assert_sampleset_energies(sampleset, bqm)
+
+        # a ground state is a local minimum
+        sample = sampleset.first.sample
+        for v in bqm.variables:
+            flipped = dict(sample)
+            flipped[v] = -sample[v]
+            self.assertGreaterEqual(bqm.energy(flipped), sampleset.first.energy)
+
+        with self.assertRaises(ValueError):
+            self.sampler.sample(bqm, elimination_order=order, max_width=7)
+        with self.assertRaises(ValueError):
+            self.sampler.sample(bqm, elimination_order=order[1:])
+
+    def test_empty(self):
+        sampleset = self.sampler.sample(dimod.BinaryQuadraticModel({}, {}, 1.5, 'SPIN'))
+        self.assertEqual(sampleset.first.energy, 1.5)
+        self.assertEqual(self.sampler.log_partition_function(dimod.BinaryQuadraticModel('BINARY')), 0)
+
+    def test_dnx_algorithms(self):
+        G = dnx.chimera_graph(2, 4, 4)
+
+        indep_set = dnx.maximum_independent_set(G, self.sampler)
+        self.assertTrue(dnx.is_independent_set(G, indep_set))
+        self.assertEqual(len(indep_set), len(G) // 2)
+
+        cover = dnx.min_vertex_cover(G, self.sampler)
+        self.assertTrue(dnx.is_vertex_cover(G, cover))
+        self.assertEqual(len(cover), len(G) // 2)
+
+        potentials = {('a', 'b'): {(0, 0): -1, (0, 1): .5, (1, 0): .5, (1, 1): 2},
+                      ('b', 'c'): {(0, 0): -9, (0, 1): 1.2, (1, 0): 7.2, (1, 1): 5}}
+        MN = dnx.markov_network(potentials)
+        samples = dnx.sample_markov_network(MN, self.sampler)
+        self.assertEqual(samples, [{'a': 0, 'b': 0, 'c': 0}])